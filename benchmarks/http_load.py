@@ -0,0 +1,95 @@
+"""Нагрузочный тест HTTP без зависимостей: N потоков с keep-alive соединениями опрашивают адреса API.
+
+    python benchmarks/http_load.py http://localhost:8000 /api/workers/ /api/workers/1/ -c 16 -d 20
+
+Печатает JSON: запросы в секунду, перцентили задержки и коды ответов.
+Сравнение "до/после": запустить против runserver и против gunicorn -c gunicorn.conf.py с одинаковыми данными.
+"""
+import argparse
+import http.client
+import json
+import statistics
+import threading
+import time
+from collections import Counter
+from itertools import cycle
+from typing import Dict, List
+from urllib.parse import urlsplit
+
+
+def worker(base: str, paths: List[str], deadline: float, latencies: List[float], codes: Counter, lock) -> None:
+    url = urlsplit(base)
+    connection_class = http.client.HTTPSConnection if url.scheme == 'https' else http.client.HTTPConnection
+    connection = connection_class(url.hostname, url.port, timeout=30)
+    local_latencies: List[float] = []
+    local_codes: Counter = Counter()
+    for path in cycle(paths):
+        if time.perf_counter() >= deadline:
+            break
+        started = time.perf_counter()
+        try:
+            connection.request('GET', path, headers={'Accept': 'application/json'})
+            response = connection.getresponse()
+            response.read()
+            local_codes[response.status] += 1
+            if response.getheader('Connection', '').lower() == 'close':
+                connection.close()
+        except (OSError, http.client.HTTPException):
+            local_codes['error'] += 1
+            connection.close()
+        local_latencies.append(time.perf_counter() - started)
+    connection.close()
+    with lock:
+        latencies.extend(local_latencies)
+        codes.update(local_codes)
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * fraction))] if values else 0.0
+
+
+def run(base: str, paths: List[str], concurrency: int, duration: float) -> Dict[str, object]:
+    latencies: List[float] = []
+    codes: Counter = Counter()
+    lock = threading.Lock()
+    started = time.perf_counter()
+    deadline = started + duration
+    threads = [
+        threading.Thread(target=worker, args=(base, paths, deadline, latencies, codes, lock))
+        for _ in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        'base': base,
+        'paths': paths,
+        'concurrency': concurrency,
+        'seconds': round(elapsed, 2),
+        'requests': len(latencies),
+        'rps': round(len(latencies) / elapsed, 1),
+        'latency_ms': {
+            'mean': round(statistics.fmean(latencies) * 1000, 2) if latencies else 0.0,
+            'p50': round(percentile(latencies, 0.50) * 1000, 2),
+            'p95': round(percentile(latencies, 0.95) * 1000, 2),
+            'p99': round(percentile(latencies, 0.99) * 1000, 2),
+        },
+        'codes': {str(code): count for code, count in codes.items()},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('base', help='Адрес сервера, например http://localhost:8000')
+    parser.add_argument('paths', nargs='+', help='Пути запросов, опрашиваются по кругу')
+    parser.add_argument('-c', '--concurrency', type=int, default=16)
+    parser.add_argument('-d', '--duration', type=float, default=20.0, help='Длительность, секунд')
+    args = parser.parse_args()
+    print(json.dumps(run(args.base, args.paths, args.concurrency, args.duration), ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
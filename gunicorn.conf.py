@@ -0,0 +1,44 @@
+"""Настройки gunicorn для продакшена; все значения переопределяются переменными окружения.
+
+WSGI:  gunicorn -c gunicorn.conf.py hr_system.wsgi:application
+ASGI:  GUNICORN_WORKER_CLASS=uvicorn_worker.UvicornWorker gunicorn -c gunicorn.conf.py hr_system.asgi:application
+"""
+import multiprocessing
+import os
+import shutil
+import tempfile
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+
+# Процессы x потоки = число одновременных запросов и, при CONN_MAX_AGE > 0, постоянных соединений
+# с PostgreSQL: следите, чтобы workers * threads (плюс реплики) укладывалось в max_connections.
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 60))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))
+
+# Перезапуск воркера после N запросов ограничивает рост памяти (импорт больших файлов); jitter
+# не даёт всем воркерам перезапуститься одновременно.
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 2000))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', 200))
+
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG', '-')
+errorlog = '-'
+
+# Метрики Prometheus (/metrics) собираются со всех воркеров через общий каталог; он очищается при старте.
+prometheus_multiproc_dir = os.environ.setdefault(
+    'PROMETHEUS_MULTIPROC_DIR', os.path.join(tempfile.gettempdir(), 'hr_system_metrics'),
+)
+
+
+def on_starting(server) -> None:
+    shutil.rmtree(prometheus_multiproc_dir, ignore_errors=True)
+    os.makedirs(prometheus_multiproc_dir, exist_ok=True)
+
+
+def child_exit(server, worker) -> None:
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
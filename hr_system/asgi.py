@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'hr_system.settings')
+# Под ASGI чтение списка и карточки работников обслуживают async-представления.
+os.environ.setdefault('WORKERS_ASYNC_READS', '1')
 
 application = get_asgi_application()
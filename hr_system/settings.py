@@ -22,12 +22,15 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 # See https://docs.djangoproject.com/en/4.2/howto/deployment/checklist/
 
 # SECURITY WARNING: keep the secret key used in production secret!
-SECRET_KEY = 'django-insecure-kgxqv28%e&u!%_a71#(sp@mg^wifd9q0d$n%1@)9gve#h)cxa&'
+SECRET_KEY = os.environ.get(
+    'DJANGO_SECRET_KEY', 'django-insecure-kgxqv28%e&u!%_a71#(sp@mg^wifd9q0d$n%1@)9gve#h)cxa&',
+)
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+# По умолчанию выключен; для разработки - DEBUG=1 в .env.
+DEBUG = bool(int(os.environ.get('DEBUG', 0)))
 
-ALLOWED_HOSTS = []
+ALLOWED_HOSTS = [host for host in os.environ.get('DJANGO_ALLOWED_HOSTS', 'localhost,127.0.0.1').split(',') if host]
 
 
 # Application definition
@@ -39,6 +42,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'django_filters',
 
     'rest_framework',
@@ -48,13 +52,17 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'workers.metrics.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'workers.routers.ReplicaRoutingMiddleware',
+    'workers.log.LogContextMiddleware',
 ]
 
 ROOT_URLCONF = 'hr_system.urls'
@@ -89,9 +97,33 @@ DATABASES = {
         'PASSWORD': os.environ.get('DB_PASSWORD'),
         'HOST': os.environ.get('DB_HOST'),
         'PORT': os.environ.get('DB_PORT'),
+        # Постоянные соединения: воркер переиспользует подключение между запросами вместо
+        # нового TCP/TLS-рукопожатия и аутентификации на каждый запрос; перед использованием
+        # соединение проверяется, так что обрыв со стороны PostgreSQL не превращается в 500.
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 60)),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
+# 1 - чтение списка и карточки работников через async-представления (включается в asgi.py).
+WORKERS_ASYNC_READS = bool(int(os.environ.get('WORKERS_ASYNC_READS', 0)))
+
+# Реплики PostgreSQL только для чтения: DB_REPLICA_HOSTS=host1,host2 (остальные параметры как у default).
+# GET-запросы API работников читают с реплик; в тестах реплики - зеркала default.
+DB_REPLICA_HOSTS = [host for host in os.environ.get('DB_REPLICA_HOSTS', '').split(',') if host]
+for replica_index, replica_host in enumerate(DB_REPLICA_HOSTS, start=1):
+    DATABASES[f'replica_{replica_index}'] = {
+        **DATABASES['default'],
+        'HOST': replica_host,
+        'TEST': {'MIRROR': 'default'},
+    }
+DATABASE_ROUTERS = ['workers.routers.WorkerReplicaRouter']
+WORKERS_READ_REPLICAS = [alias for alias in DATABASES if alias.startswith('replica_')]
+# 1 - все чтения с primary (например, при большой задержке репликации).
+WORKERS_READ_FROM_PRIMARY = bool(int(os.environ.get('WORKERS_READ_FROM_PRIMARY', 0)))
+# Сколько секунд после записи клиент читает с primary.
+WORKERS_PRIMARY_STICKY_SECONDS = int(os.environ.get('WORKERS_PRIMARY_STICKY_SECONDS', 10))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
@@ -127,7 +159,19 @@ USE_TZ = True
 # Static files (CSS, JavaScript, Images)
 # https://docs.djangoproject.com/en/4.2/howto/static-files/
 
+# Статику (админка, browsable API) под gunicorn отдаёт WhiteNoise из STATIC_ROOT. В образе collectstatic
+# пишет в /srv/static (Dockerfile): каталог вне /app, который docker-compose монтирует из репозитория.
 STATIC_URL = 'static/'
+STATIC_ROOT = os.environ.get('STATIC_ROOT', BASE_DIR / 'staticfiles')
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'whitenoise.storage.CompressedStaticFilesStorage'},
+}
+
+# Загруженные файлы (файлы фоновых импортов)
+
+MEDIA_URL = 'media/'
+MEDIA_ROOT = BASE_DIR / 'media'
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
@@ -142,7 +186,7 @@ REST_FRAMEWORK = {
     ],
         'DEFAULT_AUTHENTICATION_CLASSES': [
         'rest_framework.authentication.SessionAuthentication',  
-        'rest_framework.authentication.TokenAuthentication',  
+        'workers.authentication.CachedTokenAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticatedOrReadOnly',
@@ -152,9 +196,79 @@ REST_FRAMEWORK = {
 LOGIN_REDIRECT_URL = '/api/workers/'
 LOGOUT_REDIRECT_URL = '/api/workers/'
 
+# Логи пишутся через очередь: поток запроса не ждёт вывода, JSON форматируется в фоновом потоке.
+# LOG_FORMAT=text - обычные строки для локальной отладки.
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
-    'handlers': {'console': {'class': 'logging.StreamHandler'}},
-    'root': {'handlers': ['console'], 'level': 'INFO'},
+    'formatters': {
+        'json': {'()': 'workers.log.JSONFormatter'},
+        'text': {'format': '%(asctime)s %(levelname)s %(name)s %(message)s'},
+    },
+    'handlers': {
+        'queue': {
+            '()': 'workers.log.QueueLogHandler',
+            'formatter': os.environ.get('LOG_FORMAT', 'json'),
+            'maxsize': int(os.environ.get('LOG_QUEUE_SIZE', 10000)),
+        },
+    },
+    'root': {'handlers': ['queue'], 'level': os.environ.get('LOG_LEVEL', 'INFO')},
+}
+
+# Сколько id работников попадает в запись лога о массовой операции (остальные - только числом).
+WORKERS_LOG_SAMPLE_IDS = int(os.environ.get('WORKERS_LOG_SAMPLE_IDS', 10))
+
+# Размер пакета строк, которые импорт работников пишет одним bulk_create.
+WORKERS_IMPORT_BATCH_SIZE = int(os.environ.get('WORKERS_IMPORT_BATCH_SIZE', 1000))
+
+# Максимальное число элементов в одном запросе массового создания/изменения работников.
+WORKERS_BULK_MAX_ITEMS = int(os.environ.get('WORKERS_BULK_MAX_ITEMS', 1000))
+
+# Фоновые задачи импорта: число потоков пула и синхронный режим (для тестов и отладки).
+WORKERS_IMPORT_JOB_THREADS = int(os.environ.get('WORKERS_IMPORT_JOB_THREADS', 2))
+WORKERS_IMPORT_JOBS_EAGER = bool(int(os.environ.get('WORKERS_IMPORT_JOBS_EAGER', 0)))
+# Задача в очереди (pending) или в статусе running без прогресса дольше стольких секунд считается потерянной
+# (процесс перезапущен или убит) и при чтении статуса помечается failed.
+WORKERS_IMPORT_JOB_TIMEOUT = int(os.environ.get('WORKERS_IMPORT_JOB_TIMEOUT', 600))
+
+# Максимальный размер файла импорта: .xlsx разбирается openpyxl, .csv/.tsv читаются потоково.
+WORKERS_IMPORT_MAX_XLSX_SIZE = int(os.environ.get('WORKERS_IMPORT_MAX_XLSX_SIZE', 5 * 1024 * 1024))
+WORKERS_IMPORT_MAX_TEXT_SIZE = int(os.environ.get('WORKERS_IMPORT_MAX_TEXT_SIZE', 200 * 1024 * 1024))
+
+# Число процессов для валидации строк импорта; 1 - валидация в текущем процессе.
+WORKERS_IMPORT_PROCESSES = int(os.environ.get('WORKERS_IMPORT_PROCESSES', 1))
+
+# Лента изменений /api/workers/changes/: изменений на странице по умолчанию и максимум для ?limit=.
+WORKERS_CHANGES_PAGE_SIZE = int(os.environ.get('WORKERS_CHANGES_PAGE_SIZE', 100))
+WORKERS_CHANGES_MAX_PAGE_SIZE = int(os.environ.get('WORKERS_CHANGES_MAX_PAGE_SIZE', 1000))
+
+# Сколько строк выгрузка читает из серверного курсора за раз.
+WORKERS_EXPORT_CHUNK_SIZE = int(os.environ.get('WORKERS_EXPORT_CHUNK_SIZE', 2000))
+
+# Кэш чтений работников (WORKERS_CACHE_TTL секунд, 0 - без кэша). locmem живёт внутри процесса, поэтому на нём
+# кэш выключен: включите общий backend, например CACHE_BACKEND=django.core.cache.backends.redis.RedisCache.
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', 'hr-system'),
+    }
 }
+WORKERS_CACHE_ALIAS = os.environ.get('WORKERS_CACHE_ALIAS', 'default')
+WORKERS_CACHE_TTL = int(os.environ.get('WORKERS_CACHE_TTL', 60))
+
+# Токены API и пользователи сессий проверяются по кэшу WORKERS_AUTH_CACHE_ALIAS на WORKERS_AUTH_CACHE_TTL
+# секунд (0 - без кэша). Кэш работает только с общим для процессов backend (redis, memcached): на locmem
+# отозванный токен оставался бы действительным в других процессах gunicorn, поэтому там он выключен.
+WORKERS_AUTH_CACHE_ALIAS = os.environ.get('WORKERS_AUTH_CACHE_ALIAS', WORKERS_CACHE_ALIAS)
+WORKERS_AUTH_CACHE_TTL = int(os.environ.get('WORKERS_AUTH_CACHE_TTL', 60))
+# ModelBackend остаётся для сессий, созданных до CachedModelBackend (в сессии записан путь backend).
+AUTHENTICATION_BACKENDS = [
+    'workers.authentication.CachedModelBackend',
+    'django.contrib.auth.backends.ModelBackend',
+]
+
+# Хранилище сессий: по умолчанию база; SESSION_ENGINE=django.contrib.sessions.backends.cached_db
+# читает сессии из кэша (с записью в базу), ...backends.cache - только из кэша. Оба варианта - только
+# с общим CACHE_BACKEND: на locmem выход из сессии не дошёл бы до других процессов.
+SESSION_ENGINE = os.environ.get('SESSION_ENGINE', 'django.contrib.sessions.backends.db')
+SESSION_CACHE_ALIAS = os.environ.get('SESSION_CACHE_ALIAS', 'default')
@@ -1,5 +1,6 @@
 from django.contrib import admin
 from .models import Worker
+from .search import search_filter
 
 @admin.register(Worker)
 class WorkerAdmin(admin.ModelAdmin):
@@ -14,4 +15,11 @@ class WorkerAdmin(admin.ModelAdmin):
 
     search_fields = ('last_name', 'first_name', 'middle_name', 'email', 'position')
 
+    def get_search_results(self, request, queryset, search_term):
+        """Поиск тем же выражением, что и ?search= в API, чтобы использовать триграммные индексы."""
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+        return search_filter(queryset, search_term), False
+
     date_hierarchy = 'hired_date'
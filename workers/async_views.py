@@ -0,0 +1,134 @@
+"""Async-версии чтения списка и карточки работников для запуска под ASGI (WORKERS_ASYNC_READS=1).
+
+Простые GET-запросы обслуживаются в event loop: запросы к базе через async ORM (acount, aiterator, aget),
+кэш - через async API кэша, ответ - из строк values() через orjson (FastJSONRenderer). Всё остальное (запись, поиск,
+курсорная пагинация, browsable API, ошибки параметров) передаётся синхронным DRF-представлениям,
+поэтому ответы и коды ошибок совпадают.
+"""
+from typing import Any, Dict, List, Optional
+
+from asgiref.sync import sync_to_async
+from django.http import HttpRequest, HttpResponse, HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .conditional import list_etag, worker_etag, worker_last_modified
+from .models import Worker
+from .renderers import FastJSONRenderer
+from .serializers import WorkerListCreateSerializer, WorkerRetrieveSerializer
+from .services import WorkerService
+from .views import (
+    WorkerListCreateAPIView, WorkerPagination, WorkerRetrieveUpdateDestroyAPIView, workers_page_key,
+)
+
+LIST_PARAMS = frozenset({'page', 'page_size', 'is_active', 'position'})
+BOOLEAN_VALUES: Dict[str, bool] = {'true': True, 'false': False}
+
+_sync_list_view = WorkerListCreateAPIView.as_view()
+_sync_detail_view = WorkerRetrieveUpdateDestroyAPIView.as_view()
+_renderer = FastJSONRenderer()
+
+
+def _is_simple_get(request: HttpRequest) -> bool:
+    return request.method == 'GET' and 'text/html' not in request.headers.get('Accept', '')
+
+
+def _json_response(data: Any, etag: str, allow: str) -> HttpResponse:
+    response = HttpResponse(_renderer.render(data), content_type=_renderer.media_type)
+    response['ETag'] = etag
+    response['Vary'] = 'Accept'
+    response['Allow'] = allow
+    return response
+
+
+def _positive_int(value: Optional[str]) -> Optional[int]:
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return None
+    return number if number > 0 else None
+
+
+async def _delegate(view, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponseBase:
+    return await sync_to_async(view)(request, *args, **kwargs)
+
+
+async def worker_list(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponseBase:
+    """GET /api/workers/ с фильтрами is_active/position и постраничной пагинацией; остальное - синхронно."""
+    params = request.GET
+    if not _is_simple_get(request) or not set(params) <= LIST_PARAMS:
+        return await _delegate(_sync_list_view, request, *args, **kwargs)
+
+    pagination = WorkerPagination()
+    page_number = _positive_int(params.get('page', '1'))
+    page_size = pagination.page_size
+    if 'page_size' in params:
+        requested = _positive_int(params['page_size'])
+        page_size = min(requested, pagination.max_page_size) if requested else page_size
+    queryset = WorkerService.get_workers_for_read()
+    if 'is_active' in params:
+        if params['is_active'] not in BOOLEAN_VALUES:
+            return await _delegate(_sync_list_view, request, *args, **kwargs)
+        queryset = queryset.filter(is_active=BOOLEAN_VALUES[params['is_active']])
+    if params.get('position'):
+        queryset = queryset.filter(position=params['position'])
+    if page_number is None:
+        return await _delegate(_sync_list_view, request, *args, **kwargs)
+
+    async def load() -> Optional[Dict[str, Any]]:
+        count = await queryset.acount()
+        offset = (page_number - 1) * page_size
+        if offset and offset >= count:
+            return None
+        rows: List[Dict[str, Any]] = [row async for row in queryset[offset:offset + page_size].aiterator()]
+        url = request.build_absolute_uri()
+        next_link = replace_query_param(url, 'page', page_number + 1) if offset + page_size < count else None
+        if page_number == 1:
+            previous_link = None
+        elif page_number == 2:
+            previous_link = remove_query_param(url, 'page')
+        else:
+            previous_link = replace_query_param(url, 'page', page_number - 1)
+        results = WorkerListCreateSerializer.represent_rows(rows)
+        return {'count': count, 'next': next_link, 'previous': previous_link, 'results': results}
+
+    key = workers_page_key(request, WorkerPagination)
+    version, last_modified = await WorkerService.aget_workers_list_version()
+    etag = list_etag(version, key)
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        data = await WorkerService.aget_workers_page(key, load)
+        if data is None:
+            # Несуществующая страница: ответ об ошибке формирует DRF.
+            return await _delegate(_sync_list_view, request, *args, **kwargs)
+        response = _json_response(data, etag, 'GET, POST, HEAD, OPTIONS')
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified)
+    return response
+
+
+async def worker_detail(request: HttpRequest, pk: str, *args: Any, **kwargs: Any) -> HttpResponseBase:
+    """GET /api/workers/<pk>/ с ETag/Last-Modified; изменение и удаление - синхронно."""
+    pk_int = _positive_int(pk)
+    if not _is_simple_get(request) or request.GET or pk_int is None:
+        return await _delegate(_sync_detail_view, request, *args, pk=pk, **kwargs)
+    try:
+        worker = await WorkerService.aget_worker(pk_int)
+    except Worker.DoesNotExist:
+        return await _delegate(_sync_detail_view, request, *args, pk=pk, **kwargs)
+
+    etag, last_modified = worker_etag(worker), worker_last_modified(worker)
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = _json_response(WorkerRetrieveSerializer.represent(worker), etag, 'GET, PUT, PATCH, DELETE, HEAD, OPTIONS')
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    return response
+
+
+# Как и у DRF-представлений: CSRF проверяет аутентификация DRF в делегированных запросах.
+worker_list.csrf_exempt = True
+worker_detail.csrf_exempt = True
@@ -0,0 +1,189 @@
+"""Аутентификация API без запросов к базе в установившемся режиме.
+
+Токен (Authorization: Token ...) и пользователь сессии проверяются по кэшу WORKERS_AUTH_CACHE_ALIAS
+на WORKERS_AUTH_CACHE_TTL секунд. Кэш включается только на общем для процессов backend (не locmem):
+иначе удаление токена или увольнение пользователя сбросили бы запись только в одном процессе.
+Удаление или замена токена, изменение и удаление пользователя (в том числе увольнение is_active=False
+и смена пароля) сбрасывают записи сигналами (signals.py); TTL ограничивает устаревание, если запись
+изменили в обход моделей.
+
+В кэше нет ни ключа токена, ни хэша пароля: только id, имя, is_active пользователя и хэш сессии.
+"""
+import hashlib
+from typing import Any, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import BaseCache, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.exceptions import PermissionDenied
+from django.db import transaction
+from django.utils.functional import LazyObject
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+
+UserData = Dict[str, Any]
+
+
+class AuthCache:
+    """Кэш токенов (по хэшу ключа: id пользователя и дата создания) и данных пользователей по id."""
+
+    @staticmethod
+    def backend() -> BaseCache:
+        return caches[settings.WORKERS_AUTH_CACHE_ALIAS]
+
+    @classmethod
+    def enabled(cls) -> bool:
+        return settings.WORKERS_AUTH_CACHE_TTL > 0 and not isinstance(cls.backend(), LocMemCache)
+
+    @staticmethod
+    def token_key(key: str) -> str:
+        return f'auth:token:{hashlib.sha256(key.encode()).hexdigest()}'
+
+    @staticmethod
+    def user_key(user_id: Any) -> str:
+        return f'auth:user:{user_id}'
+
+    @staticmethod
+    def user_data(user: Any) -> UserData:
+        return {
+            'id': user.pk, 'username': user.get_username(), 'is_active': user.is_active,
+            'session_hash': user.get_session_auth_hash(),
+        }
+
+    @classmethod
+    def get_token(cls, key: str) -> Tuple[Optional[Dict[str, Any]], Optional[UserData]]:
+        """Закэшированные токен и его пользователь (None, если чего-то нет)."""
+        backend = cls.backend()
+        token = backend.get(cls.token_key(key))
+        if token is None:
+            return None, None
+        return token, backend.get(cls.user_key(token['user_id']))
+
+    @classmethod
+    def set_token(cls, token: Any) -> None:
+        """Закэшировать токен, загруженный с select_related('user'), вместе с пользователем."""
+        cls.backend().set_many({
+            cls.token_key(token.key): {'user_id': token.user_id, 'created': token.created},
+            cls.user_key(token.user_id): cls.user_data(token.user),
+        }, timeout=settings.WORKERS_AUTH_CACHE_TTL)
+
+    @classmethod
+    def get_user(cls, user_id: Any) -> Optional[UserData]:
+        return cls.backend().get(cls.user_key(user_id))
+
+    @classmethod
+    def set_user(cls, user: Any) -> None:
+        cls.backend().set(cls.user_key(user.pk), cls.user_data(user), timeout=settings.WORKERS_AUTH_CACHE_TTL)
+
+    @classmethod
+    def invalidate(cls, *keys: str) -> None:
+        """Удалить записи сейчас и ещё раз после фиксации транзакции, как WorkerCache.invalidate."""
+        if not cls.enabled():
+            return
+        backend = cls.backend()
+        backend.delete_many(keys)
+        transaction.on_commit(lambda: backend.delete_many(keys))
+
+    @classmethod
+    def invalidate_token(cls, key: str) -> None:
+        cls.invalidate(cls.token_key(key))
+
+    @classmethod
+    def invalidate_user(cls, user_id: Any) -> None:
+        cls.invalidate(cls.user_key(user_id))
+
+
+class CachedUser(LazyObject):
+    """Пользователь из AuthCache для request.user.
+
+    id, имя, is_active и хэш сессии отдаются из кэша без запроса; при обращении к любому другому
+    атрибуту (права, сохранение, isinstance) пользователь загружается из базы.
+    """
+    is_authenticated = True
+    is_anonymous = False
+
+    def __init__(self, data: UserData) -> None:
+        self.__dict__['_data'] = data
+        super().__init__()
+
+    def _setup(self) -> None:
+        self._wrapped = get_user_model()._default_manager.get(pk=self.__dict__['_data']['id'])
+
+    @property
+    def pk(self) -> Any:
+        return self.__dict__['_data']['id']
+
+    id = pk
+
+    @property
+    def username(self) -> str:
+        return self.__dict__['_data']['username']
+
+    @property
+    def is_active(self) -> bool:
+        return self.__dict__['_data']['is_active']
+
+    def get_username(self) -> str:
+        return self.username
+
+    def get_session_auth_hash(self) -> str:
+        return self.__dict__['_data']['session_hash']
+
+    def __bool__(self) -> bool:
+        return True
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """TokenAuthentication с проверкой токена по AuthCache: 0 запросов при попадании в кэш."""
+
+    def authenticate_credentials(self, key: str) -> Tuple[Any, Any]:
+        if not AuthCache.enabled():
+            return super().authenticate_credentials(key)
+        model = self.get_model()
+        cached_token, cached_user = AuthCache.get_token(key)
+        if cached_token is not None and cached_user is not None:
+            user = CachedUser(cached_user)
+            token = model(key=key, user_id=cached_token['user_id'], created=cached_token['created'])
+        else:
+            try:
+                token = model.objects.select_related('user').get(key=key)
+            except model.DoesNotExist:
+                raise exceptions.AuthenticationFailed(_('Invalid token.'))
+            AuthCache.set_token(token)
+            user = token.user
+
+        if not user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+
+        return (user, token)
+
+
+class CachedModelBackend(ModelBackend):
+    """ModelBackend, который проверяет пользователя сессии (request.user) по AuthCache.
+
+    В AUTHENTICATION_BACKENDS стоит перед ModelBackend: сессии, созданные до его появления,
+    хранят путь ModelBackend и продолжают работать без кэша до следующего входа.
+    """
+
+    def authenticate(self, request: Any, username: Optional[str] = None, password: Optional[str] = None, **kwargs: Any) -> Optional[Any]:
+        user = super().authenticate(request, username=username, password=password, **kwargs)
+        if user is None and password is not None:
+            # ModelBackend за нами проверил бы тот же пароль ещё раз: неверный вход стоил бы двух хэширований.
+            raise PermissionDenied
+        return user
+
+    def get_user(self, user_id: Any) -> Optional[Any]:
+        if not AuthCache.enabled():
+            return super().get_user(user_id)
+        data = AuthCache.get_user(user_id)
+        if data is not None:
+            user: Optional[Any] = CachedUser(data)
+        else:
+            user = super().get_user(user_id)
+            if user is not None:
+                AuthCache.set_user(user)
+        return user if user is not None and self.user_can_authenticate(user) else None
@@ -0,0 +1,142 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from .models import Worker, workers_by_email
+from .serializers import WorkerImportRowSerializer
+from .signals import workers_bulk_changed
+from .validators import import_row_validator, update_row_validator
+
+Result = Dict[str, Any]
+
+NOT_OBJECT_ERROR: Dict[str, List[str]] = {'non_field_errors': ['Ожидался объект с полями работника.']}
+
+
+def _failed(index: int, errors: Dict[str, Any]) -> Result:
+    return {'index': index, 'errors': errors}
+
+
+def _summary(results: List[Result], written_key: str, written: int) -> Dict[str, Any]:
+    return {
+        written_key: written,
+        'errors': sum(1 for result in results if 'errors' in result),
+        'results': results,
+    }
+
+
+def bulk_create_workers(items: Sequence[Any], created_by: Optional[Any]) -> Dict[str, Any]:
+    """Создать работников одним bulk_create в транзакции; невалидные элементы пропускаются.
+
+    Результат по каждому элементу: {'index', 'id'} или {'index', 'errors'}.
+    """
+    validator = import_row_validator()
+    results: List[Optional[Result]] = [None] * len(items)
+    pending: List[Tuple[int, str, Worker]] = []
+    seen: set[str] = set()
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            results[index] = _failed(index, NOT_OBJECT_ERROR)
+            continue
+        validated, errors = validator.validate(item)
+        if errors:
+            results[index] = _failed(index, errors)
+            continue
+        email = validated['email'].strip().lower()
+        if email in seen:
+            results[index] = _failed(index, {'email': ['Дубликат email в запросе']})
+            continue
+        seen.add(email)
+        worker = Worker(**WorkerImportRowSerializer.worker_kwargs(validated))
+        worker.created_by = created_by
+        pending.append((index, email, worker))
+
+    with transaction.atomic():
+        # Email в базе хранятся в исходном регистре: сравниваем без учёта регистра, как при валидации.
+        existing = set(workers_by_email(seen).values_list('email_lower', flat=True)) if seen else set()
+        to_create: List[Tuple[int, Worker]] = []
+        for index, email, worker in pending:
+            if email in existing:
+                results[index] = _failed(index, {'email': ['Email уже существует в базе']})
+            else:
+                to_create.append((index, worker))
+        created = Worker.objects.bulk_create([worker for _, worker in to_create])
+        if created:
+            # Журнал изменений и сводка пишутся в той же транзакции, что и работники.
+            workers_bulk_changed.send(sender=Worker, created=created, updated=[], source='bulk', by=created_by)
+
+    for index, worker in to_create:
+        results[index] = {'index': index, 'id': worker.pk}
+    return _summary(results, 'created', len(created))
+
+
+def bulk_update_workers(items: Sequence[Any]) -> Dict[str, Any]:
+    """Частично изменить работников по списку {id, поля...} одним bulk_update в транзакции.
+
+    Строки блокируются на время записи; элементы без изменений не пишутся.
+    Результат по каждому элементу: {'index', 'id', 'updated'} или {'index', 'errors'}.
+    """
+    validator = update_row_validator()
+    results: List[Optional[Result]] = [None] * len(items)
+    pending: Dict[int, Tuple[int, Dict[str, Any]]] = {}
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            results[index] = _failed(index, NOT_OBJECT_ERROR)
+            continue
+        pk = item.get('id')
+        if type(pk) is not int:
+            results[index] = _failed(index, {'id': ['Требуется целочисленный id работника.']})
+            continue
+        if pk in pending:
+            results[index] = _failed(index, {'id': ['Дубликат id в запросе']})
+            continue
+        validated, errors = validator.validate(item, partial=True)
+        if errors:
+            results[index] = _failed(index, errors)
+            continue
+        pending[pk] = (index, validated)
+
+    updated: List[Tuple[Worker, Dict[str, Any]]] = []
+    with transaction.atomic():
+        workers = Worker.objects.select_for_update().in_bulk(list(pending))
+        fields: set[str] = set()
+        for pk, (index, validated) in pending.items():
+            worker = workers.get(pk)
+            if worker is None:
+                results[index] = _failed(index, {'id': [f'Сотрудника с id={pk} не существует.']})
+                continue
+            previous = {
+                field: getattr(worker, field) for field, value in validated.items() if getattr(worker, field) != value
+            }
+            for field in previous:
+                setattr(worker, field, validated[field])
+            if previous:
+                fields.update(previous)
+                updated.append((worker, previous))
+            results[index] = {'index': index, 'id': pk, 'updated': bool(previous)}
+        if updated:
+            now = timezone.now()
+            for worker, _ in updated:
+                worker.updated_at = now
+            Worker.objects.bulk_update([worker for worker, _ in updated], [*sorted(fields), 'updated_at'])
+            workers_bulk_changed.send(sender=Worker, created=[], updated=updated, source='bulk')
+    return _summary(results, 'updated', len(updated))
+
+
+def deactivate_workers(queryset: QuerySet[Worker]) -> List[int]:
+    """Снять флаг is_active у активных работников из queryset одним UPDATE; вернуть их id."""
+    with transaction.atomic():
+        workers = list(queryset.filter(is_active=True).order_by('id').select_for_update())
+        if not workers:
+            return []
+        now = timezone.now()
+        Worker.objects.filter(id__in=[worker.pk for worker in workers]).update(is_active=False, updated_at=now)
+        for worker in workers:
+            worker.is_active = False
+            worker.updated_at = now
+        workers_bulk_changed.send(
+            sender=Worker, created=[], updated=[(worker, {'is_active': True}) for worker in workers],
+            source='deactivate',
+        )
+    return [worker.pk for worker in workers]
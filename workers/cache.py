@@ -0,0 +1,117 @@
+import time
+from typing import Any, Awaitable, Callable
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+
+from .metrics import observe_cache
+from .routers import pinned_to_primary, reads_from_replica
+
+_MISSING = object()
+
+
+class WorkerCache:
+    """Read-through кэш чтений работников.
+
+    Ключи содержат поколение кэша; любая запись работников меняет поколение, поэтому
+    после записи старые ключи больше не читаются и устаревшие данные не отдаются.
+    Кэш включается только на общем для процессов backend (не locmem): иначе новое поколение
+    увидел бы только процесс, выполнивший запись, а остальные отдавали бы старые страницы и 304.
+
+    С репликами: запрос, прилипший к primary после записи, читает мимо кэша (его могли заполнить с
+    отстающей реплики), а чтения с реплики не сохраняются в поколение моложе WORKERS_PRIMARY_STICKY_SECONDS -
+    реплика ещё может не содержать записи, которая это поколение создала.
+    """
+    GENERATION_KEY = 'workers:generation'
+
+    @staticmethod
+    def backend() -> BaseCache:
+        return caches[settings.WORKERS_CACHE_ALIAS]
+
+    @classmethod
+    def enabled(cls) -> bool:
+        return settings.WORKERS_CACHE_TTL > 0 and not isinstance(cls.backend(), LocMemCache)
+
+    @staticmethod
+    def new_generation() -> str:
+        """Поколение: время создания (для may_store) и случайная часть."""
+        return f'{int(time.time())}-{uuid4().hex}'
+
+    @staticmethod
+    def may_store(generation: str) -> bool:
+        """Можно ли сохранить только что прочитанное значение в поколение generation."""
+        if not reads_from_replica():
+            return True
+        created, _, _ = generation.partition('-')
+        return not created.isdigit() or time.time() - int(created) >= settings.WORKERS_PRIMARY_STICKY_SECONDS
+
+    @classmethod
+    def generation(cls) -> str:
+        backend = cls.backend()
+        generation = backend.get(cls.GENERATION_KEY)
+        if generation is None:
+            backend.add(cls.GENERATION_KEY, cls.new_generation(), timeout=None)
+            generation = backend.get(cls.GENERATION_KEY)
+        return generation
+
+    @classmethod
+    def get_or_set(cls, key: str, load: Callable[[], Any]) -> Any:
+        """Значение из кэша или результат load(), сохранённый на WORKERS_CACHE_TTL секунд.
+
+        None не кэшируется: им load() сообщает, что значения нет (например, несуществующая страница списка).
+        """
+        if not cls.enabled() or pinned_to_primary():
+            return load()
+        backend = cls.backend()
+        generation = cls.generation()
+        full_key = f'workers:{generation}:{key}'
+        value = backend.get(full_key, _MISSING)
+        observe_cache(value is not _MISSING)
+        if value is _MISSING:
+            value = load()
+            if value is not None and cls.may_store(generation):
+                backend.set(full_key, value, timeout=settings.WORKERS_CACHE_TTL)
+        return value
+
+    @classmethod
+    async def ageneration(cls) -> str:
+        backend = cls.backend()
+        generation = await backend.aget(cls.GENERATION_KEY)
+        if generation is None:
+            await backend.aadd(cls.GENERATION_KEY, cls.new_generation(), timeout=None)
+            generation = await backend.aget(cls.GENERATION_KEY)
+        return generation
+
+    @classmethod
+    async def aget_or_set(cls, key: str, load: Callable[[], Awaitable[Any]]) -> Any:
+        """Асинхронный get_or_set для async-представлений; ключи и поколения общие с синхронным."""
+        if not cls.enabled() or pinned_to_primary():
+            return await load()
+        backend = cls.backend()
+        generation = await cls.ageneration()
+        full_key = f'workers:{generation}:{key}'
+        value = await backend.aget(full_key, _MISSING)
+        observe_cache(value is not _MISSING)
+        if value is _MISSING:
+            value = await load()
+            if value is not None and cls.may_store(generation):
+                await backend.aset(full_key, value, timeout=settings.WORKERS_CACHE_TTL)
+        return value
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Сбросить кэш сейчас и ещё раз после фиксации транзакции.
+
+        Второй сброс нужен, чтобы чтение, попавшее между записью и COMMIT, не закэшировало старые данные.
+        """
+        if not cls.enabled():
+            return
+        cls._new_generation()
+        transaction.on_commit(cls._new_generation)
+
+    @classmethod
+    def _new_generation(cls) -> None:
+        cls.backend().set(cls.GENERATION_KEY, cls.new_generation(), timeout=None)
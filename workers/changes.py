@@ -0,0 +1,70 @@
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from django.db import connections, router, transaction
+from rest_framework.fields import DateTimeField
+
+from .models import Worker, WorkerChange
+from .serializers import WorkerRetrieveSerializer
+
+# Ключ транзакционной блокировки PostgreSQL, под которой пишется журнал изменений.
+CHANGES_LOCK_KEY: int = 0x776F726B  # 'work'
+
+ChangeEntry = Tuple[int, str, Optional[Sequence[str]]]
+
+_changed_at = DateTimeField()
+
+
+def record_changes(entries: Iterable[ChangeEntry]) -> None:
+    """Записать изменения (id работника, действие, поля) в журнал одним INSERT.
+
+    В PostgreSQL seq выдаётся при вставке, а видна строка после коммита: без блокировки транзакция
+    с меньшим seq может закоммититься позже, и клиент, уже прочитавший больший seq, её пропустит.
+    pg_advisory_xact_lock упорядочивает запись журнала по коммитам; держится до конца транзакции.
+    Вызывается внутри транзакции записи работников (Worker.save, массовые операции), чтобы изменение
+    не осталось без события журнала; savepoint=False - без лишнего SAVEPOINT на каждую запись.
+    """
+    changes = [
+        WorkerChange(worker_id=worker_id, action=action, fields=sorted(fields) if fields else None)
+        for worker_id, action, fields in entries
+    ]
+    if not changes:
+        return
+    using = router.db_for_write(WorkerChange)
+    with transaction.atomic(using=using, savepoint=False):
+        connection = connections[using]
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT pg_advisory_xact_lock(%s)', [CHANGES_LOCK_KEY])
+        WorkerChange.objects.using(using).bulk_create(changes)
+
+
+def changes_since(since: int, limit: int) -> Dict[str, Any]:
+    """Изменения с seq > since по возрастанию seq, не больше limit, с текущим состоянием работников.
+
+    worker - состояние на момент чтения (null, если работник уже удалён); cursor - since для следующего запроса.
+    """
+    rows = list(
+        WorkerChange.objects.filter(seq__gt=since).order_by('seq')
+        .values_list('seq', 'worker_id', 'action', 'fields', 'changed_at')[:limit + 1]
+    )
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    workers = current_workers({worker_id for _, worker_id, _, _, _ in rows})
+    changes: List[Dict[str, Any]] = [
+        {
+            'seq': seq, 'id': worker_id, 'action': action, 'fields': fields,
+            'changed_at': _changed_at.to_representation(at), 'worker': workers.get(worker_id),
+        }
+        for seq, worker_id, action, fields, at in rows
+    ]
+    return {'changes': changes, 'cursor': rows[-1][0] if rows else since, 'has_more': has_more}
+
+
+def current_workers(ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+    """Представления работников по id одним запросом values_list, как у карточки."""
+    ids = list(ids)
+    if not ids:
+        return {}
+    _, columns, _ = WorkerRetrieveSerializer.row_layout()
+    rows = Worker.objects.filter(id__in=ids).values_list(*columns)
+    return {item['id']: item for item in map(WorkerRetrieveSerializer.represent_row, rows)}
@@ -0,0 +1,67 @@
+import hashlib
+from datetime import datetime
+from typing import Optional, Tuple
+
+from django.db.models import QuerySet, Subquery
+from django.utils.cache import quote_etag
+from django.utils.http import parse_etags
+
+from .models import Worker, WorkerChange
+
+# Версия набора работников (seq последнего события журнала) и Last-Modified списка (Unix timestamp).
+ListVersion = Tuple[int, Optional[int]]
+
+
+def worker_etag(worker: Worker) -> str:
+    """ETag карточки работника: id и updated_at с точностью до микросекунд."""
+    return quote_etag(f'{worker.pk}-{int(worker.updated_at.timestamp() * 1_000_000)}')
+
+
+def worker_last_modified(worker: Worker) -> int:
+    """Last-Modified карточки работника (Unix timestamp)."""
+    return int(worker.updated_at.timestamp())
+
+
+def list_version() -> ListVersion:
+    """Версия списка работников одним запросом по индексам, без чтения страницы.
+
+    Любое создание, изменение и удаление пишет событие в журнал WorkerChange, поэтому его последний seq
+    меняется вместе с содержимым любой страницы. Last-Modified - Max('updated_at') работников, но не раньше
+    последнего события: удаление не оставляет updated_at.
+    """
+    return _list_version(_list_version_query().first())
+
+
+async def alist_version() -> ListVersion:
+    """Асинхронный list_version для async-представлений."""
+    return _list_version(await _list_version_query().afirst())
+
+
+def _list_version_query() -> QuerySet:
+    updated_at = Worker.objects.order_by('-updated_at').values('updated_at')[:1]
+    return (
+        WorkerChange.objects.order_by('-seq')
+        .annotate(updated_at=Subquery(updated_at))
+        .values_list('seq', 'changed_at', 'updated_at')
+    )
+
+
+def _list_version(row: Optional[Tuple[int, datetime, Optional[datetime]]]) -> ListVersion:
+    if row is None:
+        return 0, None
+    seq, *moments = row
+    return seq, int(max(moment for moment in moments if moment is not None).timestamp())
+
+
+def list_etag(version: int, key: str) -> str:
+    """ETag страницы списка: версия набора работников и нормализованный запрос (ключ кэша страницы)."""
+    return quote_etag(hashlib.md5(f'{version}|{key}'.encode(), usedforsecurity=False).hexdigest())
+
+
+def if_match_passes(request, etag: str) -> bool:
+    """Проверка If-Match со строгим сравнением; без заголовка проверка проходит."""
+    header = request.META.get('HTTP_IF_MATCH')
+    if not header:
+        return True
+    etags = parse_etags(header)
+    return '*' in etags or etag in etags
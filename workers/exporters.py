@@ -0,0 +1,79 @@
+import csv
+from datetime import datetime
+from itertools import islice
+from typing import IO, Any, Iterator, List, Tuple
+
+from django.conf import settings
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from openpyxl import Workbook
+
+from .models import Worker
+from .renderers import FastJSONRenderer
+from .serializers import WorkerRetrieveSerializer
+
+EXPORT_FIELDS: Tuple[str, ...] = (
+    'id', 'first_name', 'middle_name', 'last_name', 'email', 'position', 'is_active', 'hired_date', 'updated_at',
+    'created_by',
+)
+_COLUMNS: Tuple[str, ...] = tuple('created_by_id' if name == 'created_by' else name for name in EXPORT_FIELDS)
+
+
+def iter_export_rows(
+    queryset: QuerySet[Worker], columns: Tuple[str, ...] = _COLUMNS,
+) -> Iterator[List[Tuple[Any, ...]]]:
+    """Строки выгрузки пачками: серверный курсор, в памяти не больше WORKERS_EXPORT_CHUNK_SIZE строк."""
+    chunk_size: int = settings.WORKERS_EXPORT_CHUNK_SIZE
+    rows = queryset.order_by('id').values_list(*columns).iterator(chunk_size=chunk_size)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class _Echo:
+    """Псевдо-файл для csv.writer: возвращает строку вместо записи."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def iter_csv(queryset: QuerySet[Worker], delimiter: str = ',') -> Iterator[str]:
+    """CSV выгрузка; булевы значения - true/false, как их понимает импорт."""
+    writer = csv.writer(_Echo(), delimiter=delimiter)
+    yield writer.writerow(EXPORT_FIELDS)
+    for chunk in iter_export_rows(queryset):
+        yield ''.join(
+            writer.writerow([
+                ('true' if value else 'false') if isinstance(value, bool)
+                else '' if value is None
+                else value.isoformat() if hasattr(value, 'isoformat')
+                else value
+                for value in row
+            ])
+            for row in chunk
+        )
+
+
+def iter_ndjson(queryset: QuerySet[Worker]) -> Iterator[bytes]:
+    """NDJSON выгрузка: по объекту на строку, байт в байт как тело GET /api/workers/<pk>/."""
+    _, columns, _ = WorkerRetrieveSerializer.row_layout()
+    render = FastJSONRenderer().render
+    for chunk in iter_export_rows(queryset, columns):
+        yield b''.join(render(WorkerRetrieveSerializer.represent_row(row)) + b'\n' for row in chunk)
+
+
+def write_xlsx(queryset: QuerySet[Worker], file_obj: IO[bytes]) -> None:
+    """XLSX выгрузка в write-only режиме openpyxl: строки сразу уходят во временный файл листа."""
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('workers')
+    sheet.append(EXPORT_FIELDS)
+    for chunk in iter_export_rows(queryset):
+        for row in chunk:
+            sheet.append([
+                timezone.make_naive(value) if isinstance(value, datetime) and timezone.is_aware(value) else value
+                for value in row
+            ])
+    workbook.save(file_obj)
@@ -0,0 +1,15 @@
+from django.db.models import QuerySet
+
+from rest_framework.filters import BaseFilterBackend
+
+from .models import Worker
+from .services import WorkerService
+
+
+class WorkerSearchFilter(BaseFilterBackend):
+    """Поиск ?search= по ФИО, email и должности с ранжированием результатов."""
+    search_param: str = 'search'
+
+    def filter_queryset(self, request, queryset: QuerySet[Worker], view) -> QuerySet[Worker]:
+        query: str = request.query_params.get(self.search_param, '')
+        return WorkerService.search_workers(queryset, query)
@@ -0,0 +1,304 @@
+import codecs
+import csv
+import logging
+import multiprocessing
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+import django
+from django.conf import settings
+from django.db import DatabaseError, IntegrityError, transaction
+
+from .log import log_import_event
+from .metrics import observe_import
+from .models import Worker, workers_by_email
+from .serializers import WorkerImportRowSerializer
+from .signals import workers_bulk_changed
+from .validators import import_row_validator
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+Row = Sequence[Any]
+NumberedRow = Tuple[int, Row]
+ValidatedRow = Tuple[int, Dict[str, Any], str]
+ValidatedChunk = Tuple[int, List[Dict[str, Any]], List[ValidatedRow]]
+
+UPSERT_FIELDS: Tuple[str, ...] = ('first_name', 'middle_name', 'last_name', 'position', 'is_active')
+
+
+def chunked(iterable: Iterable[NumberedRow], size: int) -> Iterator[List[NumberedRow]]:
+    """Разбить поток строк на списки длиной не более size."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_text_lines(file_obj, encoding: str = 'utf-8-sig') -> Iterator[str]:
+    """Построчно декодировать загруженный файл, читая его по чанкам, а не целиком."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    tail = ''
+    for chunk in file_obj.chunks():
+        lines = (tail + decoder.decode(chunk)).split('\n')
+        tail = lines.pop()
+        for line in lines:
+            yield line + '\n'
+    tail += decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
+
+def iter_csv_rows(file_obj, delimiter: str = ',') -> Iterator[List[Optional[str]]]:
+    """Строки CSV/TSV файла; пустые ячейки - None, как у openpyxl."""
+    for row in csv.reader(iter_text_lines(file_obj), delimiter=delimiter):
+        yield [value if value != '' else None for value in row]
+
+
+def validate_chunk(headers: List[str], chunk: List[NumberedRow]) -> ValidatedChunk:
+    """Сопоставить ячейки заголовкам и провалидировать строки чанка; без обращений к базе.
+
+    Возвращает (число строк, ошибки валидации, валидные строки с нормализованным email).
+    """
+    validator = import_row_validator()
+    errors: List[Dict[str, Any]] = []
+    validated_rows: List[ValidatedRow] = []
+    for row_idx, row in chunk:
+        row_data: Dict[str, Any] = {}
+        for col_idx, value in enumerate(row):
+            if col_idx < len(headers) and headers[col_idx]:
+                row_data[headers[col_idx]] = value
+
+        validated, row_errors = validator.validate(row_data)
+        if row_errors:
+            errors.append({'row': row_idx, 'detail': row_errors})
+            continue
+        validated_rows.append((row_idx, validated, str(validated.get('email')).strip().lower()))
+    return len(chunk), errors, validated_rows
+
+
+class WorkerImporter:
+    """Пакетный импорт работников: валидация строк и запись чанками через bulk_create.
+
+    В режиме upsert строки с email из базы обновляют работника (bulk_update), а строки
+    без изменений пропускаются без записи.
+    При processes > 1 чанки валидируются в пуле процессов, а проверка дубликатов и запись
+    выполняются в текущем процессе в порядке строк файла.
+    """
+    CREATE = 'create'
+    UPSERT = 'upsert'
+    MODES = (CREATE, UPSERT)
+    required_fields = frozenset({'first_name', 'last_name', 'email', 'position'})
+
+    def __init__(
+        self,
+        created_by: Optional[Any],
+        batch_size: Optional[int] = None,
+        processes: Optional[int] = None,
+        mode: str = 'create',
+        progress: Optional[Callable[['WorkerImporter'], None]] = None,
+    ) -> None:
+        self.created_by = created_by
+        self.batch_size: int = batch_size or settings.WORKERS_IMPORT_BATCH_SIZE
+        self.processes: int = processes or settings.WORKERS_IMPORT_PROCESSES
+        self.progress = progress
+        self.mode: str = mode
+        self.added: int = 0
+        self.updated: int = 0
+        self.unchanged: int = 0
+        self.total: int = 0
+        self.errors: List[Dict[str, Any]] = []
+        self.upsert_fields: Tuple[str, ...] = UPSERT_FIELDS
+        self._seen_emails: Set[str] = set()
+
+    def run(self, rows: Iterable[Row]) -> Dict[str, Any]:
+        """Импортировать строки, первая строка - заголовки."""
+        started = time.perf_counter()
+        result = self._run(rows)
+        seconds = time.perf_counter() - started
+        observe_import(result, seconds)
+        log_import_event(result, seconds, self.created_by, mode=self.mode)
+        return result
+
+    def _run(self, rows: Iterable[Row]) -> Dict[str, Any]:
+        rows = iter(rows)
+        header = next(rows, None)
+        if header is None:
+            return self.result()
+
+        headers: List[str] = [str(h).strip() if h is not None else '' for h in header]
+        missing = self.required_fields - set(headers)
+        if missing:
+            self.errors.append({
+                'detail': f'Отсутствуют обязательные столбцы: {", ".join(sorted(missing))}'
+            })
+            return self.result()
+        # Upsert меняет только столбцы из файла: отсутствующие не сбрасываются в значения по умолчанию.
+        self.upsert_fields = tuple(field for field in UPSERT_FIELDS if field in headers)
+
+        chunks = chunked(enumerate(rows, start=2), self.batch_size)
+        for validated_chunk in self.validated_chunks(headers, chunks):
+            self.process_chunk(*validated_chunk)
+            if self.progress:
+                self.progress(self)
+        return self.result()
+
+    def result(self) -> Dict[str, Any]:
+        result: Dict[str, Any] = {
+            'added': self.added,
+            'errors': self.errors,
+            'total': self.total,
+        }
+        if self.mode == self.UPSERT:
+            result.update(created=self.added, updated=self.updated, unchanged=self.unchanged)
+        return result
+
+    def validated_chunks(self, headers: List[str], chunks: Iterable[List[NumberedRow]]) -> Iterator[ValidatedChunk]:
+        """Провалидированные чанки в исходном порядке."""
+        if self.processes <= 1:
+            for chunk in chunks:
+                yield validate_chunk(headers, chunk)
+            return
+
+        # spawn, а не fork: дочерние процессы не должны наследовать соединения с базой.
+        pool = ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=django.setup,
+        )
+        window: deque[Future] = deque()
+        try:
+            for chunk in chunks:
+                window.append(pool.submit(validate_chunk, headers, chunk))
+                if len(window) >= self.processes * 2:
+                    yield window.popleft().result()
+            while window:
+                yield window.popleft().result()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def process_chunk(self, size: int, errors: List[Dict[str, Any]], validated_rows: List[ValidatedRow]) -> None:
+        """Отсеять дубликаты провалидированного чанка и записать его одним bulk_create (и bulk_update)."""
+        self.total += size
+        chunk_errors: List[Dict[str, Any]] = list(errors)
+        to_create: List[Tuple[int, str, Worker]] = []
+        to_update: List[Tuple[int, str, Worker]] = []
+        unchanged = 0
+
+        existing = self.existing_workers(email for _, _, email in validated_rows)
+        previous: Dict[int, Dict[str, Any]] = {}
+        for row_idx, validated, email_value in validated_rows:
+            if email_value in self._seen_emails:
+                chunk_errors.append({'row': row_idx, 'detail': 'Дубликат email в файле'})
+                continue
+            kwargs = WorkerImportRowSerializer.worker_kwargs(validated)
+            worker = existing.get(email_value)
+            if worker is None:
+                worker = Worker(**kwargs)
+                worker.created_by = self.created_by
+                to_create.append((row_idx, email_value, worker))
+            elif self.mode != self.UPSERT:
+                chunk_errors.append({'row': row_idx, 'detail': 'Email уже существует в базе'})
+                continue
+            else:
+                changes = self.apply_changes(worker, kwargs)
+                if changes:
+                    previous[worker.pk] = changes
+                    to_update.append((row_idx, email_value, worker))
+                else:
+                    unchanged += 1
+            self._seen_emails.add(email_value)
+
+        # Журнал изменений и сводка пишутся в одной транзакции с работниками чанка.
+        with transaction.atomic():
+            created, create_errors = self._write(to_create, self._create)
+            updated, update_errors = self._write(to_update, self._update)
+            if created or updated:
+                workers_bulk_changed.send(
+                    sender=Worker, created=created, updated=[(worker, previous[worker.pk]) for worker in updated],
+                    source='import', by=self.created_by,
+                )
+        self.added += len(created)
+        self.updated += len(updated)
+        self.unchanged += unchanged
+        chunk_errors.extend(create_errors + update_errors)
+        chunk_errors.sort(key=lambda error: error['row'])
+        self.errors.extend(chunk_errors)
+
+        if validated_rows and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                'Import chunk: rows=%d-%d, added=%d, updated=%d, unchanged=%d, errors=%d',
+                validated_rows[0][0], validated_rows[-1][0], len(created), len(updated), unchanged, len(chunk_errors),
+                extra={
+                    'event': 'workers_import_chunk', 'rows': [validated_rows[0][0], validated_rows[-1][0]],
+                    'added': len(created), 'updated': len(updated), 'unchanged': unchanged,
+                    'errors': len(chunk_errors),
+                },
+            )
+
+    def existing_workers(self, emails: Iterable[str]) -> Dict[str, Worker]:
+        """Работники из базы по email чанка без учёта регистра: один запрос на чанк, ключ - email в нижнем регистре."""
+        candidates = set(emails)
+        if not candidates:
+            return {}
+        queryset = workers_by_email(candidates)
+        if self.mode != self.UPSERT:
+            queryset = queryset.only('email')
+        return {worker.email_lower: worker for worker in queryset}
+
+    def apply_changes(self, worker: Worker, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Перенести значения столбцов файла в работника; вернуть прежние значения изменённых полей."""
+        previous: Dict[str, Any] = {}
+        for field in self.upsert_fields:
+            if getattr(worker, field) != kwargs[field]:
+                previous[field] = getattr(worker, field)
+                setattr(worker, field, kwargs[field])
+        return previous
+
+    @staticmethod
+    def _create(workers: List[Worker]) -> None:
+        Worker.objects.bulk_create(workers)
+
+    def _update(self, workers: List[Worker]) -> None:
+        updated_at = Worker._meta.get_field('updated_at')
+        for worker in workers:
+            updated_at.pre_save(worker, add=False)
+        Worker.objects.bulk_update(workers, [*self.upsert_fields, 'updated_at'])
+
+    def _write(
+        self,
+        pending: List[Tuple[int, str, Worker]],
+        write: Callable[[List[Worker]], None],
+    ) -> Tuple[List[Worker], List[Dict[str, Any]]]:
+        """Записать строки одним запросом, при ошибке - построчно, чтобы указать виновную строку."""
+        if not pending:
+            return [], []
+        workers = [worker for _, _, worker in pending]
+        try:
+            with transaction.atomic():
+                write(workers)
+            return workers, []
+        except DatabaseError:
+            pass
+
+        written: List[Worker] = []
+        errors: List[Dict[str, Any]] = []
+        for row_idx, email_value, worker in pending:
+            try:
+                with transaction.atomic():
+                    write([worker])
+                written.append(worker)
+            except IntegrityError:
+                # Email успела записать параллельная операция.
+                self._seen_emails.discard(email_value)
+                errors.append({'row': row_idx, 'detail': 'Email уже существует в базе'})
+            except Exception:
+                # Текст ошибки базы пользователю не показываем: он остаётся в логе.
+                logger.warning('Import row %d failed', row_idx, exc_info=True)
+                self._seen_emails.discard(email_value)
+                errors.append({'row': row_idx, 'detail': 'Не удалось записать строку'})
+        return written, errors
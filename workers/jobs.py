@@ -0,0 +1,109 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from threading import Lock
+from typing import Optional
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .importers import WorkerImporter
+from .models import ImportJob
+from .services import WorkerService
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Пул потоков, в котором выполняются фоновые импорты этого процесса."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.WORKERS_IMPORT_JOB_THREADS,
+                thread_name_prefix='workers-import',
+            )
+        return _executor
+
+
+def submit_import_job(job: ImportJob) -> None:
+    """Поставить задачу импорта в очередь после фиксации транзакции."""
+    if settings.WORKERS_IMPORT_JOBS_EAGER:
+        run_import_job(job.pk)
+        return
+    transaction.on_commit(lambda: get_executor().submit(_run_in_thread, job.pk))
+
+
+def _run_in_thread(job_id) -> None:
+    try:
+        run_import_job(job_id)
+    finally:
+        connections.close_all()
+
+
+def run_import_job(job_id) -> None:
+    """Выполнить импорт из сохранённого файла, обновляя прогресс задачи после каждого пакета."""
+    # Задачу, которую уже пометили failed (простояла в очереди дольше таймаута), не запускаем.
+    if not ImportJob.objects.filter(pk=job_id, status=ImportJob.Status.PENDING).update(
+        status=ImportJob.Status.RUNNING, updated_at=timezone.now(),
+    ):
+        return
+    job = ImportJob.objects.select_related('created_by').get(pk=job_id)
+
+    def progress(importer: WorkerImporter) -> None:
+        ImportJob.objects.filter(pk=job.pk).update(
+            updated_at=timezone.now(),
+            processed=importer.total,
+            added=importer.added,
+            error_count=len(importer.errors),
+        )
+
+    try:
+        with job.file.open('rb') as file_obj:
+            result = WorkerService.import_workers(file_obj, job.created_by, mode=job.mode, progress=progress)
+    except Exception as exc:
+        logger.exception('Import job %s failed', job.pk)
+        job.status = ImportJob.Status.FAILED
+        job.result = {'detail': str(exc)}
+    else:
+        job.status = ImportJob.Status.DONE
+        job.processed = result['total']
+        job.added = result['added']
+        job.error_count = len(result['errors'])
+        job.result = result
+    job.finished_at = timezone.now()
+    job.file.delete(save=False)
+    job.save()
+
+
+def fail_stale_import_job(job: ImportJob) -> ImportJob:
+    """Пометить failed задачу, потерянную вместе с процессом, дольше WORKERS_IMPORT_JOB_TIMEOUT секунд.
+
+    Пул потоков и его очередь живут внутри процесса: после перезапуска (max_requests, graceful timeout)
+    или гибели процесса задача так и осталась бы pending (считаем от created_at) или running (от последнего
+    прогресса, updated_at).
+    """
+    if job.status not in (ImportJob.Status.PENDING, ImportJob.Status.RUNNING):
+        return job
+    now = timezone.now()
+    cutoff = now - timedelta(seconds=settings.WORKERS_IMPORT_JOB_TIMEOUT)
+    stale = ImportJob.objects.filter(pk=job.pk).filter(
+        Q(status=ImportJob.Status.PENDING, created_at__lt=cutoff)
+        | Q(status=ImportJob.Status.RUNNING, updated_at__lt=cutoff)
+    )
+    if stale.update(
+        status=ImportJob.Status.FAILED,
+        result={'detail': 'Задача прервана: импорт не отвечает, загрузите файл повторно.'},
+        finished_at=now,
+        updated_at=now,
+    ):
+        logger.warning('Import job %s timed out', job.pk)
+        job.refresh_from_db()
+        job.file.delete(save=False)
+        job.save(update_fields=['file'])
+    return job
@@ -0,0 +1,169 @@
+"""Неблокирующее структурированное логирование.
+
+Поток запроса только кладёт запись в очередь (QueueLogHandler); форматирование в JSON и запись в поток
+вывода выполняет фоновый QueueListener. Сообщения форматируются лениво (логгер получает шаблон и аргументы),
+при переполнении очереди записи отбрасываются и считаются, а не тормозят запрос.
+
+События жизненного цикла работников пишутся в логгер workers.events с полем event и данными в extra;
+массовые операции (bulk API, импорт) пишутся одной агрегированной записью с числом работников и выборкой id.
+"""
+import copy
+import json
+import logging
+import logging.handlers
+import queue
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpRequest
+
+events: logging.Logger = logging.getLogger('workers.events')
+
+# Атрибуты, которые есть у любой LogRecord: всё остальное пришло через extra и попадает в JSON.
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime', 'taskName'}
+
+_request: ContextVar[Optional[HttpRequest]] = ContextVar('workers_log_request', default=None)
+
+
+class JSONFormatter(logging.Formatter):
+    """Одна JSON-строка на запись: время (UTC), уровень, логгер, сообщение, поля extra и исключение."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data: Dict[str, Any] = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        data.update((key, value) for key, value in vars(record).items() if key not in _RECORD_ATTRS)
+        if record.exc_info:
+            data['exc_info'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            data['exc_info'] = record.exc_text
+        return json.dumps(data, ensure_ascii=False, cls=DjangoJSONEncoder, default=str)
+
+
+class QueueLogHandler(logging.handlers.QueueHandler):
+    """QueueHandler с собственным QueueListener и StreamHandler-получателем.
+
+    Форматтер из LOGGING передаётся получателю, поэтому форматирование идёт в фоновом потоке.
+    Очередь дописывается при logging.shutdown (выход процесса): он закрывает обработчики.
+    """
+
+    def __init__(self, stream: Any = None, maxsize: int = 10000) -> None:
+        super().__init__(queue.Queue(maxsize))
+        self.target = logging.StreamHandler(stream)
+        self.dropped = 0
+        self.listener = logging.handlers.QueueListener(self.queue, self.target, respect_handler_level=True)
+        self.running = False
+        self.start()
+
+    def start(self) -> None:
+        if not self.running:
+            self.listener.start()
+            self.running = True
+
+    def stop(self) -> None:
+        """Дописать очередь и остановить фоновый поток."""
+        if self.running:
+            self.listener.stop()
+            self.running = False
+
+    def setFormatter(self, fmt: Optional[logging.Formatter]) -> None:
+        self.target.setFormatter(fmt)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # В отличие от QueueHandler.prepare сообщение не форматируется здесь: очередь внутри процесса,
+        # запись дойдёт до получателя с исходными msg и args.
+        return copy.copy(record)
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self) -> None:
+        self.stop()
+        self.target.close()
+        super().close()
+
+
+class LogContextMiddleware:
+    """Запоминает текущий запрос для событий: кто (request.user после аутентификации DRF или сессии) и где."""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Any:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = _request.set(request)
+        try:
+            return self.get_response(request)
+        finally:
+            _request.reset(token)
+
+    async def __acall__(self, request: HttpRequest) -> Any:
+        token = _request.set(request)
+        try:
+            return await self.get_response(request)
+        finally:
+            _request.reset(token)
+
+
+def _context(by: Any = None) -> Dict[str, Any]:
+    request = _request.get()
+    user = by if by is not None else getattr(request, 'user', None)
+    context: Dict[str, Any] = {'by': user.username if user is not None and user.is_authenticated else 'system'}
+    if request is not None:
+        context.update(method=request.method, path=request.path)
+    return context
+
+
+def log_worker_event(event: str, worker: Any, by: Any = None, **fields: Any) -> None:
+    """Событие одного работника: worker_created, worker_updated, worker_deleted."""
+    if not events.isEnabledFor(logging.INFO):
+        return
+    events.info(
+        '%s: id=%s, name=%s %s', event, worker.pk, worker.last_name, worker.first_name,
+        extra={'event': event, 'worker_id': worker.pk, **_context(by), **fields},
+    )
+
+
+def log_bulk_event(event: str, ids: Iterable[Any], by: Any = None, **fields: Any) -> None:
+    """Агрегированное событие массовой операции: число работников и первые WORKERS_LOG_SAMPLE_IDS id."""
+    if not events.isEnabledFor(logging.INFO):
+        return
+    ids = list(ids)
+    sample: List[Any] = ids[:settings.WORKERS_LOG_SAMPLE_IDS]
+    events.info(
+        '%s: count=%d', event, len(ids),
+        extra={'event': event, 'count': len(ids), 'sample_ids': sample, **_context(by), **fields},
+    )
+
+
+def log_import_event(result: Dict[str, Any], seconds: float, by: Any = None, **fields: Any) -> None:
+    """Итог импорта одной записью: строки по результату, время и скорость."""
+    if not events.isEnabledFor(logging.INFO):
+        return
+    counts = {
+        'total': result['total'], 'added': result['added'], 'updated': result.get('updated', 0),
+        'unchanged': result.get('unchanged', 0), 'errors': len(result['errors']),
+    }
+    events.info(
+        'workers_imported: total=%d, added=%d, errors=%d, seconds=%.2f',
+        counts['total'], counts['added'], counts['errors'], seconds,
+        extra={
+            'event': 'workers_imported', **counts, 'seconds': round(seconds, 3),
+            'rows_per_sec': round(result['total'] / seconds, 1) if seconds > 0 else None, **_context(by), **fields,
+        },
+    )
@@ -0,0 +1,193 @@
+import datetime
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, router, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+
+from workers.models import Worker
+from workers.services import WorkerService
+from workers.synthetic import generate_workers, write_import_xlsx
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - нет на Windows
+    resource = None
+
+PAGE_SIZE = 50
+
+
+class Command(BaseCommand):
+    help = (
+        'Бенчмарк списка, карточки и импорта работников на текущей базе (наполните её seed_workers). '
+        'Результат - JSON: запросы/строки в секунду, p50/p99, пиковый RSS и число SQL-запросов.'
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('--requests', type=int, default=200, help='Запросов на каждый адрес API.')
+        parser.add_argument(
+            '--import-sizes', default='1000,10000,100000',
+            help='Размеры импорта через запятую; пусто - без бенчмарка импорта.',
+        )
+        parser.add_argument('--output', help='Записать JSON в файл (по умолчанию - в stdout).')
+        parser.add_argument('--compare', help='JSON прошлого запуска: в результат добавится изменение метрик.')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        using: str = router.db_for_read(Worker)
+        self.connection = connections[using]
+        try:
+            sizes = [int(size) for size in options['import_sizes'].split(',') if size.strip()]
+        except ValueError:
+            raise CommandError('--import-sizes: ожидаются целые числа через запятую.')
+        if not Worker.objects.exists():
+            raise CommandError('В базе нет работников: сначала запустите seed_workers.')
+
+        results: List[Dict[str, Any]] = []
+        with override_settings(WORKERS_CACHE_TTL=0, ALLOWED_HOSTS=['*']):
+            for name, paths in self.http_cases():
+                results.append(self.bench_http(name, paths, options['requests']))
+            for size in sorted(sizes):
+                results.append(self.bench_import(size))
+
+        report: Dict[str, Any] = {'meta': self.meta(using), 'results': results}
+        if options['compare']:
+            with open(options['compare'], encoding='utf-8') as file_obj:
+                report['compare'] = self.compare(json.load(file_obj)['results'], results)
+        data = json.dumps(report, ensure_ascii=False, indent=2)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as file_obj:
+                file_obj.write(data + '\n')
+            self.stdout.write(self.style.SUCCESS(f'Результаты: {options["output"]}'))
+        else:
+            self.stdout.write(data)
+
+    def http_cases(self) -> List[tuple]:
+        """Первая и последняя страницы, середина списка, фильтры, keyset-пагинация и карточки."""
+        list_url: str = reverse('workers')
+        total = Worker.objects.count()
+        last_page = max(1, -(-total // PAGE_SIZE))
+        position = Worker.objects.values_list('position', flat=True).order_by('id').first()
+        pks = list(Worker.objects.order_by('?').values_list('id', flat=True)[:100])
+        return [
+            ('list_first_page', [f'{list_url}?page_size={PAGE_SIZE}']),
+            ('list_middle_page', [f'{list_url}?page_size={PAGE_SIZE}&page={(last_page + 1) // 2}']),
+            ('list_last_page', [f'{list_url}?page_size={PAGE_SIZE}&page={last_page}']),
+            ('list_inactive', [f'{list_url}?page_size={PAGE_SIZE}&is_active=false']),
+            ('list_position_active', [f'{list_url}?page_size={PAGE_SIZE}&position={position}&is_active=true']),
+            ('list_cursor', [f'{list_url}?page_size={PAGE_SIZE}&pagination=cursor']),
+            ('detail', [reverse('worker_id', args=[pk]) for pk in pks]),
+        ]
+
+    def bench_http(self, name: str, paths: List[str], requests: int) -> Dict[str, Any]:
+        client = Client()
+        for path in paths[:5]:
+            client.get(path)
+        latencies: List[float] = []
+        queries = 0
+        started = time.perf_counter()
+        for number in range(requests):
+            path = paths[number % len(paths)]
+            with CaptureQueriesContext(self.connection) as captured:
+                request_started = time.perf_counter()
+                response = client.get(path, HTTP_ACCEPT='application/json')
+                latencies.append(time.perf_counter() - request_started)
+            if response.status_code != 200:
+                raise CommandError(f'GET {path}: {response.status_code}')
+            queries += len(captured)
+        elapsed = time.perf_counter() - started
+        result = {
+            'name': name, 'path': paths[0], 'requests': requests,
+            'requests_per_sec': round(requests / elapsed, 1),
+            **self.latency(latencies),
+            'queries_per_request': round(queries / requests, 2),
+            'peak_rss_kb': self.peak_rss_kb(),
+        }
+        self.stderr.write(f'{name}: {result["requests_per_sec"]} req/s, p50 {result["p50_ms"]} ms')
+        return result
+
+    def bench_import(self, size: int) -> Dict[str, Any]:
+        """Импорт size строк из .xlsx; запись откатывается, файл генерируется вне замера."""
+        with tempfile.TemporaryFile() as file_obj:
+            write_import_xlsx(generate_workers(size, seed=size, email_prefix=f'bench{size}.'), file_obj)
+            file_obj.seek(0)
+            with transaction.atomic(using=self.connection.alias):
+                with CaptureQueriesContext(self.connection) as captured:
+                    elapsed, result = self.timed(lambda: WorkerService.import_workers_from_excel(file_obj, None))
+                transaction.set_rollback(True, using=self.connection.alias)
+        if result['added'] != size:
+            raise CommandError(f'Импорт {size} строк: добавлено {result["added"]}, ошибок {len(result["errors"])}.')
+        report = {
+            'name': f'import_xlsx_{size}', 'rows': size,
+            'rows_per_sec': round(size / elapsed, 1),
+            'seconds': round(elapsed, 3),
+            'queries': len(captured),
+            'peak_rss_kb': self.peak_rss_kb(),
+        }
+        self.stderr.write(f'{report["name"]}: {report["rows_per_sec"]} rows/s')
+        return report
+
+    @staticmethod
+    def timed(run: Callable[[], Any]) -> tuple:
+        started = time.perf_counter()
+        result = run()
+        return time.perf_counter() - started, result
+
+    @staticmethod
+    def latency(latencies: List[float]) -> Dict[str, float]:
+        if len(latencies) < 2:
+            p50 = p99 = latencies[0] if latencies else 0.0
+        else:
+            percentiles = statistics.quantiles(latencies, n=100, method='inclusive')
+            p50, p99 = percentiles[49], percentiles[98]
+        return {'p50_ms': round(p50 * 1000, 2), 'p99_ms': round(p99 * 1000, 2)}
+
+    @staticmethod
+    def peak_rss_kb() -> Optional[int]:
+        """Пиковый RSS процесса с момента запуска (не по отдельному бенчмарку): рост виден по порядку замеров."""
+        if resource is None:
+            return None
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak // 1024 if sys.platform == 'darwin' else peak
+
+    def meta(self, using: str) -> Dict[str, Any]:
+        try:
+            commit: Optional[str] = subprocess.run(
+                ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            commit = None
+        return {
+            'commit': commit,
+            'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': self.connection.vendor,
+            'database_alias': using,
+            'workers': Worker.objects.count(),
+        }
+
+    @staticmethod
+    def compare(baseline: List[Dict[str, Any]], results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Изменение метрик относительно прошлого запуска, в процентах (для времени меньше - лучше)."""
+        previous = {result['name']: result for result in baseline}
+        changes: List[Dict[str, Any]] = []
+        for result in results:
+            old = previous.get(result['name'])
+            if old is None:
+                continue
+            change: Dict[str, Any] = {'name': result['name']}
+            for metric in ('requests_per_sec', 'rows_per_sec', 'p50_ms', 'p99_ms', 'queries_per_request', 'queries'):
+                if old.get(metric) and result.get(metric) is not None:
+                    change[metric] = round((result[metric] - old[metric]) / old[metric] * 100, 1)
+            changes.append(change)
+        return changes
@@ -0,0 +1,104 @@
+from typing import Any, List, Tuple
+from urllib.parse import urlencode, urlsplit
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, router
+from django.db.models import Count, QuerySet
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import resolve, reverse
+
+from rest_framework.test import APIRequestFactory
+
+from workers.models import Worker
+
+
+class Command(BaseCommand):
+    help = 'Показать планы выполнения (EXPLAIN) SQL-запросов, которые выполняют эндпоинты работников и фильтры админки.'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            'paths', nargs='*',
+            help='Адреса GET-запросов API, например "/api/workers/?is_active=false"; по умолчанию - типовые запросы.',
+        )
+        parser.add_argument(
+            '--analyze', action='store_true',
+            help='EXPLAIN ANALYZE: запросы выполняются, в план попадает фактическое время (PostgreSQL).',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        using: str = router.db_for_read(Worker)
+        connection = connections[using]
+        explain_options = {'analyze': True} if options['analyze'] else {}
+        try:
+            prefix: str = connection.ops.explain_query_prefix(**explain_options)
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        paths: List[str] = options['paths'] or self.default_paths(using)
+        for path in paths:
+            self.stdout.write(self.style.MIGRATE_HEADING(f'GET {path}'))
+            with CaptureQueriesContext(connection) as queries:
+                self.request(path)
+            for query in queries.captured_queries:
+                if not query['sql'].lstrip().upper().startswith('SELECT'):
+                    continue
+                self.write_plan(query['sql'], self.explain(connection, prefix, query['sql']))
+
+        for title, queryset in self.admin_querysets(using):
+            self.stdout.write(self.style.MIGRATE_HEADING(f'admin: {title}'))
+            self.write_plan(str(queryset.query), queryset.explain(**explain_options))
+
+    @staticmethod
+    def default_paths(using: str) -> List[str]:
+        """Типовые запросы списка и карточки: без фильтров, по активности, по должности, поиск, курсор."""
+        list_url: str = reverse('workers')
+        paths = [
+            list_url,
+            f'{list_url}?is_active=true',
+            f'{list_url}?is_active=false',
+            f'{list_url}?pagination=cursor&is_active=true',
+        ]
+        workers = Worker.objects.using(using)
+        top = workers.values('position').annotate(total=Count('id')).order_by('-total').first()
+        if top:
+            paths.append(f'{list_url}?{urlencode({"position": top["position"], "is_active": "true"})}')
+        sample = workers.order_by('id').only('id', 'last_name').first()
+        if sample:
+            paths.append(f'{list_url}?{urlencode({"search": sample.last_name[:4]})}')
+            paths.append(reverse('worker_id', args=[sample.pk]))
+        return paths
+
+    @staticmethod
+    def admin_querysets(using: str) -> List[Tuple[str, QuerySet[Worker]]]:
+        """Запросы list_filter/date_hierarchy админки."""
+        workers = Worker.objects.using(using)
+        sample = workers.exclude(created_by=None).order_by('id').only('created_by_id', 'hired_date').first()
+        if sample is None:
+            return []
+        return [
+            ('created_by', workers.filter(created_by_id=sample.created_by_id).order_by('-id')[:100]),
+            ('hired_date', workers.filter(hired_date=sample.hired_date).order_by('-id')[:100]),
+        ]
+
+    @staticmethod
+    def request(path: str) -> None:
+        """Выполнить GET через представление без HTTP-сервера, кэша и проверки хоста."""
+        match = resolve(urlsplit(path).path)
+        with override_settings(WORKERS_CACHE_TTL=0, ALLOWED_HOSTS=['*']):
+            response = match.func(APIRequestFactory().get(path), *match.args, **match.kwargs)
+            if hasattr(response, 'render'):
+                response.render()
+        if response.status_code >= 400:
+            raise CommandError(f'GET {path}: {response.status_code}')
+
+    @staticmethod
+    def explain(connection, prefix: str, sql: str) -> str:
+        with connection.cursor() as cursor:
+            cursor.execute(f'{prefix} {sql}')
+            return '\n'.join(' '.join(str(value) for value in row) for row in cursor.fetchall())
+
+    def write_plan(self, sql: str, plan: str) -> None:
+        self.stdout.write(self.style.SQL_KEYWORD(sql))
+        self.stdout.write(plan)
+        self.stdout.write('')
+
@@ -0,0 +1,15 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from workers.cache import WorkerCache
+from workers.stats import rebuild_worker_stats
+
+
+class Command(BaseCommand):
+    help = 'Пересчитать сводку WorkerStat агрегатом по работникам (после записи в обход моделей и сигналов).'
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        rows = rebuild_worker_stats()
+        WorkerCache.invalidate()
+        self.stdout.write(self.style.SUCCESS(f'Сводка пересчитана: {rows} строк.'))
@@ -0,0 +1,72 @@
+from itertools import islice
+from typing import Any, List
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError, transaction
+
+from workers.models import Worker
+from workers.signals import workers_bulk_changed
+from workers.synthetic import generate_workers, hire_dates, write_import_csv, write_import_xlsx
+
+
+class Command(BaseCommand):
+    help = (
+        'Сгенерировать N реалистичных работников (ФИО, должности с весами, 10% уволенных, приём за 5 лет) '
+        'и/или файлы импорта .xlsx/.csv с теми же строками.'
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('count', type=int, help='Число работников.')
+        parser.add_argument('--seed', type=int, default=0, help='Зерно генератора: одинаковый seed - одинаковые данные.')
+        parser.add_argument('--email-prefix', default='', help='Префикс email, чтобы повторный запуск не пересекался.')
+        parser.add_argument('--batch-size', type=int, default=5000, help='Работников в одном INSERT.')
+        parser.add_argument('--xlsx', help='Записать файл импорта .xlsx.')
+        parser.add_argument('--csv', help='Записать файл импорта .csv (.tsv - с табуляцией).')
+        parser.add_argument('--no-db', action='store_true', help='Только файлы, без записи в базу.')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        count: int = options['count']
+        if count <= 0:
+            raise CommandError('Число работников должно быть положительным.')
+
+        def workers():
+            return generate_workers(count, seed=options['seed'], email_prefix=options['email_prefix'])
+
+        if options['xlsx']:
+            with open(options['xlsx'], 'wb') as file_obj:
+                write_import_xlsx(workers(), file_obj)
+            self.stdout.write(f'Файл импорта: {options["xlsx"]}')
+        if options['csv']:
+            delimiter = '\t' if options['csv'].lower().endswith('.tsv') else ','
+            with open(options['csv'], 'w', encoding='utf-8', newline='') as file_obj:
+                write_import_csv(workers(), file_obj, delimiter=delimiter)
+            self.stdout.write(f'Файл импорта: {options["csv"]}')
+        if options['no_db']:
+            return
+
+        created = self.seed(workers(), options['seed'], count, options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Создано работников: {created}.'))
+
+    @staticmethod
+    def seed(rows, seed: int, count: int, batch_size: int) -> int:
+        """bulk_create пачками; даты приёма проставляются bulk_update (auto_now_add перезаписывает их при вставке).
+
+        Каждая пачка передаётся в workers_bulk_changed: сводка, журнал изменений и кэш обновляются как при импорте.
+        """
+        dates = hire_dates(count, seed=seed)
+        created = 0
+        try:
+            with transaction.atomic():
+                while True:
+                    batch: List[Worker] = [Worker(**row) for row in islice(rows, batch_size)]
+                    if not batch:
+                        break
+                    Worker.objects.bulk_create(batch)
+                    for worker, hired_date in zip(batch, dates):
+                        worker.hired_date = hired_date
+                    Worker.objects.bulk_update(batch, ['hired_date'], batch_size=1000)
+                    workers_bulk_changed.send(sender=Worker, created=batch, updated=[], source='seed')
+                    created += len(batch)
+        except IntegrityError:
+            raise CommandError('Такие email уже есть в базе: задайте другой --email-prefix или --seed.')
+        return created
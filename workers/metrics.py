@@ -0,0 +1,185 @@
+"""Метрики API работников: время и SQL каждого запроса, импорт и кэш; экспорт для Prometheus на /metrics.
+
+SQL считается обёрткой execute_wrappers, которую получает каждое новое соединение (connection_created):
+она работает и для реплик, и для соединений потоков sync_to_async, а вне замеряемого запроса
+только проверяет ContextVar. Под gunicorn gunicorn.conf.py задаёт PROMETHEUS_MULTIPROC_DIR,
+и /metrics собирает значения всех процессов.
+"""
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.http import HttpRequest, HttpResponse, HttpResponseBase
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Histogram, generate_latest
+from prometheus_client import REGISTRY, multiprocess
+
+# Представления, запросы к которым замеряются (/metrics, админка и auth - нет).
+INSTRUMENTED_MODULES = frozenset({'workers.views', 'workers.async_views'})
+
+REQUEST_LATENCY = Histogram(
+    'workers_http_request_duration_seconds', 'Время обработки запроса API работников.', ['route', 'method'],
+)
+REQUESTS = Counter(
+    'workers_http_requests_total', 'Запросы API работников по маршруту, методу и коду ответа.',
+    ['route', 'method', 'status'],
+)
+REQUEST_DB_QUERIES = Histogram(
+    'workers_http_request_db_queries', 'Число SQL-запросов за запрос API.', ['route'],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 500),
+)
+REQUEST_DB_TIME = Histogram(
+    'workers_http_request_db_duration_seconds', 'Суммарное время SQL за запрос API.', ['route'],
+)
+IMPORT_ROWS = Counter('workers_import_rows_total', 'Строки импорта по результату.', ['result'])
+IMPORT_DURATION = Histogram(
+    'workers_import_duration_seconds', 'Длительность импорта файла.',
+    buckets=(0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600),
+)
+IMPORT_ROWS_PER_SECOND = Histogram(
+    'workers_import_rows_per_second', 'Скорость импорта файла, строк в секунду.',
+    buckets=(100, 250, 500, 1000, 2500, 5000, 10000, 25000, 50000),
+)
+CACHE_REQUESTS = Counter('workers_cache_requests_total', 'Чтения кэша работников.', ['result'])
+
+
+@dataclass
+class RequestTimings:
+    """Счётчики текущего запроса: SQL и именованные участки (render, parse) для Server-Timing."""
+    queries: int = 0
+    db: float = 0.0
+    sections: Dict[str, float] = field(default_factory=dict)
+
+
+_timings: ContextVar[Optional[RequestTimings]] = ContextVar('workers_request_timings', default=None)
+
+
+def record_query(execute: Callable, sql: str, params: Any, many: bool, context: Dict[str, Any]) -> Any:
+    timings = _timings.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.db += time.perf_counter() - started
+        timings.queries += 1
+
+
+def install_query_recorder(sender: Any, connection: Any, **kwargs: Any) -> None:
+    """Обработчик connection_created: обёртка SQL на всё время жизни соединения."""
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+@contextmanager
+def track(name: str) -> Iterator[None]:
+    """Добавить время блока к участку name текущего запроса (вне запроса - ничего не делает)."""
+    timings = _timings.get()
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.sections[name] = timings.sections.get(name, 0.0) + time.perf_counter() - started
+
+
+_END = object()
+
+
+def tracked_iter(iterable: Iterable[Any], name: str) -> Iterator[Any]:
+    """Итератор, время получения элементов которого идёт в участок name (например, разбор строк openpyxl)."""
+    if _timings.get() is None:
+        yield from iterable
+        return
+    iterator = iter(iterable)
+    while True:
+        with track(name):
+            item = next(iterator, _END)
+        if item is _END:
+            return
+        yield item
+
+
+def observe_import(result: Dict[str, Any], seconds: float) -> None:
+    """Метрики завершённого импорта: строки по результату, длительность и скорость."""
+    errors = len(result['errors'])
+    IMPORT_ROWS.labels('added').inc(result['added'])
+    IMPORT_ROWS.labels('updated').inc(result.get('updated', 0))
+    IMPORT_ROWS.labels('unchanged').inc(result.get('unchanged', 0))
+    IMPORT_ROWS.labels('error').inc(errors)
+    IMPORT_DURATION.observe(seconds)
+    if result['total'] and seconds > 0:
+        IMPORT_ROWS_PER_SECOND.observe(result['total'] / seconds)
+
+
+def observe_cache(hit: bool) -> None:
+    CACHE_REQUESTS.labels('hit' if hit else 'miss').inc()
+
+
+def server_timing(timings: RequestTimings, total: float) -> str:
+    parts = [f'db;dur={timings.db * 1000:.1f};desc="{timings.queries} queries"']
+    parts.extend(f'{name};dur={seconds * 1000:.1f}' for name, seconds in timings.sections.items())
+    parts.append(f'total;dur={total * 1000:.1f}')
+    return ', '.join(parts)
+
+
+class RequestMetricsMiddleware:
+    """Время, число и время SQL по каждому запросу к API работников: заголовок Server-Timing и метрики Prometheus."""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Any:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timings = RequestTimings()
+        token = _timings.set(timings)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _timings.reset(token)
+        return self.finish(request, response, timings, time.perf_counter() - started)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponseBase:
+        timings = RequestTimings()
+        token = _timings.set(timings)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _timings.reset(token)
+        return self.finish(request, response, timings, time.perf_counter() - started)
+
+    @staticmethod
+    def finish(request: HttpRequest, response: HttpResponseBase, timings: RequestTimings, total: float) -> HttpResponseBase:
+        match = getattr(request, 'resolver_match', None)
+        if match is None or getattr(match.func, '__module__', None) not in INSTRUMENTED_MODULES:
+            return response
+        route = match.route
+        REQUEST_LATENCY.labels(route, request.method).observe(total)
+        REQUESTS.labels(route, request.method, str(response.status_code)).inc()
+        REQUEST_DB_QUERIES.labels(route).observe(timings.queries)
+        REQUEST_DB_TIME.labels(route).observe(timings.db)
+        response['Server-Timing'] = server_timing(timings, total)
+        return response
+
+
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    """Метрики в текстовом формате Prometheus (все процессы при PROMETHEUS_MULTIPROC_DIR)."""
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return HttpResponse(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
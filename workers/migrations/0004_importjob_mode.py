@@ -0,0 +1,18 @@
+# Generated by Django 4.2 on 2026-10-18 03:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workers', '0003_importjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='importjob',
+            name='mode',
+            field=models.CharField(default='create', max_length=16, verbose_name='Режим'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2 on 2026-10-18 03:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workers', '0004_importjob_mode'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='worker',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -0,0 +1,33 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+from workers.search import SEARCH_FIELDS, search_index_name, search_index_sql
+
+
+def create_search_indexes(apps, schema_editor) -> None:
+    """Триграммные GIN-индексы для поиска; только в PostgreSQL, без блокировки записи в таблицу."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for field in SEARCH_FIELDS:
+        schema_editor.execute(search_index_sql(field))
+
+
+def drop_search_indexes(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for field in SEARCH_FIELDS:
+        schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {search_index_name(field)}')
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY нельзя выполнять внутри транзакции.
+    atomic = False
+
+    dependencies = [
+        ('workers', '0005_worker_updated_at_datetime'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 4.2 on 2026-10-18 03:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workers', '0006_worker_search_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='worker',
+            name='workers_wor_is_acti_bfc83b_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='worker',
+            name='workers_wor_positio_86a69d_idx',
+        ),
+        migrations.AddIndex(
+            model_name='worker',
+            index=models.Index(fields=['position', 'is_active', 'id'], name='workers_position_active_id'),
+        ),
+        migrations.AddIndex(
+            model_name='worker',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['id'], name='workers_active_id'),
+        ),
+        migrations.AddIndex(
+            model_name='worker',
+            index=models.Index(condition=models.Q(('is_active', False)), fields=['id'], name='workers_inactive_id'),
+        ),
+        migrations.AddIndex(
+            model_name='worker',
+            index=models.Index(fields=['hired_date'], name='workers_hired_date'),
+        ),
+    ]
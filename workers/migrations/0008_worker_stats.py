@@ -0,0 +1,45 @@
+# Generated by Django 4.2 on 2026-10-18 03:52
+
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncMonth
+
+
+def fill_worker_stats(apps, schema_editor):
+    Worker = apps.get_model('workers', 'Worker')
+    WorkerStat = apps.get_model('workers', 'WorkerStat')
+    using = schema_editor.connection.alias
+    totals = (
+        Worker.objects.using(using).order_by()
+        .values('position', 'is_active', month=TruncMonth('hired_date'))
+        .annotate(total=Count('id'))
+    )
+    WorkerStat.objects.using(using).bulk_create(
+        WorkerStat(position=row['position'], is_active=row['is_active'], hired_month=row['month'], count=row['total'])
+        for row in totals
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workers', '0007_worker_query_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WorkerStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.CharField(max_length=50, verbose_name='Должность')),
+                ('is_active', models.BooleanField(verbose_name='Активен ли?')),
+                ('hired_month', models.DateField(verbose_name='Месяц приёма')),
+                ('count', models.IntegerField(default=0, verbose_name='Число работников')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='workerstat',
+            constraint=models.UniqueConstraint(fields=('position', 'is_active', 'hired_month'), name='workers_stat_key'),
+        ),
+        migrations.RunPython(fill_worker_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.2 on 2026-10-18 04:05
+
+from itertools import islice
+
+from django.db import migrations, models
+
+
+def fill_worker_changes(apps, schema_editor):
+    """Событие created для каждого существующего работника: первая синхронизация с since=0 получит всех."""
+    Worker = apps.get_model('workers', 'Worker')
+    WorkerChange = apps.get_model('workers', 'WorkerChange')
+    using = schema_editor.connection.alias
+    ids = Worker.objects.using(using).order_by('id').values_list('id', flat=True).iterator(chunk_size=5000)
+    while True:
+        batch = [WorkerChange(worker_id=worker_id, action='created') for worker_id in islice(ids, 5000)]
+        if not batch:
+            break
+        WorkerChange.objects.using(using).bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workers', '0008_worker_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WorkerChange',
+            fields=[
+                ('seq', models.BigAutoField(primary_key=True, serialize=False)),
+                ('worker_id', models.BigIntegerField(verbose_name='ID работника')),
+                ('action', models.CharField(choices=[('created', 'Создан'), ('updated', 'Изменён'), ('deleted', 'Удалён')], max_length=16, verbose_name='Действие')),
+                ('fields', models.JSONField(blank=True, null=True, verbose_name='Изменённые поля')),
+                ('changed_at', models.DateTimeField(auto_now_add=True, verbose_name='Время изменения')),
+            ],
+        ),
+        migrations.RunPython(fill_worker_changes, migrations.RunPython.noop),
+    ]
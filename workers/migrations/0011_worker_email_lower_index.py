@@ -0,0 +1,18 @@
+# Generated by Django 4.2 on 2026-10-18 04:57
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workers', '0010_importjob_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='worker',
+            index=models.Index(django.db.models.functions.text.Lower('email'), name='workers_email_lower'),
+        ),
+    ]
@@ -1,9 +1,17 @@
-import logging
-from typing import Any, Optional
-from django.db import models
+import datetime
+import uuid
+from typing import Any, Iterable, Optional, Sequence, Tuple
+from django.db import models, router, transaction
+from django.db.models.functions import Lower
 from django.conf import settings
 
-logger: logging.Logger = logging.getLogger(__name__)
+# Ключ строки сводки WorkerStat: должность, активность и месяц приёма (первое число).
+StatKey = Tuple[str, bool, Optional[datetime.date]]
+STAT_FIELDS: Tuple[str, ...] = ('position', 'is_active', 'hired_date')
+
+
+def hired_month(hired_date: Optional[datetime.date]) -> Optional[datetime.date]:
+    return hired_date.replace(day=1) if hired_date else None
 
 class Worker(models.Model):
     first_name = models.CharField('Имя', max_length=25)
@@ -13,7 +21,7 @@ class Worker(models.Model):
     position = models.CharField('Должность',max_length=50)
     is_active = models.BooleanField('Активен ли?',default=True)
     hired_date = models.DateField('Дата приёма на работу',auto_now_add=True)
-    updated_at = models.DateField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True)
     created_by = models.ForeignKey(
         settings.AUTH_USER_MODEL, 
         verbose_name='Создатель записи',
@@ -24,18 +32,115 @@ class Worker(models.Model):
     )
 
     class Meta:
+        # Индексы повторяют запросы API: фильтры position/is_active с сортировкой по id.
+        # Уволенных мало, поэтому частичный индекс по ним маленький и очень селективный.
+        # Индекс по created_by Django создаёт для ForeignKey сам. workers_email_lower обслуживает
+        # поиск по email без учёта регистра при импорте и массовом создании (workers_by_email).
         indexes = [
-            models.Index(fields=["is_active"]),
-            models.Index(fields=["position"]),
+            models.Index(fields=["position", "is_active", "id"], name="workers_position_active_id"),
+            models.Index(fields=["id"], condition=models.Q(is_active=True), name="workers_active_id"),
+            models.Index(fields=["id"], condition=models.Q(is_active=False), name="workers_inactive_id"),
+            models.Index(fields=["hired_date"], name="workers_hired_date"),
+            models.Index(Lower("email"), name="workers_email_lower"),
         ]
 
+    @classmethod
+    def from_db(cls, db: str, field_names: Sequence[str], values: Sequence[Any]) -> 'Worker':
+        instance = super().from_db(db, field_names, values)
+        # Ключ сводки на момент чтения: по нему сигналы переносят счётчик WorkerStat при изменении.
+        instance._stat_key = instance.stat_key() if set(STAT_FIELDS) <= set(field_names) else None
+        return instance
+
+    def stat_key(self, **overrides: Any) -> StatKey:
+        """Ключ WorkerStat по текущим значениям полей; overrides подменяют значения (например, прежние)."""
+        values = {name: overrides.get(name, getattr(self, name)) for name in STAT_FIELDS}
+        return values['position'], values['is_active'], hired_month(values['hired_date'])
+
     def save(self, *args: Any, **kwargs: Any) -> None:
-        is_create: bool = self.pk is None
-        super().save(*args, **kwargs)
-        if is_create:
-            user: Optional[Any] = getattr(self, 'created_by', None)
-            created_by: str = user.username if user else 'system'
-            logger.info(f"Worker created: id={self.id}, name={self.last_name} {self.first_name}, by={created_by}")
+        # post_save пишет журнал WorkerChange и сводку WorkerStat: в одной транзакции с самой строкой
+        # (Django отправляет post_save уже после своего блока записи). delete() атомарен вместе с post_delete.
+        using = kwargs.get('using') or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using, savepoint=False):
+            super().save(*args, **kwargs)
+
+    def __str__(self):
+        return f"{self.last_name} {self.first_name}"
+
+
+def workers_by_email(emails: Iterable[str]) -> 'models.QuerySet[Worker]':
+    """Работники, чей email без учёта регистра входит в emails (в нижнем регистре), с аннотацией email_lower.
+
+    Условие LOWER(email) IN (...) совпадает с выражением индекса workers_email_lower.
+    """
+    return Worker.objects.annotate(email_lower=Lower('email')).filter(email_lower__in=emails)
+
+class WorkerStat(models.Model):
+    """Сводка численности: число работников по должности, активности и месяцу приёма.
+
+    Счётчики меняются вместе с записью работников (сигналы, см. workers.stats), поэтому статистика
+    читается за O(числа строк сводки), а не агрегатом по всей таблице работников.
+    """
+    position = models.CharField('Должность', max_length=50)
+    is_active = models.BooleanField('Активен ли?')
+    hired_month = models.DateField('Месяц приёма')
+    count = models.IntegerField('Число работников', default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['position', 'is_active', 'hired_month'], name='workers_stat_key'),
+        ]
+
+    def __str__(self):
+        return f"{self.position} {self.is_active} {self.hired_month:%Y-%m}: {self.count}"
+
+class WorkerChange(models.Model):
+    """Журнал изменений работников для инкрементальной синхронизации (/api/workers/changes/?since=seq).
+
+    seq растёт монотонно и служит курсором; удаления остаются в журнале, поэтому worker_id - не ForeignKey.
+    """
+
+    class Action(models.TextChoices):
+        CREATED = 'created', 'Создан'
+        UPDATED = 'updated', 'Изменён'
+        DELETED = 'deleted', 'Удалён'
+
+    seq = models.BigAutoField(primary_key=True)
+    worker_id = models.BigIntegerField('ID работника')
+    action = models.CharField('Действие', max_length=16, choices=Action.choices)
+    fields = models.JSONField('Изменённые поля', null=True, blank=True)
+    changed_at = models.DateTimeField('Время изменения', auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.seq}: {self.action} {self.worker_id}"
+
+class ImportJob(models.Model):
+    """Фоновая задача импорта работников из файла."""
+
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'В очереди'
+        RUNNING = 'running', 'Выполняется'
+        DONE = 'done', 'Завершена'
+        FAILED = 'failed', 'Ошибка'
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    file = models.FileField('Файл', upload_to='imports/')
+    mode = models.CharField('Режим', max_length=16, default='create')
+    status = models.CharField('Статус', max_length=16, choices=Status.choices, default=Status.PENDING)
+    processed = models.PositiveIntegerField('Обработано строк', default=0)
+    added = models.PositiveIntegerField('Добавлено', default=0)
+    error_count = models.PositiveIntegerField('Ошибок', default=0)
+    result = models.JSONField('Результат', null=True, blank=True)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        verbose_name='Автор импорта',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='import_jobs',
+    )
+    created_at = models.DateTimeField('Создана', auto_now_add=True)
+    updated_at = models.DateTimeField('Обновлена', auto_now=True)
+    finished_at = models.DateTimeField('Завершена', null=True, blank=True)
 
     def __str__(self):
-        return f"{self.last_name} {self.first_name}"
\ No newline at end of file
+        return f"Импорт {self.id} ({self.status})"
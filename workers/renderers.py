@@ -0,0 +1,58 @@
+from typing import Any, Mapping, Optional
+
+from rest_framework.renderers import JSONRenderer
+
+from .metrics import track
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - без orjson остаётся стандартный json
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSONRenderer на orjson с тем же результатом байт в байт.
+
+    Компактный вывод без экранирования не-ASCII, U+2028/U+2029 экранируются как у DRF,
+    даты и время форматирует JSONEncoder DRF. Отступы (?indent, ; indent=), ensure_ascii,
+    значения, которые orjson не кодирует (большие int, не-строковые ключи), и отсутствие
+    orjson обрабатывает стандартный JSONRenderer. Вещественные числа orjson записывает иначе (1e16 вместо 1e+16,
+    NaN как null), поэтому рендерер подключается только к ответам без float - списку и карточке работника.
+    """
+
+    def render(
+        self, data: Any, accepted_media_type: Optional[str] = None, renderer_context: Optional[Mapping] = None,
+    ) -> bytes:
+        if data is None:
+            return b''
+        if orjson is None or self.ensure_ascii or not self.compact or \
+                self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            with track('render'):
+                ret = orjson.dumps(data, default=self.encoder_class().default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+        except TypeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
+
+
+class ExportRenderer(JSONRenderer):
+    """Рендерер формата выгрузки для согласования ?format= и Accept.
+
+    Данные выгрузки отдаются потоком в обход рендерера, через него проходят только ошибки.
+    """
+
+
+class CSVRenderer(ExportRenderer):
+    media_type = 'text/csv'
+    format = 'csv'
+
+
+class NDJSONRenderer(ExportRenderer):
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+
+
+class XLSXRenderer(ExportRenderer):
+    media_type = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+    format = 'xlsx'
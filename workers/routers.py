@@ -0,0 +1,136 @@
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Iterator, List, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+APP_LABEL: str = 'workers'
+# Cookie с моментом, до которого клиент читает с primary после своей записи (задержка репликации).
+PRIMARY_COOKIE: str = 'workers_primary_until'
+
+
+@dataclass
+class RoutingState:
+    """Маршрутизация чтений в рамках одного запроса."""
+    replicas_allowed: bool
+    wrote: bool = False
+
+
+_state: ContextVar[Optional[RoutingState]] = ContextVar('workers_routing_state', default=None)
+
+
+def read_replicas() -> List[str]:
+    if settings.WORKERS_READ_FROM_PRIMARY:
+        return []
+    return list(settings.WORKERS_READ_REPLICAS)
+
+
+def reads_from_replica() -> bool:
+    """Чтения workers в текущем запросе идут на реплику."""
+    state = _state.get()
+    return state is not None and state.replicas_allowed and not state.wrote and bool(read_replicas())
+
+
+def pinned_to_primary() -> bool:
+    """Реплики настроены, но запрос читает с primary: клиент недавно писал (cookie) или уже записал в этом запросе."""
+    state = _state.get()
+    return state is not None and (not state.replicas_allowed or state.wrote) and bool(read_replicas())
+
+
+@contextmanager
+def routing(replicas_allowed: bool) -> Iterator[RoutingState]:
+    """Разрешить (или запретить) чтения workers с реплик внутри блока."""
+    state = RoutingState(replicas_allowed=replicas_allowed)
+    token = _state.set(state)
+    try:
+        yield state
+    finally:
+        _state.reset(token)
+
+
+class WorkerReplicaRouter:
+    """Чтения моделей workers - на случайную реплику, но только там, где это явно разрешено (GET-запросы API).
+
+    Импорт, фоновые задачи, команды и любые чтения после записи в том же запросе идут в primary,
+    так что чтение-перед-записью никогда не видит устаревшие данные реплики.
+    """
+
+    def db_for_read(self, model: Any, **hints: Any) -> Optional[str]:
+        if model._meta.app_label != APP_LABEL:
+            return None
+        state = _state.get()
+        if state is None or not state.replicas_allowed or state.wrote:
+            return None
+        replicas = read_replicas()
+        return random.choice(replicas) if replicas else None
+
+    def db_for_write(self, model: Any, **hints: Any) -> Optional[str]:
+        state = _state.get()
+        if state is not None:
+            state.wrote = True
+        return None
+
+    def allow_relation(self, obj1: Any, obj2: Any, **hints: Any) -> Optional[bool]:
+        aliases = {DEFAULT_DB_ALIAS, *settings.WORKERS_READ_REPLICAS}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db: str, app_label: str, **hints: Any) -> Optional[bool]:
+        if db in settings.WORKERS_READ_REPLICAS:
+            return False
+        return None
+
+
+class ReplicaRoutingMiddleware:
+    """Разрешает чтения с реплик для GET/HEAD/OPTIONS, пока клиент недавно ничего не записывал.
+
+    После запроса с записью ставит cookie, и следующие WORKERS_PRIMARY_STICKY_SECONDS секунд
+    чтения этого клиента идут в primary.
+    """
+    SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with routing(self.replicas_allowed(request)) as state:
+            response = self.get_response(request)
+        return self.process_response(state, response)
+
+    async def __acall__(self, request):
+        with routing(self.replicas_allowed(request)) as state:
+            response = await self.get_response(request)
+        return self.process_response(state, response)
+
+    @staticmethod
+    def process_response(state: RoutingState, response):
+        if state.wrote and settings.WORKERS_PRIMARY_STICKY_SECONDS > 0:
+            response.set_cookie(
+                PRIMARY_COOKIE,
+                str(int(time.time()) + settings.WORKERS_PRIMARY_STICKY_SECONDS),
+                max_age=settings.WORKERS_PRIMARY_STICKY_SECONDS,
+                httponly=True,
+                samesite='Lax',
+            )
+        return response
+
+    def replicas_allowed(self, request) -> bool:
+        if request.method not in self.SAFE_METHODS or not read_replicas():
+            return False
+        try:
+            primary_until = int(request.COOKIES.get(PRIMARY_COOKIE, 0))
+        except ValueError:
+            primary_until = 0
+        return primary_until < time.time()
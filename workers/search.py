@@ -0,0 +1,68 @@
+import operator
+from functools import reduce
+from typing import List, Tuple
+
+from django.db import connections
+from django.db.models import Case, F, FloatField, Q, QuerySet, TextField, Value, When
+from django.db.models.functions import Cast, Greatest, Upper
+
+from .models import Worker
+
+SEARCH_FIELDS: Tuple[str, ...] = ('last_name', 'first_name', 'middle_name', 'email', 'position')
+# Поля, совпадение с началом которых поднимает работника в выдаче.
+PREFIX_FIELDS: Tuple[str, ...] = ('last_name', 'first_name', 'email')
+# pg_trgm не строит триграммы для запросов короче трёх символов: для них нечёткий поиск бесполезен.
+MIN_FUZZY_LENGTH: int = 3
+
+
+def search_index_name(field: str) -> str:
+    return f'workers_worker_{field}_trgm'
+
+
+def search_index_sql(field: str) -> str:
+    """GIN-индекс по UPPER(field::text): то же выражение Django строит для icontains/istartswith в PostgreSQL,
+    поэтому индекс обслуживает и ILIKE, и триграммное сходство по Upper(Cast(field))."""
+    return (
+        f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {search_index_name(field)} '
+        f'ON workers_worker USING gin ((UPPER({field}::text)) gin_trgm_ops)'
+    )
+
+
+def _normalized(field: str) -> Upper:
+    return Upper(Cast(field, output_field=TextField()))
+
+
+def _is_postgresql(queryset: QuerySet[Worker]) -> bool:
+    return connections[queryset.db].vendor == 'postgresql'
+
+
+def search_filter(queryset: QuerySet[Worker], query: str) -> QuerySet[Worker]:
+    """Отобрать работников, у которых query входит в ФИО/email/должность или (PostgreSQL) похож на слово в них."""
+    conditions: List = [Q(**{f'{field}__icontains': query}) for field in SEARCH_FIELDS]
+    if _is_postgresql(queryset) and len(query) >= MIN_FUZZY_LENGTH:
+        from django.contrib.postgres.lookups import TrigramWordSimilar
+
+        conditions += [TrigramWordSimilar(_normalized(field), query.upper()) for field in SEARCH_FIELDS]
+    return queryset.filter(reduce(operator.or_, conditions))
+
+
+def search_workers(queryset: QuerySet[Worker], query: str) -> QuerySet[Worker]:
+    """Поиск работников с ранжированием: сначала совпадения с началом фамилии/имени/email, затем по сходству."""
+    query = query.strip()
+    if not query:
+        return queryset
+    prefix_rank = Case(
+        *[When(**{f'{field}__istartswith': query}, then=Value(1.0)) for field in PREFIX_FIELDS],
+        default=Value(0.0),
+        output_field=FloatField(),
+    )
+    queryset = search_filter(queryset, query).annotate(search_prefix=prefix_rank)
+    if _is_postgresql(queryset):
+        from django.contrib.postgres.search import TrigramWordSimilarity
+
+        queryset = queryset.annotate(search_similarity=Greatest(
+            *[TrigramWordSimilarity(query.upper(), _normalized(field)) for field in SEARCH_FIELDS],
+        ))
+    else:
+        queryset = queryset.annotate(search_similarity=Value(0.0, output_field=FloatField()))
+    return queryset.order_by(F('search_prefix').desc(), F('search_similarity').desc(), 'id')
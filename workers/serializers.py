@@ -1,12 +1,18 @@
-from typing import Any, Dict, Optional, List, cast
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Optional, List, Tuple, cast
+
+from django.conf import settings
 
 from rest_framework import serializers
 from rest_framework.request import Request
 
-from .models import Worker
+from .models import ImportJob, Worker
 
 class WorkerListCreateSerializer(serializers.ModelSerializer):
     """Сериализатор для просмотра и создания работников."""
+    # Поля, которые отдаёт GET списка; по ним же строится проекция запроса (WorkerService.get_workers_for_read).
+    READ_FIELDS: Tuple[str, ...] = ('id', 'first_name', 'middle_name', 'last_name', 'position', 'is_active')
+
     created_by = serializers.HiddenField(default=serializers.CurrentUserDefault())
 
     class Meta:
@@ -21,14 +27,19 @@ class WorkerListCreateSerializer(serializers.ModelSerializer):
         request = cast(Optional[Request], self.context.get('request'))
 
         if request and request.method == 'GET':
-            keep: set[str] = {'id', 'first_name', 'middle_name', 'last_name', 'position', 'is_active'}
             for name in list(self.fields.keys()):
-                if name not in keep:
+                if name not in self.READ_FIELDS:
                     self.fields.pop(name)
 
         if request and request.method == 'POST':
             self.fields['email'].required = True
 
+    @classmethod
+    def represent_rows(cls, rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Быстрый аналог .data для GET списка по строкам values(): значения READ_FIELDS уже в виде ответа."""
+        fields = cls.READ_FIELDS
+        return [{name: row[name] for name in fields} for row in rows]
+
 class WorkerRetrieveSerializer(serializers.ModelSerializer):
     """Сериализатор для просмотра одного работника."""
 
@@ -36,6 +47,37 @@ class WorkerRetrieveSerializer(serializers.ModelSerializer):
         model = Worker
         fields = '__all__'
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def row_layout() -> Tuple[Tuple[str, ...], Tuple[str, ...], Dict[str, Callable[[Any], Any]]]:
+        """Поля ответа в порядке сериализатора, соответствующие им колонки values_list и форматирование дат."""
+        fields = WorkerRetrieveSerializer().fields
+        columns = tuple(
+            f'{name}_id' if isinstance(field, serializers.PrimaryKeyRelatedField) else name
+            for name, field in fields.items()
+        )
+        represent = {
+            name: field.to_representation for name, field in fields.items()
+            if isinstance(field, (serializers.DateField, serializers.DateTimeField))
+        }
+        return tuple(fields), columns, represent
+
+    @classmethod
+    def represent_row(cls, row: Tuple[Any, ...]) -> Dict[str, Any]:
+        """Быстрый аналог .data по кортежу values_list(*колонки row_layout())."""
+        names, _, represent = cls.row_layout()
+        item: Dict[str, Any] = dict(zip(names, row))
+        for name, to_representation in represent.items():
+            if item[name] is not None:
+                item[name] = to_representation(item[name])
+        return item
+
+    @classmethod
+    def represent(cls, worker: Worker) -> Dict[str, Any]:
+        """Быстрый аналог .data для уже загруженного работника."""
+        _, columns, _ = cls.row_layout()
+        return cls.represent_row(tuple(getattr(worker, column) for column in columns))
+
 
 class WorkerUpdateSerializer(serializers.ModelSerializer):
     """Сериализатор для корректировки данных работника."""
@@ -64,8 +106,12 @@ class WorkerImportRowSerializer(serializers.Serializer):
     is_active = serializers.BooleanField(required=False, default=True)
 
     def to_worker_kwargs(self) -> Dict[str, Any]:
-        data = self.validated_data
-        return  {
+        return self.worker_kwargs(self.validated_data)
+
+    @staticmethod
+    def worker_kwargs(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Аргументы модели Worker из провалидированной строки."""
+        return {
             'first_name': data.get('first_name'),
             'middle_name': data.get('middle_name', ''),
             'last_name': data.get('last_name'),
@@ -76,11 +122,52 @@ class WorkerImportRowSerializer(serializers.Serializer):
 
 class ImportFileSerializer(serializers.Serializer):
     file = serializers.FileField()
+    background = serializers.BooleanField(required=False, default=False)
+    mode = serializers.ChoiceField(choices=['create', 'upsert'], required=False, default='create')
 
     def validate_file(self, file):
-        name = getattr(file, 'name', '')
-        if not name.lower().endswith('xlsx'):
-            raise serializers.ValidationError('Допустимый формат файла .xlsx')
-        if file.size and file.size > 5 * 1024 * 1024:
-            raise serializers.ValidationError('Максимальный допустимый размер файла 5MB')
+        name = getattr(file, 'name', '').lower()
+        if name.endswith('.xlsx'):
+            max_size = settings.WORKERS_IMPORT_MAX_XLSX_SIZE
+        elif name.endswith(('.csv', '.tsv')):
+            max_size = settings.WORKERS_IMPORT_MAX_TEXT_SIZE
+        else:
+            raise serializers.ValidationError('Допустимые форматы файла: .xlsx, .csv, .tsv')
+        if file.size and file.size > max_size:
+            raise serializers.ValidationError(f'Максимальный допустимый размер файла {max_size // (1024 * 1024)}MB')
         return file
+
+class WorkerBulkDeactivateSerializer(serializers.Serializer):
+    """Выбор работников для массового увольнения: список id и/или точное совпадение должности.
+
+    Нечёткого поиска (search) здесь нет: массовая операция не должна задевать похожих работников.
+    """
+    ids = serializers.ListField(child=serializers.IntegerField(), required=False, allow_empty=False)
+    position = serializers.CharField(required=False)
+
+    def validate(self, attrs: Dict[str, Any]) -> Dict[str, Any]:
+        if not attrs:
+            raise serializers.ValidationError('Укажите ids или фильтр position.')
+        if len(attrs.get('ids', ())) > settings.WORKERS_BULK_MAX_ITEMS:
+            raise serializers.ValidationError(f'Не больше {settings.WORKERS_BULK_MAX_ITEMS} id за запрос.')
+        return attrs
+
+class WorkerChangesQuerySerializer(serializers.Serializer):
+    """Параметры ленты изменений: курсор since (seq последнего полученного изменения) и размер страницы."""
+    since = serializers.IntegerField(min_value=0, default=0)
+    limit = serializers.IntegerField(min_value=1, required=False)
+
+    def validate_limit(self, value: int) -> int:
+        return min(value, settings.WORKERS_CHANGES_MAX_PAGE_SIZE)
+
+class ImportJobSerializer(serializers.ModelSerializer):
+    """Сериализатор для статуса фоновой задачи импорта."""
+    job_id = serializers.UUIDField(source='id', read_only=True)
+    errors = serializers.IntegerField(source='error_count', read_only=True)
+
+    class Meta:
+        model = ImportJob
+        fields = [
+            'job_id', 'status', 'processed', 'added', 'errors', 'result', 'created_at', 'finished_at',
+        ]
+        read_only_fields = fields
@@ -1,96 +1,135 @@
-from typing import Any, Dict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
+from django.conf import settings
 from django.db.models import QuerySet
-from django.db import IntegrityError, transaction
 
 from openpyxl import load_workbook
-from openpyxl.worksheet.worksheet import Worksheet
 
+from .bulk import bulk_create_workers, bulk_update_workers, deactivate_workers
+from .cache import WorkerCache
+from .changes import changes_since
+from .conditional import ListVersion, alist_version, list_version
+from .importers import WorkerImporter, iter_csv_rows
+from .metrics import tracked_iter
 from .models import Worker
-from .serializers import WorkerImportRowSerializer
+from .serializers import WorkerListCreateSerializer
+from .search import search_workers
+from .stats import worker_stats
+
+
+CSV_DELIMITERS: Dict[str, str] = {'.csv': ',', '.tsv': '\t'}
 
 
 class WorkerService:
     @staticmethod
     def get_workers() -> QuerySet[Worker]:
-        """Получить всех работников."""
+        """Получить всех работников в порядке id."""
+        return Worker.objects.order_by('id')
+
+    @staticmethod
+    def get_workers_for_read() -> QuerySet[Worker]:
+        """Только чтение: словари с полями, которые GET списка действительно отдаёт, без создания моделей."""
+        return Worker.objects.values(*WorkerListCreateSerializer.READ_FIELDS).order_by('id')
+
+    @staticmethod
+    def search_workers(queryset: QuerySet[Worker], query: str) -> QuerySet[Worker]:
+        """Найти работников по строке query с ранжированием; пустой запрос не фильтрует."""
+        return search_workers(queryset, query)
+
+    @staticmethod
+    def get_worker(pk, use_cache: bool = True, for_update: bool = False) -> Worker:
+        """Получить работника по ID (для чтения - через кэш, для изменения - с блокировкой строки).
+
+        for_update=True нужно вызывать внутри транзакции вызывающего кода.
+        """
+        if for_update:
+            return Worker.objects.select_for_update().get(id=pk)
+        if not use_cache:
+            return Worker.objects.get(id=pk)
+        return WorkerCache.get_or_set(f'detail:{pk}', lambda: Worker.objects.get(id=pk))
+
+    @staticmethod
+    async def aget_worker(pk: int) -> Worker:
+        """Асинхронное чтение работника по ID через кэш (aget без блокировки event loop)."""
+        return await WorkerCache.aget_or_set(f'detail:{pk}', lambda: Worker.objects.aget(id=pk))
+
+    @staticmethod
+    def get_workers_list_version() -> ListVersion:
+        """Версия списка работников для ETag и Last-Modified через кэш: проверка 304 не читает страницу."""
+        return WorkerCache.get_or_set('list-version', list_version)
+
+    @staticmethod
+    async def aget_workers_list_version() -> ListVersion:
+        """Асинхронный get_workers_list_version: тот же ключ кэша."""
+        return await WorkerCache.aget_or_set('list-version', alist_version)
+
+    @staticmethod
+    def get_workers_page(key: str, load: Callable[[], Any]) -> Any:
+        """Получить страницу списка работников для набора фильтров и пагинации key через кэш."""
+        return WorkerCache.get_or_set(f'list:{key}', load)
+
+    @staticmethod
+    async def aget_workers_page(key: str, load: Callable[[], Awaitable[Any]]) -> Any:
+        """Асинхронный get_workers_page: тот же ключ кэша, что у синхронного списка."""
+        return await WorkerCache.aget_or_set(f'list:{key}', load)
+
+    @staticmethod
+    def get_worker_stats() -> Dict[str, Any]:
+        """Численность работников по должностям, активности и месяцам приёма из сводки WorkerStat через кэш."""
+        return WorkerCache.get_or_set('stats', worker_stats)
+
+    @staticmethod
+    def get_changes(since: int = 0, limit: Optional[int] = None) -> Dict[str, Any]:
+        """Изменения работников после курсора since (создания, изменения, удаления) с их текущим состоянием."""
+        return changes_since(since, limit or settings.WORKERS_CHANGES_PAGE_SIZE)
+
+    @staticmethod
+    def bulk_create_workers(items: List[Any], created_by) -> Dict[str, Any]:
+        """Создать работников из списка словарей одной транзакцией; результат по каждому элементу."""
+        return bulk_create_workers(items, created_by)
+
+    @staticmethod
+    def bulk_update_workers(items: List[Any]) -> Dict[str, Any]:
+        """Частично изменить работников по списку {id, поля...} одной транзакцией; результат по каждому элементу."""
+        return bulk_update_workers(items)
+
+    @staticmethod
+    def deactivate_workers(ids: Optional[List[int]] = None, position: Optional[str] = None) -> List[int]:
+        """Уволить (is_active=False) работников по id и/или точной должности; вернуть id уволенных."""
+        queryset = Worker.objects.all()
+        if ids is not None:
+            queryset = queryset.filter(id__in=ids)
+        if position is not None:
+            queryset = queryset.filter(position=position)
+        return deactivate_workers(queryset)
+
+    @staticmethod
+    def import_workers_from_excel(file_obj, created_by, **options: Any) -> Dict[str, Any]:
+        """Импорт работников из Excel файла; options передаются в WorkerImporter (batch_size, processes, progress)."""
+        workbook = load_workbook(filename=file_obj, read_only=True, data_only=True)
         try:
-            with transaction.atomic():
-                workers = Worker.objects.all()
-                return workers
-        except IntegrityError as exc:
-            raise exc
+            sheet = workbook.active
+            importer = WorkerImporter(created_by, **options)
+            return importer.run(tracked_iter(sheet.iter_rows(values_only=True), 'parse'))
+        finally:
+            workbook.close()
 
     @staticmethod
-    def get_worker(pk) -> Worker:
-        """Получить работника по ID."""
+    def import_workers_from_csv(file_obj, created_by, delimiter: str = ',', **options: Any) -> Dict[str, Any]:
+        """Импорт работников из CSV/TSV файла, который читается потоково по чанкам загрузки."""
+        importer = WorkerImporter(created_by, **options)
         try:
-            with transaction.atomic():
-                workers = Worker.objects.get(id=pk)
-                return workers
-        except IntegrityError as exc:
-            raise exc
-        
-    @staticmethod
-    def import_workers_from_excel(file_obj, created_by) -> Dict[str, Any]:
-        """Импорт работников из Excel файла."""
-        workbook = load_workbook(filename=file_obj, read_only=True, data_only=True)
-        sheet = workbook.active
-
-        headers: List[str] = []
-        first_row = True
-        required_fields = {'first_name', 'last_name', 'email', 'position'}
-
-        added_count = 0
-        total_rows = 0
-        errors: List[Dict[str, Any]] = []
-
-        existing_emails = set(Worker.objects.values_list('email', flat=True))
-        seen_emails = set()
-
-        for row_idx, row in enumerate(sheet.iter_rows(values_only=True), start=1):
-            if first_row:
-                headers = [str(h).strip() if h is not None else '' for h in row]
-                missing = required_fields - set(headers)
-                if missing:
-                    return {
-                        'added': 0,
-                        'errors': [{
-                            'detail': f'Отсутствуют обязательные столбцы: {", ".join(sorted(missing))}'
-                        }]}
-                first_row = False
-                continue
-            total_rows += 1
-            row_data: Dict[str, Any] = {}
-            for col_idx, value in enumerate(row):
-                if col_idx < len(headers) and headers[col_idx]:
-                    row_data[headers[col_idx]] = value
-
-            serializer = WorkerImportRowSerializer(data=row_data)
-            if not serializer.is_valid():
-                errors.append({'row': row_idx, 'detail': serializer.errors})
-                continue
-
-            email_value = str(serializer.validated_data.get('email')).strip().lower()
-            if email_value in seen_emails:
-                errors.append({'row': row_idx, 'detail': 'Дубликат email в файле'})
-                continue
-            if email_value in existing_emails:
-                errors.append({'row': row_idx, 'detail': 'Email уже существует в базе'})
-                continue
-
-            try:
-                with transaction.atomic():
-                    worker = Worker(**serializer.to_worker_kwargs())
-                    worker.created_by = created_by
-                    worker.save()
-                    added_count += 1
-                    seen_emails.add(email_value)
-            except Exception as exc:
-                errors.append({'row': row_idx, 'detail': str(exc)})
-
-        return {
-            'added': added_count,
-            'errors': errors,
-            'total': total_rows,
-        }
\ No newline at end of file
+            return importer.run(tracked_iter(iter_csv_rows(file_obj, delimiter=delimiter), 'parse'))
+        except UnicodeDecodeError:
+            result = importer.result()
+            result['errors'].append({'detail': 'Файл должен быть в кодировке UTF-8'})
+            return result
+
+    @staticmethod
+    def import_workers(file_obj, created_by, **options: Any) -> Dict[str, Any]:
+        """Импорт работников из .xlsx, .csv или .tsv файла по расширению имени."""
+        name: str = getattr(file_obj, 'name', '') or ''
+        for extension, delimiter in CSV_DELIMITERS.items():
+            if name.lower().endswith(extension):
+                return WorkerService.import_workers_from_csv(file_obj, created_by, delimiter=delimiter, **options)
+        return WorkerService.import_workers_from_excel(file_obj, created_by, **options)
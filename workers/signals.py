@@ -0,0 +1,121 @@
+from collections import Counter
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import Signal, receiver
+from rest_framework.authtoken.models import Token
+
+from .authentication import AuthCache
+
+from .cache import WorkerCache
+from .changes import record_changes
+from .log import log_bulk_event, log_worker_event
+from .models import STAT_FIELDS, Worker, WorkerChange
+from .stats import apply_worker_stat_deltas, stored_stat_key, worker_stat_deltas
+
+# Массовая запись работников в обход Worker.save (bulk_create/bulk_update/QuerySet.update).
+# Аргументы: created - список созданных работников, updated - список пар (работник, прежние значения полей),
+# необязательные source - операция ('bulk', 'deactivate', 'import') и by - пользователь для лога.
+workers_bulk_changed = Signal()
+
+
+@receiver(post_save, sender=Worker)
+@receiver(post_delete, sender=Worker)
+def invalidate_worker_cache(sender: Any, **kwargs: Any) -> None:
+    WorkerCache.invalidate()
+
+
+@receiver(workers_bulk_changed, sender=Worker)
+def invalidate_worker_cache_bulk(sender: Any, **kwargs: Any) -> None:
+    WorkerCache.invalidate()
+
+
+@receiver(pre_save, sender=Worker)
+def remember_worker_stat_key(sender: Any, instance: Worker, **kwargs: Any) -> None:
+    instance._stat_key = stored_stat_key(instance)
+
+
+@receiver(post_save, sender=Worker)
+def update_worker_stats(sender: Any, instance: Worker, created: bool, update_fields=None, **kwargs: Any) -> None:
+    previous = None if created else instance._stat_key
+    key = instance.stat_key()
+    if previous is not None and update_fields is not None:
+        # Несохранённые поля остаются в базе прежними.
+        key = tuple(value if name in update_fields else old for name, value, old in zip(STAT_FIELDS, key, previous))
+    deltas = Counter({key: 1})
+    if previous is not None:
+        deltas[previous] -= 1
+    apply_worker_stat_deltas(deltas)
+    instance._stat_key = key
+
+
+@receiver(post_delete, sender=Worker)
+def update_worker_stats_on_delete(sender: Any, instance: Worker, **kwargs: Any) -> None:
+    apply_worker_stat_deltas(Counter({getattr(instance, '_stat_key', None) or instance.stat_key(): -1}))
+
+
+@receiver(workers_bulk_changed, sender=Worker)
+def update_worker_stats_bulk(sender: Any, created=(), updated=(), **kwargs: Any) -> None:
+    apply_worker_stat_deltas(worker_stat_deltas(created, updated))
+    for worker in created:
+        worker._stat_key = worker.stat_key()
+    for worker, _ in updated:
+        worker._stat_key = worker.stat_key()
+
+
+@receiver(post_save, sender=Worker)
+def record_worker_saved(sender: Any, instance: Worker, created: bool, update_fields=None, **kwargs: Any) -> None:
+    # Для save() без update_fields набор изменённых полей неизвестен: fields=None, актуальное состояние - в worker.
+    action = WorkerChange.Action.CREATED if created else WorkerChange.Action.UPDATED
+    record_changes([(instance.pk, action, None if created else update_fields)])
+
+
+@receiver(post_delete, sender=Worker)
+def record_worker_deleted(sender: Any, instance: Worker, **kwargs: Any) -> None:
+    record_changes([(instance.pk, WorkerChange.Action.DELETED, None)])
+
+
+@receiver(workers_bulk_changed, sender=Worker)
+def record_workers_bulk(sender: Any, created=(), updated=(), **kwargs: Any) -> None:
+    record_changes([
+        *((worker.pk, WorkerChange.Action.CREATED, None) for worker in created),
+        *((worker.pk, WorkerChange.Action.UPDATED, previous) for worker, previous in updated),
+    ])
+
+
+@receiver(post_save, sender=Worker)
+def log_worker_saved(sender: Any, instance: Worker, created: bool, update_fields=None, **kwargs: Any) -> None:
+    if created:
+        # Автор из created_by, только если он уже загружен: лог не должен добавлять запросов.
+        by = instance.created_by if Worker.created_by.is_cached(instance) else None
+        log_worker_event('worker_created', instance, by=by)
+    else:
+        log_worker_event('worker_updated', instance, fields=sorted(update_fields) if update_fields else None)
+
+
+@receiver(post_delete, sender=Worker)
+def log_worker_deleted(sender: Any, instance: Worker, **kwargs: Any) -> None:
+    log_worker_event('worker_deleted', instance)
+
+
+@receiver(workers_bulk_changed, sender=Worker)
+def log_workers_bulk(sender: Any, created=(), updated=(), source: str = 'bulk', by=None, **kwargs: Any) -> None:
+    if created:
+        log_bulk_event('workers_bulk_created', (worker.pk for worker in created), by=by, source=source)
+    if updated:
+        fields = sorted({field for _, previous in updated for field in previous})
+        log_bulk_event('workers_bulk_updated', (worker.pk for worker, _ in updated), by=by, source=source, fields=fields)
+
+
+@receiver(post_save, sender=Token)
+@receiver(post_delete, sender=Token)
+def invalidate_token_cache(sender: Any, instance: Token, **kwargs: Any) -> None:
+    AuthCache.invalidate_token(instance.key)
+
+
+@receiver(post_save, sender=get_user_model())
+@receiver(post_delete, sender=get_user_model())
+def invalidate_user_cache(sender: Any, instance: Any, **kwargs: Any) -> None:
+    # Увольнение (is_active=False), смена пароля или прав: следующий запрос загрузит пользователя из базы.
+    AuthCache.invalidate_user(instance.pk)
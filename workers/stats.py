@@ -0,0 +1,91 @@
+from collections import Counter
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+from django.db.models.functions import TruncMonth
+
+from .models import STAT_FIELDS, StatKey, Worker, WorkerStat, hired_month
+
+
+def worker_stat_deltas(
+    created: Iterable[Worker] = (), updated: Iterable[Tuple[Worker, Dict[str, Any]]] = (),
+) -> Counter:
+    """Изменения счётчиков сводки: +1 созданным, перенос из ключа прежних значений в текущий для изменённых."""
+    deltas: Counter = Counter()
+    for worker in created:
+        deltas[worker.stat_key()] += 1
+    for worker, previous in updated:
+        deltas[worker.stat_key(**previous)] -= 1
+        deltas[worker.stat_key()] += 1
+    return deltas
+
+
+def apply_worker_stat_deltas(deltas: Counter) -> None:
+    """Применить изменения к WorkerStat: UPDATE count = count + delta по каждому ключу, новая строка при отсутствии.
+
+    Ключи обходятся в одном порядке, чтобы параллельные транзакции не блокировали строки крест-накрест.
+    """
+    changes = sorted((key, delta) for key, delta in deltas.items() if delta and key[2] is not None)
+    if not changes:
+        return
+    with transaction.atomic():
+        for (position, is_active, month), delta in changes:
+            rows = WorkerStat.objects.filter(position=position, is_active=is_active, hired_month=month)
+            if rows.update(count=F('count') + delta):
+                continue
+            try:
+                with transaction.atomic():
+                    WorkerStat.objects.create(position=position, is_active=is_active, hired_month=month, count=delta)
+            except IntegrityError:
+                # Строку успела создать параллельная транзакция.
+                rows.update(count=F('count') + delta)
+
+
+def rebuild_worker_stats() -> int:
+    """Пересчитать сводку с нуля агрегатом по работникам; вернуть число строк сводки."""
+    totals = (
+        Worker.objects.order_by()
+        .values('position', 'is_active', month=TruncMonth('hired_date'))
+        .annotate(total=Count('id'))
+    )
+    with transaction.atomic():
+        WorkerStat.objects.all().delete()
+        stats = WorkerStat.objects.bulk_create(
+            WorkerStat(position=row['position'], is_active=row['is_active'], hired_month=row['month'], count=row['total'])
+            for row in totals
+        )
+    return len(stats)
+
+
+def worker_stats() -> Dict[str, Any]:
+    """Численность всего, по должностям и по месяцам приёма (active/inactive/total) одним запросом к сводке."""
+    positions: Dict[str, Counter] = {}
+    months: Dict[str, Counter] = {}
+    overall: Counter = Counter()
+    rows = WorkerStat.objects.filter(count__gt=0).values_list('position', 'is_active', 'hired_month', 'count')
+    for position, is_active, month, count in rows:
+        state = 'active' if is_active else 'inactive'
+        for counter in (
+            positions.setdefault(position, Counter()), months.setdefault(f'{month:%Y-%m}', Counter()), overall,
+        ):
+            counter[state] += count
+            counter['total'] += count
+    return {
+        **_counts(overall),
+        'positions': [{'position': position, **_counts(positions[position])} for position in sorted(positions)],
+        'hired_by_month': [{'month': month, **_counts(months[month])} for month in sorted(months)],
+    }
+
+
+def _counts(counter: Counter) -> Dict[str, int]:
+    return {'active': counter['active'], 'inactive': counter['inactive'], 'total': counter['total']}
+
+
+def stored_stat_key(worker: Worker) -> Optional[StatKey]:
+    """Ключ сводки работника в базе: сохранённый при чтении, а для объектов не из базы - запрошенный; None - строки нет."""
+    key = getattr(worker, '_stat_key', None)
+    if key is not None or worker.pk is None:
+        return key
+    row = Worker.objects.filter(pk=worker.pk).values_list(*STAT_FIELDS).first()
+    return (row[0], row[1], hired_month(row[2])) if row else None
@@ -0,0 +1,83 @@
+"""Синтетические работники для бенчмарков и ручных проверок: seed_workers и benchmark_workers."""
+import csv
+import datetime
+import random
+from typing import IO, Any, Dict, Iterable, Iterator, List, Tuple
+
+from openpyxl import Workbook
+
+IMPORT_COLUMNS: Tuple[str, ...] = ('first_name', 'middle_name', 'last_name', 'email', 'position', 'is_active')
+
+# (имя, транслитерация для email); женские формы отчеств и фамилий строятся от тех же основ.
+MALE_NAMES: Tuple[Tuple[str, str], ...] = (
+    ('Александр', 'aleksandr'), ('Дмитрий', 'dmitrii'), ('Максим', 'maksim'), ('Сергей', 'sergei'),
+    ('Андрей', 'andrei'), ('Алексей', 'aleksei'), ('Иван', 'ivan'), ('Михаил', 'mikhail'),
+    ('Егор', 'egor'), ('Никита', 'nikita'), ('Павел', 'pavel'), ('Роман', 'roman'),
+)
+FEMALE_NAMES: Tuple[Tuple[str, str], ...] = (
+    ('Анна', 'anna'), ('Мария', 'mariia'), ('Елена', 'elena'), ('Ольга', 'olga'),
+    ('Наталья', 'natalia'), ('Екатерина', 'ekaterina'), ('Татьяна', 'tatiana'), ('Ирина', 'irina'),
+    ('Дарья', 'daria'), ('Ксения', 'kseniia'), ('Юлия', 'iuliia'), ('Светлана', 'svetlana'),
+)
+PATRONYMIC_STEMS: Tuple[str, ...] = (
+    'Александров', 'Дмитриев', 'Сергеев', 'Андреев', 'Алексеев', 'Иванов', 'Михайлов', 'Павлов', 'Романов',
+)
+SURNAMES: Tuple[Tuple[str, str], ...] = (
+    ('Иванов', 'ivanov'), ('Смирнов', 'smirnov'), ('Кузнецов', 'kuznetsov'), ('Попов', 'popov'),
+    ('Васильев', 'vasilev'), ('Петров', 'petrov'), ('Соколов', 'sokolov'), ('Михайлов', 'mikhailov'),
+    ('Новиков', 'novikov'), ('Фёдоров', 'fedorov'), ('Морозов', 'morozov'), ('Волков', 'volkov'),
+    ('Алексеев', 'alekseev'), ('Лебедев', 'lebedev'), ('Семёнов', 'semenov'), ('Егоров', 'egorov'),
+)
+# Должности с весами: несколько массовых и длинный хвост редких, как в реальном штатном расписании.
+POSITIONS: Tuple[Tuple[str, int], ...] = (
+    ('dev', 30), ('qa', 12), ('support', 15), ('sales', 10), ('analyst', 6), ('devops', 4), ('designer', 4),
+    ('pm', 3), ('hr', 2), ('accountant', 2), ('lawyer', 1), ('lead', 3), ('cto', 1),
+)
+ACTIVE_SHARE = 0.9
+
+
+def generate_workers(count: int, seed: int = 0, email_prefix: str = '') -> Iterator[Dict[str, Any]]:
+    """count работников с русскими ФИО, уникальными email (номер в адресе) и весами должностей; воспроизводимо по seed."""
+    rng = random.Random(seed)
+    positions, weights = zip(*POSITIONS)
+    for number in range(1, count + 1):
+        female = rng.random() < 0.5
+        first_name, first_latin = rng.choice(FEMALE_NAMES if female else MALE_NAMES)
+        last_name, last_latin = rng.choice(SURNAMES)
+        stem = rng.choice(PATRONYMIC_STEMS)
+        yield {
+            'first_name': first_name,
+            'middle_name': stem + ('на' if female else 'ич'),
+            'last_name': last_name + 'а' if female else last_name,
+            'email': f'{email_prefix}{first_latin}.{last_latin}{number}@example.com',
+            'position': rng.choices(positions, weights)[0],
+            'is_active': rng.random() < ACTIVE_SHARE,
+        }
+
+
+def hire_dates(count: int, seed: int = 0, years: int = 5) -> Iterator[datetime.date]:
+    """Даты приёма, равномерно за последние years лет."""
+    rng = random.Random(seed)
+    today = datetime.date.today()
+    for _ in range(count):
+        yield today - datetime.timedelta(days=rng.randrange(years * 365))
+
+
+def write_import_xlsx(workers: Iterable[Dict[str, Any]], file_obj: IO[bytes]) -> None:
+    """Файл импорта .xlsx: строка заголовков IMPORT_COLUMNS и по строке на работника (write-only openpyxl)."""
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('workers')
+    sheet.append(IMPORT_COLUMNS)
+    for worker in workers:
+        sheet.append([worker[column] for column in IMPORT_COLUMNS])
+    workbook.save(file_obj)
+
+
+def write_import_csv(workers: Iterable[Dict[str, Any]], file_obj: IO[str], delimiter: str = ',') -> None:
+    """Файл импорта .csv/.tsv в UTF-8; булевы значения - true/false, как в выгрузке."""
+    writer = csv.writer(file_obj, delimiter=delimiter)
+    writer.writerow(IMPORT_COLUMNS)
+    for worker in workers:
+        row: List[Any] = [worker[column] for column in IMPORT_COLUMNS]
+        row[-1] = 'true' if row[-1] else 'false'
+        writer.writerow(row)
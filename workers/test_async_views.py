@@ -0,0 +1,95 @@
+from django.core.cache import caches
+from django.test import AsyncClient, override_settings
+from django.urls import include, path
+
+from .async_views import worker_detail, worker_list
+from .models import Worker
+from .test_workers import SHARED_CACHES, BaseWorkerCase
+
+urlpatterns = [
+    path('api/workers/', worker_list, name='workers'),
+    path('api/workers/<pk>/', worker_detail, name='worker_id'),
+    path('api/', include('workers.urls')),
+]
+
+
+@override_settings(ROOT_URLCONF=__name__, WORKERS_CACHE_TTL=0, CACHES=SHARED_CACHES, WORKERS_CACHE_ALIAS='shared')
+class TestAsyncReadsCase(BaseWorkerCase):
+    """Async-представления отвечают так же, как синхронные DRF-представления."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        for n in range(4):
+            Worker.objects.create(
+                first_name='Егор', middle_name='Егорович', last_name=f'Егоров{n}', email=f'egor{n}@mail.ru',
+                position='qa', is_active=n % 2 == 0,
+            )
+        self.worker = Worker.objects.get(email='sergei@mail.ru')
+        self.async_client = AsyncClient()
+        caches['shared'].clear()
+
+    async def assert_same(self, url: str, **extra) -> None:
+        with self.settings(ROOT_URLCONF='hr_system.urls'):
+            expected = await self.async_client.get(url, **extra)
+        response = await self.async_client.get(url, **extra)
+        self.assertEqual(response.status_code, expected.status_code)
+        self.assertEqual(response.content, expected.content)
+        self.assertEqual(response.get('ETag'), expected.get('ETag'))
+
+    async def test_list_parity(self) -> None:
+        """Тест: страницы, фильтры и ошибки совпадают с DRF."""
+        for url in (
+            '/api/workers/', '/api/workers/?page=2', '/api/workers/?page=2&page_size=2&is_active=true',
+            '/api/workers/?position=qa&page_size=500', '/api/workers/?page=9', '/api/workers/?page=0',
+            '/api/workers/?is_active=maybe', '/api/workers/?search=Егор', '/api/workers/?pagination=cursor',
+        ):
+            with self.subTest(url=url):
+                await self.assert_same(url)
+
+    async def test_detail_parity(self) -> None:
+        """Тест: карточка, 404 и 304 совпадают с DRF."""
+        for url in (f'/api/workers/{self.worker.id}/', '/api/workers/999/', '/api/workers/abc/'):
+            with self.subTest(url=url):
+                await self.assert_same(url)
+        url = f'/api/workers/{self.worker.id}/'
+        response = await self.async_client.get(url)
+        response = await self.async_client.get(url, headers={'If-None-Match': response['ETag']})
+        self.assertEqual(response.status_code, 304)
+
+    async def test_list_not_modified(self) -> None:
+        """Тест: список отдаёт 304 по If-None-Match."""
+        url = '/api/workers/?is_active=true'
+        response = await self.async_client.get(url)
+        response = await self.async_client.get(url, headers={'If-None-Match': response['ETag']})
+        self.assertEqual(response.status_code, 304)
+
+    async def test_cached_out_of_range_page(self) -> None:
+        """Тест: несуществующая страница при включённом кэше остаётся 404 и у async, и у синхронного списка."""
+        with self.settings(WORKERS_CACHE_TTL=60):
+            for _ in range(2):
+                response = await self.async_client.get('/api/workers/?page=9')
+                self.assertEqual(response.status_code, 404)
+            with self.settings(ROOT_URLCONF='hr_system.urls'):
+                response = await self.async_client.get('/api/workers/?page=9')
+            self.assertEqual(response.status_code, 404)
+
+    def test_writes_are_delegated(self) -> None:
+        """Тест: создание и изменение через async-маршруты выполняют синхронные представления."""
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post('/api/workers/', {
+            'first_name': 'Анна', 'last_name': 'Андреева', 'email': 'anna@mail.ru', 'position': 'pm',
+        })
+        self.assertEqual(response.status_code, 201)
+        response = self.client.patch(f'/api/workers/{self.worker.id}/', {'position': 'lead'})
+        self.assertEqual(response.data['position'], 'lead')
+
+    def test_cached_reads(self) -> None:
+        """Тест: кэш общий с синхронными представлениями и сбрасывается записью."""
+        with self.settings(WORKERS_CACHE_TTL=60):
+            url = f'/api/workers/{self.worker.id}/'
+            self.assertEqual(self.client.get(url).json()['position'], 'dev')
+            Worker.objects.filter(id=self.worker.id).update(position='lead')
+            self.assertEqual(self.client.get(url).json()['position'], 'dev')
+            self.worker.position = 'lead'
+            self.worker.save()
+            self.assertEqual(self.client.get(url).json()['position'], 'lead')
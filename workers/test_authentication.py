@@ -0,0 +1,133 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import MD5PasswordHasher
+from django.core.cache import caches
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from .authentication import AuthCache
+from .models import Worker
+from .test_workers import SHARED_CACHES
+
+AUTH_TABLES = ('"authtoken_token"', '"auth_user"', '"django_session"')
+
+
+
+class CountingHasher(MD5PasswordHasher):
+    """Хэшер, который считает проверки пароля."""
+    verified = 0
+
+    def verify(self, password: str, encoded: str) -> bool:
+        CountingHasher.verified += 1
+        return super().verify(password, encoded)
+
+
+@override_settings(CACHES=SHARED_CACHES, WORKERS_AUTH_CACHE_ALIAS='shared', SESSION_CACHE_ALIAS='shared')
+class TestCachedAuthenticationCase(APITestCase):
+    """Токен и пользователь сессии читаются из кэша и сбрасываются при изменении токена или пользователя."""
+
+    def setUp(self) -> None:
+        caches['shared'].clear()
+        self.user = get_user_model().objects.create_user(username='hr', password='password')
+        self.token = Token.objects.create(user=self.user)
+
+    def auth_queries(self, url: str = '/api/workers/stats/', **headers):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, **headers)
+        return response, [q['sql'] for q in queries.captured_queries if any(t in q['sql'] for t in AUTH_TABLES)]
+
+    def token_get(self, token: Token):
+        return self.auth_queries(HTTP_AUTHORIZATION=f'Token {token.key}')
+
+    def test_token_cached(self) -> None:
+        """Тест: токен и пользователь загружаются одним запросом, повторные запросы - без запросов к auth."""
+        response, queries = self.token_get(self.token)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(queries), 1)
+        for _ in range(2):
+            response, queries = self.token_get(self.token)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(queries, [])
+
+    def test_token_deleted_and_rotated(self) -> None:
+        """Тест: удалённый токен сразу перестаёт действовать, новый токен того же пользователя работает."""
+        self.token_get(self.token)
+        self.token.delete()
+        self.assertEqual(self.token_get(self.token)[0].data['detail'].code, 'authentication_failed')
+        new_token = Token.objects.create(user=self.user)
+        self.assertEqual(self.token_get(new_token)[0].status_code, 200)
+
+    def test_user_deactivated(self) -> None:
+        """Тест: после увольнения пользователя кэшированный токен отклоняется."""
+        self.token_get(self.token)
+        self.user.is_active = False
+        self.user.save()
+        response, _ = self.token_get(self.token)
+        self.assertEqual(response.data['detail'].code, 'authentication_failed')
+
+    def test_write_uses_cached_user(self) -> None:
+        """Тест: запись через токен из кэша подставляет того же пользователя."""
+        self.token_get(self.token)
+        response = self.client.post('/api/workers/', {
+            'first_name': 'Егор', 'last_name': 'Егоров', 'email': 'egor@mail.ru', 'position': 'qa',
+        }, HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Worker.objects.get(email='egor@mail.ru').created_by_id, self.user.pk)
+
+    def test_session_cached(self) -> None:
+        """Тест: с SESSION_ENGINE=cached_db сессия и пользователь не читаются из базы в установившемся режиме."""
+        with self.settings(SESSION_ENGINE='django.contrib.sessions.backends.cached_db'):
+            self.client.login(username='hr', password='password')
+            self.auth_queries()
+            response, queries = self.auth_queries()
+            self.assertEqual(response.wsgi_request.user, self.user)
+            self.assertEqual(queries, [])
+
+            self.user.is_active = False
+            self.user.save()
+            response, _ = self.auth_queries()
+            self.assertFalse(response.wsgi_request.user.is_authenticated)
+
+    def test_cache_content(self) -> None:
+        """Тест: в кэше нет ни ключа токена, ни хэша пароля."""
+        self.token_get(self.token)
+        cached = AuthCache.get_token(self.token.key)
+        self.assertEqual(cached[1], {
+            'id': self.user.pk, 'username': 'hr', 'is_active': True, 'session_hash': self.user.get_session_auth_hash(),
+        })
+        self.assertNotIn(self.token.key, str(cached))
+        self.assertNotIn(self.user.password, str(cached))
+
+    def test_existing_model_backend_session(self) -> None:
+        """Тест: сессия, созданная через ModelBackend до CachedModelBackend, остаётся действительной."""
+        self.client.force_login(self.user, backend='django.contrib.auth.backends.ModelBackend')
+        response, _ = self.auth_queries()
+        self.assertEqual(response.wsgi_request.user, self.user)
+
+    @override_settings(PASSWORD_HASHERS=['workers.test_authentication.CountingHasher'])
+    def test_wrong_password_checked_once(self) -> None:
+        """Тест: неверный пароль не проверяется повторно следующим backend (ModelBackend)."""
+        get_user_model().objects.create_user(username='md5', password='password')
+        CountingHasher.verified = 0
+        self.assertFalse(self.client.login(username='md5', password='wrong'))
+        self.assertEqual(CountingHasher.verified, 1)
+        self.assertTrue(self.client.login(username='md5', password='password'))
+
+    @override_settings(WORKERS_AUTH_CACHE_ALIAS='default')
+    def test_locmem_disabled(self) -> None:
+        """Тест: на locmem кэш выключен - сброс в одном процессе не дошёл бы до остальных."""
+        self.assertFalse(AuthCache.enabled())
+        self.token_get(self.token)
+        response, queries = self.token_get(self.token)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(queries), 1)
+
+    def test_cache_disabled(self) -> None:
+        """Тест: WORKERS_AUTH_CACHE_TTL=0 - токен проверяется по базе на каждом запросе."""
+        with self.settings(WORKERS_AUTH_CACHE_TTL=0):
+            self.token_get(self.token)
+            response, queries = self.token_get(self.token)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(queries), 1)
@@ -0,0 +1,131 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from .models import Worker
+from .test_workers import BaseWorkerCase
+
+
+class TestWorkerBulkCase(BaseWorkerCase):
+    """Тесты массового создания, изменения и увольнения работников."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.client.force_authenticate(user=self.user)
+        self.worker = Worker.objects.get(email='sergei@mail.ru')
+
+    def new_worker(self, n: int, **changes):
+        data = {
+            'first_name': 'Егор', 'middle_name': 'Егорович', 'last_name': f'Егоров{n}',
+            'email': f'egor{n}@mail.ru', 'position': 'qa',
+        }
+        data.update(changes)
+        return data
+
+    def test_bulk_create(self) -> None:
+        """Тест: все работники создаются одним INSERT."""
+        items = [self.new_worker(n) for n in range(20)]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post('/api/workers/bulk/', items, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['created'], 20)
+        self.assertEqual(sum('INSERT INTO "workers_worker"' in q['sql'] for q in queries.captured_queries), 1)
+        worker = Worker.objects.get(id=response.data['results'][5]['id'])
+        self.assertEqual(worker.email, 'egor5@mail.ru')
+        self.assertEqual(worker.created_by, self.user)
+
+    def test_bulk_create_partial(self) -> None:
+        """Тест: невалидные элементы и дубликаты email отмечаются, остальные создаются."""
+        items = [
+            self.new_worker(1),
+            self.new_worker(2, email='bad'),
+            self.new_worker(3, email='egor1@mail.ru'),
+            self.new_worker(4, email='sergei@mail.ru'),
+            'строка',
+        ]
+        response = self.client.post('/api/workers/bulk/', items, format='json')
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual(response.data['created'], 1)
+        self.assertEqual(response.data['errors'], 4)
+        results = response.data['results']
+        self.assertIn('id', results[0])
+        self.assertIn('email', results[1]['errors'])
+        self.assertEqual(results[2]['errors'], {'email': ['Дубликат email в запросе']})
+        self.assertEqual(results[3]['errors'], {'email': ['Email уже существует в базе']})
+        self.assertIn('non_field_errors', results[4]['errors'])
+
+        response = self.client.post('/api/workers/bulk/', [self.new_worker(5, email='')], format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Worker.objects.count(), 2)
+
+    def test_bulk_create_existing_email_case(self) -> None:
+        """Тест: email из базы в другом регистре - ошибка элемента, а не 409 на весь запрос."""
+        Worker.objects.filter(pk=self.worker.pk).update(email='Sergei@mail.ru')
+        items = [self.new_worker(1, email='Sergei@mail.ru'), self.new_worker(2)]
+        response = self.client.post('/api/workers/bulk/', items, format='json')
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual(response.data['results'][0]['errors'], {'email': ['Email уже существует в базе']})
+        self.assertTrue(Worker.objects.filter(email='egor2@mail.ru').exists())
+
+    def test_bulk_limits(self) -> None:
+        """Тест: тело должно быть массивом не длиннее WORKERS_BULK_MAX_ITEMS; нужна авторизация."""
+        self.assertEqual(self.client.post('/api/workers/bulk/', {'a': 1}, format='json').status_code, 400)
+        with self.settings(WORKERS_BULK_MAX_ITEMS=2):
+            items = [self.new_worker(n) for n in range(3)]
+            self.assertEqual(self.client.post('/api/workers/bulk/', items, format='json').status_code, 400)
+        self.client.force_authenticate(user=None)
+        self.assertEqual(self.client.post('/api/workers/bulk/', [], format='json').status_code, 403)
+
+    def test_bulk_update(self) -> None:
+        """Тест: частичное изменение одним UPDATE, без записи неизменённых и с ошибками по элементам."""
+        other = Worker.objects.create(**self.new_worker(1))
+        items = [
+            {'id': self.worker.id, 'position': 'lead'},
+            {'id': other.id, 'position': 'qa'},
+            {'id': 999, 'position': 'lead'},
+            {'id': other.id, 'is_active': False},
+            {'position': 'lead'},
+            {'id': other.id + 1000, 'first_name': ''},
+        ]
+        response = self.client.patch('/api/workers/bulk/', items, format='json')
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual(response.data['updated'], 1)
+        results = response.data['results']
+        self.assertEqual(results[0], {'index': 0, 'id': self.worker.id, 'updated': True})
+        self.assertEqual(results[1], {'index': 1, 'id': other.id, 'updated': False})
+        self.assertIn('не существует', str(results[2]['errors']['id']))
+        self.assertEqual(results[3]['errors'], {'id': ['Дубликат id в запросе']})
+        self.assertIn('id', results[4]['errors'])
+        self.assertIn('first_name', results[5]['errors'])
+
+        self.worker.refresh_from_db()
+        self.assertEqual(self.worker.position, 'lead')
+        self.assertEqual(self.client.get(f'/api/workers/{self.worker.id}/').data['position'], 'lead')
+
+    def test_bulk_deactivate(self) -> None:
+        """Тест увольнения по id и по фильтру одним UPDATE."""
+        response = self.client.post('/api/workers/bulk/', [self.new_worker(n) for n in range(3)], format='json')
+        ids = [result['id'] for result in response.data['results']]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post('/api/workers/bulk/deactivate/', {'ids': ids[:2]}, format='json')
+        self.assertEqual(response.data, {'deactivated': 2, 'ids': ids[:2]})
+        self.assertEqual(sum(q['sql'].startswith('UPDATE "workers_worker"') for q in queries.captured_queries), 1)
+
+        response = self.client.post('/api/workers/bulk/deactivate/', {'position': 'qa'}, format='json')
+        self.assertEqual(response.data, {'deactivated': 1, 'ids': ids[2:]})
+        self.assertTrue(Worker.objects.get(id=self.worker.id).is_active)
+        self.assertEqual(self.client.get('/api/workers/?is_active=false').data['count'], 3)
+
+        response = self.client.post('/api/workers/bulk/deactivate/', {}, format='json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_bulk_deactivate_exact_only(self) -> None:
+        """Тест: увольнение не задевает похожих работников - нет поиска, должность сравнивается точно."""
+        self.client.post('/api/workers/bulk/', [
+            self.new_worker(1, last_name='Иванов'), self.new_worker(2, last_name='Иванова', position='qa-lead'),
+        ], format='json')
+        response = self.client.post('/api/workers/bulk/deactivate/', {'search': 'Иванов'}, format='json')
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post('/api/workers/bulk/deactivate/', {'position': 'qa'}, format='json')
+        self.assertEqual(response.data['deactivated'], 1)
+        self.assertTrue(Worker.objects.get(last_name='Иванова').is_active)
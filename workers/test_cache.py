@@ -0,0 +1,98 @@
+from django.core.cache import caches
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from .models import Worker
+from .services import WorkerService
+from .test_workers import SHARED_CACHES, BaseWorkerCase, make_xlsx
+
+
+@override_settings(CACHES=SHARED_CACHES, WORKERS_CACHE_ALIAS='shared')
+class TestWorkerCacheCase(BaseWorkerCase):
+    """Тесты кэша чтений работников и его сброса при записи."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        caches['shared'].clear()
+        self.worker = Worker.objects.get(email='sergei@mail.ru')
+
+    def assert_cached(self, url: str):
+        """Повторный GET отдаётся без запросов к базе."""
+        first = self.client.get(url)
+        with CaptureQueriesContext(connection) as queries:
+            second = self.client.get(url)
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(second.data, first.data)
+        return second
+
+    def test_detail_cached_and_invalidated_on_update(self) -> None:
+        """Тест: детальная карточка кэшируется и сбрасывается после PATCH."""
+        url = f'/api/workers/{self.worker.id}/'
+        self.assert_cached(url)
+        self.client.force_authenticate(user=self.user)
+        self.client.patch(url, {'position': 'lead'})
+        self.assertEqual(self.client.get(url).data['position'], 'lead')
+
+    def test_list_cached_per_filters(self) -> None:
+        """Тест: страницы списка кэшируются отдельно для разных фильтров."""
+        self.assert_cached('/api/workers/?is_active=true')
+        response = self.client.get('/api/workers/?is_active=false')
+        self.assertEqual(response.data['count'], 0)
+
+    def test_list_invalidated_on_create_and_delete(self) -> None:
+        """Тест: список сбрасывается после создания и удаления работника."""
+        self.assert_cached('/api/workers/')
+        worker = Worker.objects.create(first_name='Егор', last_name='Егоров', email='egor@mail.ru', position='qa')
+        self.assertEqual(self.client.get('/api/workers/').data['count'], 2)
+        worker.delete()
+        self.assertEqual(self.client.get('/api/workers/').data['count'], 1)
+
+    def test_invalidated_on_import(self) -> None:
+        """Тест: импорт (bulk_create и bulk_update) сбрасывает кэш."""
+        url = f'/api/workers/{self.worker.id}/'
+        self.assert_cached(url)
+        self.assert_cached('/api/workers/')
+        rows = [
+            ['Сергей', 'Сергееевич', 'Сергеев', 'sergei@mail.ru', 'lead', True],
+            ['Егор', 'Егорович', 'Егоров', 'egor@mail.ru', 'qa', True],
+        ]
+        WorkerService.import_workers_from_excel(make_xlsx(rows), self.user, mode='upsert')
+        self.assertEqual(self.client.get(url).data['position'], 'lead')
+        self.assertEqual(self.client.get('/api/workers/').data['count'], 2)
+
+    def test_invalidated_on_admin_list_editable(self) -> None:
+        """Тест: правка через list_editable в админке сбрасывает кэш."""
+        url = f'/api/workers/{self.worker.id}/'
+        self.assert_cached(url)
+        admin = type(self.user).objects.create_superuser(username='hr', password='password')
+        self.client.force_login(admin)
+        response = self.client.post('/admin/workers/worker/', {
+            'form-TOTAL_FORMS': '1',
+            'form-INITIAL_FORMS': '1',
+            'form-MIN_NUM_FORMS': '0',
+            'form-MAX_NUM_FORMS': '1000',
+            'form-0-id': str(self.worker.id),
+            'form-0-position': 'lead',
+            '_save': 'Save',
+        })
+        self.assertEqual(response.status_code, 302)
+        self.client.logout()
+        self.assertEqual(self.client.get(url).data['position'], 'lead')
+        self.assertFalse(self.client.get(url).data['is_active'])
+
+    @override_settings(WORKERS_CACHE_ALIAS='default')
+    def test_locmem_disabled(self) -> None:
+        """Тест: на locmem кэш выключен - новое поколение после записи увидел бы только один процесс."""
+        self.client.get('/api/workers/')
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get('/api/workers/')
+        self.assertGreater(len(queries), 0)
+
+    def test_cache_disabled(self) -> None:
+        """Тест: WORKERS_CACHE_TTL=0 отключает кэш."""
+        with self.settings(WORKERS_CACHE_TTL=0):
+            self.client.get('/api/workers/')
+            with CaptureQueriesContext(connection) as queries:
+                self.client.get('/api/workers/')
+        self.assertGreater(len(queries), 0)
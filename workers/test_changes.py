@@ -0,0 +1,176 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.db.models.signals import post_save
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITransactionTestCase
+
+from .models import Worker, WorkerChange
+from .services import WorkerService
+from .signals import workers_bulk_changed
+from .test_workers import BaseWorkerCase, make_xlsx
+
+
+class TestWorkerChangesCase(BaseWorkerCase):
+    """Журнал WorkerChange пополняется при любой записи работников, а /api/workers/changes/ отдаёт дельту."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.client.force_authenticate(user=self.user)
+        self.worker = Worker.objects.get(email='sergei@mail.ru')
+        self.cursor = WorkerChange.objects.latest('seq').seq
+
+    def changes_after(self, cursor: int):
+        return list(
+            WorkerChange.objects.filter(seq__gt=cursor).order_by('seq').values_list('worker_id', 'action', 'fields')
+        )
+
+    def test_api_save_and_delete(self) -> None:
+        """Тест: создание, изменение и удаление через API и модель."""
+        response = self.client.post('/api/workers/', {
+            'first_name': 'Егор', 'last_name': 'Егоров', 'email': 'egor@mail.ru', 'position': 'qa',
+        })
+        created_id = response.data['id']
+        self.client.patch(f'/api/workers/{self.worker.id}/', {'position': 'lead'})
+        self.worker.refresh_from_db()
+        self.worker.first_name = 'Серёжа'
+        self.worker.save(update_fields=['first_name'])
+        self.client.delete(f'/api/workers/{created_id}/')
+        self.assertEqual(self.changes_after(self.cursor), [
+            (created_id, 'created', None),
+            (self.worker.id, 'updated', None),
+            (self.worker.id, 'updated', ['first_name']),
+            (created_id, 'deleted', None),
+        ])
+
+    def test_bulk_import_and_deactivate(self) -> None:
+        """Тест: массовые создание и изменение, увольнение и импорт с upsert пишут изменённые поля."""
+        items = [
+            {'first_name': 'Егор', 'last_name': f'Егоров{n}', 'email': f'egor{n}@mail.ru', 'position': 'qa'}
+            for n in range(2)
+        ]
+        self.client.post('/api/workers/bulk/', items, format='json')
+        ids = list(Worker.objects.filter(position='qa').order_by('id').values_list('id', flat=True))
+        self.client.patch('/api/workers/bulk/', [{'id': ids[0], 'position': 'dev'}], format='json')
+        self.client.post('/api/workers/bulk/deactivate/', {'ids': ids[1:]}, format='json')
+        rows = [
+            ['Сергей', 'Сергееевич', 'Сергеев', 'sergei@mail.ru', 'lead', True],
+            ['Анна', 'Андреевна', 'Андреева', 'anna@mail.ru', 'pm', True],
+        ]
+        WorkerService.import_workers_from_excel(make_xlsx(rows), self.user, mode='upsert')
+        anna = Worker.objects.get(email='anna@mail.ru')
+        self.assertEqual(self.changes_after(self.cursor), [
+            (ids[0], 'created', None),
+            (ids[1], 'created', None),
+            (ids[0], 'updated', ['position']),
+            (ids[1], 'updated', ['is_active']),
+            (anna.id, 'created', None),
+            (self.worker.id, 'updated', ['position']),
+        ])
+
+    def test_admin_list_editable(self) -> None:
+        """Тест: правка через list_editable в админке попадает в журнал."""
+        admin = type(self.user).objects.create_superuser(username='hr', password='password')
+        self.client.force_login(admin)
+        response = self.client.post('/admin/workers/worker/', {
+            'form-TOTAL_FORMS': '1',
+            'form-INITIAL_FORMS': '1',
+            'form-MIN_NUM_FORMS': '0',
+            'form-MAX_NUM_FORMS': '1000',
+            'form-0-id': str(self.worker.id),
+            'form-0-position': 'lead',
+            '_save': 'Save',
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(self.changes_after(self.cursor), [(self.worker.id, 'updated', None)])
+
+    def test_seed_command(self) -> None:
+        """Тест: seed_workers пишет события created по каждому работнику."""
+        call_command('seed_workers', '3', '--email-prefix', 'seed.', stdout=StringIO())
+        changes = self.changes_after(self.cursor)
+        self.assertEqual([action for _, action, _ in changes], ['created'] * 3)
+        self.assertEqual(
+            sorted(worker_id for worker_id, _, _ in changes),
+            list(Worker.objects.filter(email__startswith='seed.').order_by('id').values_list('id', flat=True)),
+        )
+
+    def test_endpoint_cursor(self) -> None:
+        """Тест: страницы по limit, курсор следующего запроса, текущее состояние и удалённые работники."""
+        first = Worker.objects.create(first_name='Егор', last_name='Егоров', email='egor@mail.ru', position='qa')
+        second = Worker.objects.create(first_name='Анна', last_name='Андреева', email='anna@mail.ru', position='qa')
+        second_id = second.id
+        second.delete()
+
+        response = self.client.get('/api/workers/changes/', {'since': self.cursor, 'limit': 2})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data['has_more'])
+        changes = response.data['changes']
+        self.assertEqual([(c['id'], c['action']) for c in changes], [(first.id, 'created'), (second_id, 'created')])
+        self.assertEqual(changes[0]['worker'], self.client.get(f'/api/workers/{first.id}/').json())
+        self.assertIsNone(changes[1]['worker'])
+        self.assertEqual(response.data['cursor'], changes[1]['seq'])
+
+        response = self.client.get('/api/workers/changes/', {'since': response.data['cursor']})
+        self.assertFalse(response.data['has_more'])
+        self.assertEqual([(c['id'], c['action']) for c in response.data['changes']], [(second_id, 'deleted')])
+
+        cursor = response.data['cursor']
+        response = self.client.get('/api/workers/changes/', {'since': cursor})
+        self.assertEqual(response.data, {'changes': [], 'cursor': cursor, 'has_more': False})
+
+    def test_endpoint_full_sync(self) -> None:
+        """Тест: без since лента начинается с начала журнала."""
+        response = self.client.get('/api/workers/changes/')
+        self.assertEqual([(c['id'], c['action']) for c in response.data['changes']], [(self.worker.id, 'created')])
+
+    def test_endpoint_queries(self) -> None:
+        """Тест: страница читается двумя запросами независимо от числа изменений."""
+        for n in range(5):
+            Worker.objects.create(first_name='Егор', last_name='Егоров', email=f'egor{n}@mail.ru', position='qa')
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/workers/changes/', {'since': self.cursor})
+        self.assertEqual(len(response.data['changes']), 5)
+        self.assertEqual(len(queries), 2)
+
+    def test_endpoint_invalid_params(self) -> None:
+        """Тест: некорректный курсор - 400, limit ограничен WORKERS_CHANGES_MAX_PAGE_SIZE."""
+        self.assertEqual(self.client.get('/api/workers/changes/', {'since': 'abc'}).status_code, 400)
+        self.assertEqual(self.client.get('/api/workers/changes/', {'since': -1}).status_code, 400)
+        self.assertEqual(self.client.get('/api/workers/changes/', {'limit': 0}).status_code, 400)
+        for n in range(2):
+            Worker.objects.create(first_name='Егор', last_name='Егоров', email=f'egor{n}@mail.ru', position='qa')
+        with self.settings(WORKERS_CHANGES_MAX_PAGE_SIZE=2):
+            response = self.client.get('/api/workers/changes/', {'limit': 1000})
+        self.assertEqual(len(response.data['changes']), 2)
+        self.assertTrue(response.data['has_more'])
+
+
+def fail_after_journal(**kwargs) -> None:
+    raise RuntimeError('сбой после записи журнала')
+
+
+class TestWorkerChangesAtomicCase(APITransactionTestCase):
+    """Работник и событие журнала пишутся одной транзакцией и вне транзакции запроса (autocommit)."""
+
+    def test_save_rolled_back_with_journal(self) -> None:
+        """Тест: сбой в post_save после журнала откатывает и работника, и событие."""
+        post_save.connect(fail_after_journal, sender=Worker, dispatch_uid='fail_after_journal')
+        self.addCleanup(post_save.disconnect, sender=Worker, dispatch_uid='fail_after_journal')
+        with self.assertRaises(RuntimeError):
+            Worker.objects.create(first_name='Егор', last_name='Егоров', email='egor@mail.ru', position='qa')
+        self.assertFalse(Worker.objects.exists())
+        self.assertFalse(WorkerChange.objects.exists())
+
+    def test_bulk_rolled_back_with_journal(self) -> None:
+        """Тест: сбой при рассылке workers_bulk_changed откатывает массовое создание вместе с журналом."""
+        workers_bulk_changed.connect(fail_after_journal, sender=Worker, dispatch_uid='fail_after_journal')
+        self.addCleanup(workers_bulk_changed.disconnect, sender=Worker, dispatch_uid='fail_after_journal')
+        self.client.force_authenticate(user=get_user_model().objects.create_user(username='hr', password='password'))
+        with self.assertRaises(RuntimeError):
+            self.client.post('/api/workers/bulk/', [
+                {'first_name': 'Егор', 'last_name': 'Егоров', 'email': 'egor@mail.ru', 'position': 'qa'},
+            ], format='json')
+        self.assertFalse(Worker.objects.exists())
+        self.assertFalse(WorkerChange.objects.exists())
@@ -0,0 +1,82 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+
+from .models import Worker
+from .services import WorkerService
+from .test_workers import BaseWorkerCase
+
+
+class TestExplainWorkerQueriesCase(BaseWorkerCase):
+    """Тесты команды explain_worker_queries."""
+
+    def test_explain_default_paths(self) -> None:
+        """Тест: план строится для каждого запроса списка, карточки и фильтров админки."""
+        Worker.objects.update(created_by=self.user)
+        out = StringIO()
+        call_command('explain_worker_queries', stdout=out, no_color=True)
+        output = out.getvalue()
+        for heading in (
+            'GET /api/workers/\n', 'GET /api/workers/?is_active=false', 'GET /api/workers/?search=',
+            'GET /api/workers/?position=dev&is_active=true', 'admin: created_by', 'admin: hired_date',
+        ):
+            self.assertIn(heading, output)
+        self.assertIn('workers_position_active_id', output)
+
+    def test_explain_path(self) -> None:
+        """Тест: можно передать свой адрес."""
+        worker = Worker.objects.get()
+        out = StringIO()
+        call_command('explain_worker_queries', f'/api/workers/{worker.id}/', stdout=out, no_color=True)
+        self.assertIn(f'GET /api/workers/{worker.id}/', out.getvalue())
+        self.assertIn('SELECT', out.getvalue())
+
+
+class TestBenchmarkCommandsCase(BaseWorkerCase):
+    """Тесты команд seed_workers и benchmark_workers."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_seed_workers(self) -> None:
+        """Тест: работники и файлы импорта с теми же строками; повтор с тем же seed - ошибка."""
+        xlsx, csv = os.path.join(self.tmp.name, 'w.xlsx'), os.path.join(self.tmp.name, 'w.csv')
+        call_command('seed_workers', '30', '--xlsx', xlsx, '--csv', csv, '--batch-size', '7', stdout=StringIO())
+        self.assertEqual(Worker.objects.count(), 31)
+        self.assertEqual(WorkerService.get_worker_stats()['total'], 31)
+        self.assertGreater(Worker.objects.values('hired_date').distinct().count(), 1)
+        for path in (xlsx, csv):
+            with open(path, 'rb') as file_obj:
+                upload = SimpleUploadedFile(os.path.basename(path), file_obj.read())
+            result = WorkerService.import_workers(upload, self.user, mode='upsert')
+            self.assertEqual((result['total'], result['unchanged'], result['errors']), (30, 30, []))
+        with self.assertRaises(CommandError):
+            call_command('seed_workers', '5', stdout=StringIO())
+
+    def test_benchmark_workers(self) -> None:
+        """Тест: JSON с метриками по каждому бенчмарку; импорт откатывается; сравнение с прошлым запуском."""
+        call_command('seed_workers', '60', stdout=StringIO())
+        output = os.path.join(self.tmp.name, 'result.json')
+        options = {'requests': 3, 'import_sizes': '20', 'stdout': StringIO(), 'stderr': StringIO()}
+        call_command('benchmark_workers', output=output, **options)
+        call_command('benchmark_workers', output=output + '.2', compare=output, **options)
+        with open(output + '.2', encoding='utf-8') as file_obj:
+            report = json.load(file_obj)
+        self.assertEqual(report['meta']['workers'], 61)
+        self.assertEqual(Worker.objects.count(), 61)
+        results = {result['name']: result for result in report['results']}
+        self.assertEqual(set(results), {
+            'list_first_page', 'list_middle_page', 'list_last_page', 'list_inactive', 'list_position_active',
+            'list_cursor', 'detail', 'import_xlsx_20',
+        })
+        for key in ('requests_per_sec', 'p50_ms', 'p99_ms', 'queries_per_request', 'peak_rss_kb'):
+            self.assertIn(key, results['list_last_page'])
+        self.assertEqual(results['import_xlsx_20']['rows'], 20)
+        self.assertGreater(results['import_xlsx_20']['queries'], 0)
+        self.assertEqual(len(report['compare']), len(results))
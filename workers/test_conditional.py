@@ -0,0 +1,88 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils.http import http_date
+
+from .models import Worker
+from .test_workers import BaseWorkerCase
+
+
+class TestConditionalRequestsCase(BaseWorkerCase):
+    """Тесты ETag/Last-Modified и условных запросов."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.worker = Worker.objects.get(email='sergei@mail.ru')
+        self.url = f'/api/workers/{self.worker.id}/'
+
+    def test_detail_not_modified(self) -> None:
+        """Тест: повторный GET с If-None-Match/If-Modified-Since возвращает 304."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Last-Modified', response)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+        last_modified = self.client.get(self.url)['Last-Modified']
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+
+    def test_detail_etag_changes_on_update(self) -> None:
+        """Тест: после изменения старый ETag больше не совпадает."""
+        etag = self.client.get(self.url)['ETag']
+        self.client.force_authenticate(user=self.user)
+        response = self.client.patch(self.url, {'position': 'lead'})
+        self.assertNotEqual(response['ETag'], etag)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['position'], 'lead')
+
+    def test_if_match(self) -> None:
+        """Тест: PATCH с устаревшим If-Match отклоняется с 412, с актуальным - применяется."""
+        etag = self.client.get(self.url)['ETag']
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.patch(self.url, {'position': 'lead'}, HTTP_IF_MATCH='"stale"')
+        self.assertEqual(response.status_code, 412)
+        self.worker.refresh_from_db()
+        self.assertEqual(self.worker.position, 'dev')
+
+        response = self.client.patch(self.url, {'position': 'lead'}, HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        response = self.client.patch(self.url, {'position': 'qa'}, HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, 412)
+
+    def test_list_not_modified(self) -> None:
+        """Тест: список отдаёт 304 до изменения набора и 200 после удаления."""
+        etag = self.client.get('/api/workers/')['ETag']
+        response = self.client.get('/api/workers/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertNotEqual(self.client.get('/api/workers/?is_active=false')['ETag'], etag)
+
+        self.worker.delete()
+        response = self.client.get('/api/workers/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 0)
+
+    def test_list_not_modified_without_page_query(self) -> None:
+        """Тест: 304 списка не читает страницу - только версия набора, без COUNT и выборки работников."""
+        etag = self.client.get('/api/workers/')['ETag']
+        with self.settings(WORKERS_CACHE_TTL=0), CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/workers/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertFalse([q['sql'] for q in queries.captured_queries if 'COUNT' in q['sql'] or 'LIMIT 3' in q['sql']])
+
+    def test_list_last_modified(self) -> None:
+        """Тест: Last-Modified списка - время последнего изменения; If-Modified-Since даёт 304 до удаления."""
+        response = self.client.get('/api/workers/?is_active=true')
+        self.assertEqual(response['Last-Modified'], http_date(int(self.worker.updated_at.timestamp())))
+        last_modified = response['Last-Modified']
+        response = self.client.get('/api/workers/?is_active=true', HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+
+        self.worker.delete()
+        response = self.client.get('/api/workers/?is_active=true', HTTP_IF_MODIFIED_SINCE=http_date(0))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 0)
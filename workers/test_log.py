@@ -0,0 +1,114 @@
+import io
+import json
+import logging
+import threading
+
+from django.test import SimpleTestCase
+
+from .log import JSONFormatter, QueueLogHandler
+from .models import Worker
+from .test_workers import BaseWorkerCase, make_xlsx
+
+
+class _Lazy:
+    """Аргумент лога, который запоминает поток, в котором его превратили в строку."""
+
+    def __init__(self) -> None:
+        self.thread = None
+
+    def __str__(self) -> str:
+        self.thread = threading.current_thread()
+        return 'lazy'
+
+
+class TestQueueLogHandlerCase(SimpleTestCase):
+    """Тесты очереди логов и JSON-форматтера."""
+
+    def make_handler(self, maxsize: int = 100) -> QueueLogHandler:
+        self.stream = io.StringIO()
+        handler = QueueLogHandler(self.stream, maxsize=maxsize)
+        handler.setFormatter(JSONFormatter())
+        self.addCleanup(handler.close)
+        return handler
+
+    def make_logger(self, handler: logging.Handler) -> logging.Logger:
+        logger = logging.getLogger(f'workers.tests.{id(handler)}')
+        logger.propagate = False
+        logger.addHandler(handler)
+        self.addCleanup(logger.removeHandler, handler)
+        return logger
+
+    def test_json_lazy_formatting(self) -> None:
+        """Тест: одна JSON-строка на запись с полями extra; сообщение собирается в потоке слушателя."""
+        handler = self.make_handler()
+        logger = self.make_logger(handler)
+        lazy = _Lazy()
+        logger.info('worker %s: %s', 1, lazy, extra={'event': 'worker_created', 'worker_id': 1})
+        try:
+            raise ValueError('ошибка')
+        except ValueError:
+            logger.exception('failed')
+        handler.stop()
+        lines = [json.loads(line) for line in self.stream.getvalue().splitlines()]
+        self.assertEqual(lines[0]['message'], 'worker 1: lazy')
+        self.assertEqual((lines[0]['event'], lines[0]['worker_id'], lines[0]['level']), ('worker_created', 1, 'INFO'))
+        self.assertIsNot(lazy.thread, threading.current_thread())
+        self.assertIn('ValueError: ошибка', lines[1]['exc_info'])
+
+    def test_full_queue_drops(self) -> None:
+        """Тест: при переполненной очереди записи отбрасываются без ожидания."""
+        handler = self.make_handler(maxsize=1)
+        handler.stop()
+        logger = self.make_logger(handler)
+        for number in range(3):
+            logger.warning('record %d', number)
+        self.assertEqual(handler.dropped, 2)
+
+
+class TestWorkerEventsCase(BaseWorkerCase):
+    """Тесты событий жизненного цикла работников в логгере workers.events."""
+
+    def events(self, run) -> list:
+        with self.assertLogs('workers.events', level='INFO') as logs:
+            run()
+        return [(record.event, record) for record in logs.records]
+
+    def test_api_events(self) -> None:
+        """Тест: создание, изменение и удаление через API с автором из токена/сессии и адресом запроса."""
+        self.client.force_authenticate(user=self.user)
+        records = self.events(lambda: self.client.post('/api/workers/', {
+            'first_name': 'Егор', 'last_name': 'Егоров', 'email': 'egor@mail.ru', 'position': 'qa',
+        }))
+        self.assertEqual(records[0][0], 'worker_created')
+        self.assertEqual((records[0][1].by, records[0][1].path), ('admin', '/api/workers/'))
+        worker = Worker.objects.get(email='egor@mail.ru')
+        records = self.events(lambda: self.client.patch(f'/api/workers/{worker.id}/', {'position': 'lead'}))
+        self.assertEqual([(event, record.worker_id, record.method) for event, record in records],
+                         [('worker_updated', worker.id, 'PATCH')])
+        records = self.events(lambda: self.client.delete(f'/api/workers/{worker.id}/'))
+        self.assertEqual(records[0][0], 'worker_deleted')
+
+    def test_admin_events(self) -> None:
+        """Тест: правка в админке пишет событие с автором из сессии."""
+        admin = type(self.user).objects.create_superuser(username='hr', password='password')
+        self.client.force_login(admin)
+        worker = Worker.objects.get()
+        records = self.events(lambda: self.client.post(f'/admin/workers/worker/{worker.id}/delete/', {'post': 'yes'}))
+        self.assertEqual([(event, record.by) for event, record in records], [('worker_deleted', 'hr')])
+
+    def test_bulk_events_aggregated(self) -> None:
+        """Тест: массовые операции и импорт - одна запись на операцию с числом и выборкой id."""
+        self.client.force_authenticate(user=self.user)
+        items = [
+            {'first_name': 'Егор', 'last_name': f'Егоров{n}', 'email': f'egor{n}@mail.ru', 'position': 'qa'}
+            for n in range(15)
+        ]
+        records = self.events(lambda: self.client.post('/api/workers/bulk/', items, format='json'))
+        self.assertEqual(len(records), 1)
+        event, record = records[0]
+        self.assertEqual((event, record.count, len(record.sample_ids), record.source), ('workers_bulk_created', 15, 10, 'bulk'))
+
+        rows = [['Анна', 'Андреевна', 'Андреева', 'anna@mail.ru', 'pm', True]]
+        records = self.events(lambda: self.client.post('/api/workers/import/', {'file': make_xlsx(rows)}, format='multipart'))
+        self.assertEqual([event for event, _ in records], ['workers_bulk_created', 'workers_imported'])
+        self.assertEqual((records[1][1].added, records[1][1].by), (1, 'admin'))
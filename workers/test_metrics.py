@@ -0,0 +1,88 @@
+import re
+
+from django.core.cache import caches
+from django.db import connection
+from django.test import AsyncClient, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from prometheus_client import REGISTRY
+
+from .models import Worker
+from .test_workers import SHARED_CACHES, BaseWorkerCase, make_xlsx
+
+
+def sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestRequestMetricsCase(BaseWorkerCase):
+    """Тесты Server-Timing и метрик Prometheus по запросам API работников."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.worker = Worker.objects.get(email='sergei@mail.ru')
+
+    def test_server_timing_counts_queries(self) -> None:
+        """Тест: число SQL в Server-Timing совпадает с фактическим, время - в миллисекундах."""
+        with self.settings(WORKERS_CACHE_TTL=0), CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/workers/')
+        timing = response['Server-Timing']
+        self.assertIn(f'desc="{len(queries)} queries"', timing)
+        self.assertRegex(timing, r'^db;dur=[\d.]+;desc="\d+ queries", render;dur=[\d.]+, total;dur=[\d.]+$')
+
+    def test_route_metrics(self) -> None:
+        """Тест: латентность, коды ответов и SQL по шаблону маршрута, а не по конкретному адресу."""
+        route = 'api/workers/<pk>/'
+        before = sample('workers_http_requests_total', route=route, method='GET', status='404')
+        count_before = sample('workers_http_request_duration_seconds_count', route=route, method='GET')
+        self.client.get(f'/api/workers/{self.worker.id}/')
+        self.client.get('/api/workers/999/')
+        self.assertEqual(sample('workers_http_requests_total', route=route, method='GET', status='404'), before + 1)
+        self.assertEqual(
+            sample('workers_http_request_duration_seconds_count', route=route, method='GET'), count_before + 2,
+        )
+        self.assertGreater(sample('workers_http_request_db_queries_count', route=route), 0)
+
+    @override_settings(CACHES=SHARED_CACHES, WORKERS_CACHE_ALIAS='shared')
+    def test_cache_metrics(self) -> None:
+        """Тест: попадания и промахи кэша считаются."""
+        caches['shared'].clear()
+        hits, misses = sample('workers_cache_requests_total', result='hit'), sample('workers_cache_requests_total', result='miss')
+        self.client.get(f'/api/workers/{self.worker.id}/')
+        self.client.get(f'/api/workers/{self.worker.id}/')
+        self.assertEqual(sample('workers_cache_requests_total', result='miss'), misses + 1)
+        self.assertEqual(sample('workers_cache_requests_total', result='hit'), hits + 1)
+
+    def test_import_metrics(self) -> None:
+        """Тест: строки импорта по результату и время разбора файла в Server-Timing."""
+        added, errors = sample('workers_import_rows_total', result='added'), sample('workers_import_rows_total', result='error')
+        self.client.force_authenticate(user=self.user)
+        rows = [
+            ['Егор', 'Егорович', 'Егоров', 'egor@mail.ru', 'qa', True],
+            ['Анна', 'Андреевна', 'Андреева', 'не email', 'pm', True],
+        ]
+        response = self.client.post('/api/workers/import/', {'file': make_xlsx(rows)}, format='multipart')
+        self.assertRegex(response['Server-Timing'], r'parse;dur=[\d.]+')
+        self.assertEqual(sample('workers_import_rows_total', result='added'), added + 1)
+        self.assertEqual(sample('workers_import_rows_total', result='error'), errors + 1)
+        self.assertGreater(sample('workers_import_rows_per_second_count'), 0)
+
+    def test_metrics_endpoint(self) -> None:
+        """Тест: /metrics в формате Prometheus; сам он, админка и токены не замеряются."""
+        self.client.get('/api/workers/')
+        response = self.client.get('/metrics')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        self.assertRegex(
+            response.content.decode(),
+            re.escape('workers_http_request_duration_seconds_count{method="GET",route="api/workers/"}'),
+        )
+        self.assertNotIn('Server-Timing', response)
+        self.assertNotIn('Server-Timing', self.client.get('/admin/login/'))
+
+    @override_settings(ROOT_URLCONF='workers.test_async_views', WORKERS_CACHE_TTL=0)
+    async def test_async_view_queries(self) -> None:
+        """Тест: SQL async-представлений (в потоках sync_to_async) тоже попадает в Server-Timing."""
+        response = await AsyncClient().get('/api/workers/')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('desc="3 queries"', response['Server-Timing'])
@@ -0,0 +1,109 @@
+import datetime
+import decimal
+import json
+import time
+import uuid
+
+from django.utils.translation import gettext_lazy
+
+from rest_framework.exceptions import ErrorDetail
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+
+from .models import Worker
+from .renderers import FastJSONRenderer
+from .serializers import WorkerListCreateSerializer, WorkerRetrieveSerializer
+from .services import WorkerService
+from .test_workers import BaseWorkerCase
+
+
+class TestFastJSONRendererCase(BaseWorkerCase):
+    """Быстрый путь сериализации отдаёт те же байты, что сериализаторы и JSONRenderer DRF."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        Worker.objects.create(
+            first_name='Анна', last_name='Андреева\u2028"\\', email='anna@mail.ru', position='pm\u2029 😀',
+            is_active=False,
+        )
+        self.request = APIRequestFactory().get('/api/workers/')
+        self.request.method = 'GET'
+
+    def test_render_parity(self) -> None:
+        """Тест: одинаковый вывод для строк, дат, Decimal, UUID, ленивых строк и ошибок."""
+        data = {
+            'text': 'Сергей "\\ \u2028\u2029 \x00 😀',
+            'numbers': [0, -1, 2 ** 53, True, False, None],
+            'moment': datetime.datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.timezone.utc),
+            'naive': datetime.datetime(2024, 1, 2, 3, 4, 5),
+            'day': datetime.date(2024, 1, 2),
+            'time': datetime.time(3, 4, 5, 123456),
+            'delta': datetime.timedelta(seconds=90),
+            'decimal': decimal.Decimal('1.50'),
+            'uuid': uuid.UUID(int=1),
+            'lazy': gettext_lazy('Active'),
+            'error': ErrorDetail('Некорректно', code='invalid'),
+            'nested': [{'a': ()}, {}],
+            'big': 2 ** 70,
+            1: 'int key',
+        }
+        for value in (data, [], {}, 'строка', None):
+            self.assertEqual(FastJSONRenderer().render(value), JSONRenderer().render(value))
+        for media_type in ('application/json; indent=2', 'application/json'):
+            self.assertEqual(
+                FastJSONRenderer().render(data, media_type, {'indent': 4}),
+                JSONRenderer().render(data, media_type, {'indent': 4}),
+            )
+
+    def test_list_rows_parity(self) -> None:
+        """Тест: строки списка из values() совпадают с WorkerListCreateSerializer."""
+        rows = list(WorkerService.get_workers_for_read())
+        workers = list(WorkerService.get_workers())
+        expected = WorkerListCreateSerializer(workers, many=True, context={'request': self.request}).data
+        self.assertEqual(
+            FastJSONRenderer().render(WorkerListCreateSerializer.represent_rows(rows)), JSONRenderer().render(expected),
+        )
+
+    def test_detail_parity(self) -> None:
+        """Тест: карточка и строка values_list совпадают с WorkerRetrieveSerializer."""
+        _, columns, _ = WorkerRetrieveSerializer.row_layout()
+        rows = dict((row[0], row) for row in Worker.objects.values_list(*columns))
+        for worker in Worker.objects.all():
+            expected = JSONRenderer().render(WorkerRetrieveSerializer(worker).data)
+            self.assertEqual(FastJSONRenderer().render(WorkerRetrieveSerializer.represent(worker)), expected)
+            self.assertEqual(FastJSONRenderer().render(WorkerRetrieveSerializer.represent_row(rows[worker.pk])), expected)
+
+    def test_export_ndjson_matches_detail(self) -> None:
+        """Тест: строки NDJSON выгрузки байт в байт равны телу карточки."""
+        response = self.client.get('/api/workers/export/', HTTP_ACCEPT='application/x-ndjson')
+        lines = b''.join(response.streaming_content).splitlines()
+        self.assertEqual(len(lines), 2)
+        for line in lines:
+            self.assertEqual(line, self.client.get(f'/api/workers/{json.loads(line)["id"]}/').content)
+
+    def test_microbenchmark(self) -> None:
+        """Микробенчмарк: быстрый путь списка и карточки не медленнее сериализаторов DRF."""
+        Worker.objects.bulk_create(
+            Worker(first_name='Егор', last_name=f'Егоров{n}', email=f'egor{n}@mail.ru', position='qa')
+            for n in range(500)
+        )
+        rows = list(WorkerService.get_workers_for_read())
+        workers = list(WorkerService.get_workers())
+
+        def best(run, repeat: int = 5) -> float:
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                run()
+                timings.append(time.perf_counter() - started)
+            return min(timings)
+
+        slow = best(lambda: (
+            JSONRenderer().render(WorkerListCreateSerializer(rows, many=True, context={'request': self.request}).data),
+            [JSONRenderer().render(WorkerRetrieveSerializer(worker).data) for worker in workers],
+        ))
+        fast = best(lambda: (
+            FastJSONRenderer().render(WorkerListCreateSerializer.represent_rows(rows)),
+            [FastJSONRenderer().render(WorkerRetrieveSerializer.represent(worker)) for worker in workers],
+        ))
+        self.assertLess(fast, slow)
@@ -0,0 +1,142 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework.test import APITransactionTestCase
+
+from .models import Worker
+from .test_workers import SHARED_CACHES
+from .routers import PRIMARY_COOKIE, ReplicaRoutingMiddleware, WorkerReplicaRouter, routing
+
+
+@override_settings(WORKERS_READ_REPLICAS=['replica_1'], WORKERS_READ_FROM_PRIMARY=False)
+class TestWorkerReplicaRouterCase(SimpleTestCase):
+    """Тесты выбора базы роутером и middleware."""
+
+    def setUp(self) -> None:
+        self.router = WorkerReplicaRouter()
+
+    def test_reads_outside_request_use_primary(self) -> None:
+        """Тест: импорт, задачи и команды (вне запроса) читают с primary."""
+        self.assertIsNone(self.router.db_for_read(Worker))
+
+    def test_read_then_write(self) -> None:
+        """Тест: GET читает с реплики, а после записи в том же запросе - с primary."""
+        with routing(replicas_allowed=True):
+            self.assertEqual(self.router.db_for_read(Worker), 'replica_1')
+            self.assertIsNone(self.router.db_for_read(get_user_model()))
+            self.router.db_for_write(Worker)
+            self.assertIsNone(self.router.db_for_read(Worker))
+
+    def test_pin_to_primary(self) -> None:
+        """Тест: WORKERS_READ_FROM_PRIMARY отключает реплики."""
+        with self.settings(WORKERS_READ_FROM_PRIMARY=True), routing(replicas_allowed=True):
+            self.assertIsNone(self.router.db_for_read(Worker))
+
+    def test_no_migrations_on_replicas(self) -> None:
+        self.assertFalse(self.router.allow_migrate('replica_1', 'workers'))
+        self.assertIsNone(self.router.allow_migrate('default', 'workers'))
+
+    def test_middleware(self) -> None:
+        """Тест: реплики только для безопасных методов и без недавней записи клиента."""
+        middleware = ReplicaRoutingMiddleware(lambda request: None)
+        factory = RequestFactory()
+        self.assertTrue(middleware.replicas_allowed(factory.get('/api/workers/')))
+        self.assertFalse(middleware.replicas_allowed(factory.post('/api/workers/')))
+        request = factory.get('/api/workers/')
+        request.COOKIES[PRIMARY_COOKIE] = '9999999999'
+        self.assertFalse(middleware.replicas_allowed(request))
+        request.COOKIES[PRIMARY_COOKIE] = 'x'
+        self.assertTrue(middleware.replicas_allowed(request))
+
+
+MIRROR_ALIAS = 'replica_test'
+
+
+@override_settings(CACHES=SHARED_CACHES, WORKERS_CACHE_ALIAS='shared')
+class TestReplicaReadsCase(APITransactionTestCase):
+    """Чтения API через реплику-зеркало default и прилипание к primary после записи.
+
+    Реплику изображает отдельное соединение replica_test к тестовой базе default (как TEST['MIRROR']),
+    которое тест добавляет на время своего выполнения. Данные видны через него после коммита, поэтому
+    это APITransactionTestCase.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Раннер создаёт тестовые базы до setUpClass, поэтому зеркало добавляется после: к уже созданной default.
+        super().setUpClass()
+        default = connections[DEFAULT_DB_ALIAS].settings_dict
+        connections.settings[MIRROR_ALIAS] = {**default, 'TEST': {**default['TEST'], 'MIRROR': DEFAULT_DB_ALIAS}}
+        cls.databases = cls.databases | {MIRROR_ALIAS}
+        cls.addClassCleanup(cls.remove_mirror)
+
+    @classmethod
+    def remove_mirror(cls) -> None:
+        connections[MIRROR_ALIAS].close()
+        del connections[MIRROR_ALIAS]
+        del connections.settings[MIRROR_ALIAS]
+
+    def setUp(self) -> None:
+        caches['shared'].clear()
+        self.replica = MIRROR_ALIAS
+        self.enterContext(self.settings(WORKERS_READ_REPLICAS=[self.replica], WORKERS_READ_FROM_PRIMARY=False))
+        self.user = get_user_model().objects.create_user(username='admin', password='password')
+        self.worker = Worker.objects.create(
+            first_name='Сергей', middle_name='Сергеевич', last_name='Сергеев', email='sergei@mail.ru', position='dev',
+        )
+
+    def get(self, url: str, cache_ttl: int = 0, **extra):
+        with self.settings(WORKERS_CACHE_TTL=cache_ttl), \
+                CaptureQueriesContext(connections['default']) as primary, \
+                CaptureQueriesContext(connections[self.replica]) as replica:
+            response = self.client.get(url, **extra)
+            if response.streaming:
+                b''.join(response.streaming_content)
+        self.assertEqual(response.status_code, 200)
+        return response, len(primary), len(replica)
+
+    def test_get_reads_from_replica(self) -> None:
+        """Тест: список, карточка и выгрузка читаются с реплики."""
+        for url in ('/api/workers/', f'/api/workers/{self.worker.id}/', '/api/workers/export/?format=csv'):
+            with self.subTest(url=url):
+                response, primary, replica = self.get(url)
+                self.assertEqual(primary, 0)
+                self.assertGreater(replica, 0)
+
+    def test_reads_after_write_use_primary(self) -> None:
+        """Тест: после записи клиент получает cookie и читает с primary."""
+        self.client.force_authenticate(user=self.user)
+        response = self.client.patch(f'/api/workers/{self.worker.id}/', {'position': 'lead'})
+        self.assertIn(PRIMARY_COOKIE, response.cookies)
+
+        response, primary, replica = self.get(f'/api/workers/{self.worker.id}/')
+        self.assertEqual(response.data['position'], 'lead')
+        self.assertGreater(primary, 0)
+        self.assertEqual(replica, 0)
+
+    def test_cache_after_write(self) -> None:
+        """Тест: прилипший к primary клиент читает мимо кэша, чтения с реплики не кэшируются сразу после записи."""
+        url = f'/api/workers/{self.worker.id}/'
+        with self.settings(WORKERS_PRIMARY_STICKY_SECONDS=0):
+            self.get(url, cache_ttl=60)
+            self.assertEqual(self.get(url, cache_ttl=60)[1:], (0, 0))
+
+        writer = self.client_class()
+        writer.force_authenticate(user=self.user)
+        response = writer.patch(url, {'position': 'lead'})
+        self.assertIn(PRIMARY_COOKIE, response.cookies)
+        for _ in range(2):
+            response, primary, replica = self.get(url, cache_ttl=60, HTTP_COOKIE=f'{PRIMARY_COOKIE}=9999999999')
+            self.assertEqual(response.data['position'], 'lead')
+            self.assertGreater(primary, 0)
+            self.assertEqual(replica, 0)
+
+        self.client.cookies.clear()
+        for _ in range(2):
+            self.assertGreater(self.get(url, cache_ttl=60)[2], 0)
+        with self.settings(WORKERS_PRIMARY_STICKY_SECONDS=0):
+            self.get(url, cache_ttl=60)
+            self.assertEqual(self.get(url, cache_ttl=60)[1:], (0, 0))
@@ -0,0 +1,43 @@
+from .models import Worker
+from .test_workers import BaseWorkerCase
+
+
+class TestWorkerSearchCase(BaseWorkerCase):
+    """Тесты поиска работников ?search=."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        Worker.objects.create(
+            first_name='Иван', middle_name='Петрович', last_name='Сергеенко', email='ivan@mail.ru', position='qa',
+        )
+        Worker.objects.create(
+            first_name='Анна', middle_name='Сергеевна', last_name='Андреева', email='anna@corp.ru', position='dev',
+        )
+
+    def search(self, query: str, **params):
+        response = self.client.get('/api/workers/', {'search': query, 'page_size': 10, **params})
+        self.assertEqual(response.status_code, 200)
+        return [item['last_name'] for item in response.data['results']]
+
+    def test_search_ranking(self) -> None:
+        """Тест: совпадения с началом фамилии выше совпадений в середине полей."""
+        self.assertEqual(self.search('Серге'), ['Сергеев', 'Сергеенко', 'Андреева'])
+
+    def test_search_email_and_position(self) -> None:
+        """Тест поиска по email и должности без учёта регистра."""
+        self.assertEqual(self.search('CORP'), ['Андреева'])
+        self.assertEqual(self.search('qa'), ['Сергеенко'])
+
+    def test_search_with_filters(self) -> None:
+        """Тест: поиск сочетается с фильтрами списка, пустой запрос не фильтрует."""
+        self.assertEqual(self.search('Серге', position='dev'), ['Сергеев', 'Андреева'])
+        self.assertEqual(len(self.search('  ')), 3)
+        self.assertEqual(self.search('нет такого'), [])
+
+    def test_admin_search(self) -> None:
+        """Тест поиска в админке."""
+        admin = type(self.user).objects.create_superuser(username='hr', password='password')
+        self.client.force_login(admin)
+        response = self.client.get('/admin/workers/worker/', {'q': 'corp'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([w.email for w in response.context['cl'].result_list], ['anna@corp.ru'])
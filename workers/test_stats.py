@@ -0,0 +1,98 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import Count
+from django.db.models.functions import TruncMonth
+from django.test.utils import CaptureQueriesContext
+
+from .models import Worker, WorkerStat
+from .services import WorkerService
+from .test_workers import BaseWorkerCase, make_xlsx
+
+
+class TestWorkerStatsCase(BaseWorkerCase):
+    """Сводка WorkerStat меняется вместе с работниками и совпадает с агрегатом по таблице."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.client.force_authenticate(user=self.user)
+        self.worker = Worker.objects.get(email='sergei@mail.ru')
+
+    def assert_stats_consistent(self) -> None:
+        expected = {
+            (row['position'], row['is_active'], row['month']): row['total']
+            for row in Worker.objects.order_by().values('position', 'is_active', month=TruncMonth('hired_date'))
+            .annotate(total=Count('id'))
+        }
+        actual = {
+            (stat.position, stat.is_active, stat.hired_month): stat.count
+            for stat in WorkerStat.objects.filter(count__gt=0)
+        }
+        self.assertEqual(actual, expected)
+        self.assertFalse(WorkerStat.objects.filter(count__lt=0).exists())
+
+    def test_save_and_delete(self) -> None:
+        """Тест: создание, изменение через API и модель, update_fields и удаление."""
+        self.client.post('/api/workers/', {
+            'first_name': 'Егор', 'last_name': 'Егоров', 'email': 'egor@mail.ru', 'position': 'qa',
+        })
+        self.client.patch(f'/api/workers/{self.worker.id}/', {'position': 'lead', 'is_active': False})
+        self.assert_stats_consistent()
+        worker = Worker.objects.get(email='egor@mail.ru')
+        worker.position, worker.first_name = 'dev', 'Егорка'
+        worker.save(update_fields=['first_name'])
+        self.assert_stats_consistent()
+        Worker(pk=worker.pk, first_name='Егор', last_name='Егоров', email='egor@mail.ru', position='pm',
+               hired_date=worker.hired_date).save()
+        self.assert_stats_consistent()
+        self.client.delete(f'/api/workers/{self.worker.id}/')
+        Worker.objects.filter(position='pm').delete()
+        self.assert_stats_consistent()
+        self.assertEqual(WorkerService.get_worker_stats()['total'], 0)
+
+    def test_bulk_and_import(self) -> None:
+        """Тест: массовые создание, изменение, увольнение и импорт с upsert."""
+        items = [
+            {'first_name': 'Егор', 'last_name': f'Егоров{n}', 'email': f'egor{n}@mail.ru', 'position': 'qa'}
+            for n in range(5)
+        ]
+        self.client.post('/api/workers/bulk/', items, format='json')
+        ids = list(Worker.objects.filter(position='qa').values_list('id', flat=True))
+        self.client.patch('/api/workers/bulk/', [{'id': ids[0], 'position': 'dev'}], format='json')
+        self.client.post('/api/workers/bulk/deactivate/', {'ids': ids[1:3]}, format='json')
+        self.assert_stats_consistent()
+        rows = [
+            ['Сергей', 'Сергееевич', 'Сергеев', 'sergei@mail.ru', 'lead', False],
+            ['Анна', 'Андреевна', 'Андреева', 'anna@mail.ru', 'pm', True],
+        ]
+        WorkerService.import_workers_from_excel(make_xlsx(rows), self.user, mode='upsert')
+        self.assert_stats_consistent()
+
+    def test_endpoint(self) -> None:
+        """Тест: эндпоинт читает только сводку одним запросом."""
+        Worker.objects.create(first_name='Егор', last_name='Егоров', email='egor@mail.ru', position='qa')
+        Worker.objects.create(
+            first_name='Анна', last_name='Андреева', email='anna@mail.ru', position='qa', is_active=False,
+        )
+        month = f'{self.worker.hired_date:%Y-%m}'
+        with self.settings(WORKERS_CACHE_TTL=0), CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/workers/stats/')
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {
+            'active': 2, 'inactive': 1, 'total': 3,
+            'positions': [
+                {'position': 'dev', 'active': 1, 'inactive': 0, 'total': 1},
+                {'position': 'qa', 'active': 1, 'inactive': 1, 'total': 2},
+            ],
+            'hired_by_month': [{'month': month, 'active': 2, 'inactive': 1, 'total': 3}],
+        })
+
+    def test_rebuild_command(self) -> None:
+        """Тест: команда rebuild_worker_stats восстанавливает сводку после записи в обход сигналов."""
+        Worker.objects.update(position='lead')
+        out = StringIO()
+        call_command('rebuild_worker_stats', stdout=out, no_color=True)
+        self.assertIn('1 строк', out.getvalue())
+        self.assert_stats_consistent()
@@ -0,0 +1,112 @@
+import datetime
+
+from django.test import SimpleTestCase
+
+from .serializers import WorkerImportRowSerializer, WorkerUpdateSerializer
+from .validators import import_row_validator, update_row_validator
+
+VALID_ROW = {
+    'first_name': 'Егор',
+    'middle_name': 'Егорович',
+    'last_name': 'Егоров',
+    'email': 'egor@mail.ru',
+    'position': 'qa',
+    'is_active': True,
+}
+
+def row(**changes):
+    """Валидная строка с изменёнными полями; значение ... удаляет поле."""
+    data = dict(VALID_ROW)
+    for key, value in changes.items():
+        if value is ...:
+            data.pop(key)
+        else:
+            data[key] = value
+    return data
+
+PARITY_ROWS = [
+    row(),
+    row(middle_name=...),
+    row(is_active=...),
+    row(first_name=..., last_name=..., email=..., position=...),
+    {},
+    row(first_name=None, middle_name=None, email=None, is_active=None),
+    row(first_name='', middle_name='', email='', position=''),
+    row(first_name='   ', middle_name='  \t', last_name=' Егоров '),
+    row(first_name='а' * 25, position='п' * 50),
+    row(first_name='а' * 26, position='п' * 51, middle_name=' ' + 'о' * 26),
+    row(email='not-email'),
+    row(email='  EGOR@Mail.RU  '),
+    row(email='egor@localhost'),
+    row(email='a' * 300 + '@mail.ru'),
+    row(email=5),
+    row(first_name='Ег\x00ор'),
+    row(first_name='Ег\ud800ор', last_name='\udfffx\x00'),
+    row(first_name=5, last_name=1.5, position=0),
+    row(first_name=True, last_name=False),
+    row(first_name=datetime.datetime(2024, 1, 1), middle_name=datetime.date(2024, 1, 1)),
+    row(first_name=['Егор'], last_name={'a': 1}),
+    row(is_active='yes'),
+    row(is_active='No'),
+    row(is_active='ON'),
+    row(is_active='t'),
+    row(is_active='F'),
+    row(is_active=1),
+    row(is_active=0),
+    row(is_active=1.0),
+    row(is_active=0.0),
+    row(is_active=2),
+    row(is_active='maybe'),
+    row(is_active=''),
+    row(is_active='null'),
+    row(is_active=[]),
+    row(is_active=False),
+    row(extra='ignored', id=10),
+]
+
+class TestImportRowValidatorParity(SimpleTestCase):
+    """Паритет быстрого валидатора строк импорта с WorkerImportRowSerializer."""
+
+    def assert_parity(self, data) -> None:
+        serializer = WorkerImportRowSerializer(data=data)
+        is_valid = serializer.is_valid()
+        validated, errors = import_row_validator().validate(data)
+
+        self.assertEqual(errors, dict(serializer.errors) if not is_valid else {})
+        for field, details in errors.items():
+            self.assertEqual([d.code for d in details], [d.code for d in serializer.errors[field]])
+        if is_valid:
+            self.assertEqual(validated, dict(serializer.validated_data))
+            self.assertEqual(
+                WorkerImportRowSerializer.worker_kwargs(validated), serializer.to_worker_kwargs(),
+            )
+
+    def test_parity(self) -> None:
+        """Тест совпадения validated_data и ошибок с сериализатором."""
+        for data in PARITY_ROWS:
+            with self.subTest(data=data):
+                self.assert_parity(data)
+
+    def test_errors_field_order(self) -> None:
+        """Тест порядка полей в ошибках."""
+        _, errors = import_row_validator().validate({'is_active': 'x'})
+        self.assertEqual(list(errors), ['first_name', 'last_name', 'email', 'position', 'is_active'])
+
+    def test_validator_is_compiled_once(self) -> None:
+        """Тест: валидатор строится один раз на процесс."""
+        self.assertIs(import_row_validator(), import_row_validator())
+
+class TestUpdateRowValidatorParity(SimpleTestCase):
+    """Паритет валидатора изменений с WorkerUpdateSerializer(partial=True)."""
+
+    def test_partial_parity(self) -> None:
+        """Тест: отсутствующие поля пропускаются, ошибки совпадают с сериализатором."""
+        for data in [{}, {'position': 'lead'}, {'first_name': '', 'is_active': 'x'}, {'middle_name': ''},
+                     {'last_name': 'а' * 26, 'email': 'ignored@mail.ru'}]:
+            with self.subTest(data=data):
+                serializer = WorkerUpdateSerializer(data=data, partial=True)
+                is_valid = serializer.is_valid()
+                validated, errors = update_row_validator().validate(data, partial=True)
+                self.assertEqual(errors, dict(serializer.errors) if not is_valid else {})
+                if is_valid:
+                    self.assertEqual(validated, dict(serializer.validated_data))
@@ -1,14 +1,30 @@
-from rest_framework.test import APITestCase
+from rest_framework.test import APITestCase, APITransactionTestCase
 from rest_framework.response import Response
 
 from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 
-from .models import Worker
+from datetime import timedelta
+from io import BytesIO
+import json
 import tempfile
-import os
-from openpyxl import Workbook
+import time
+from openpyxl import Workbook, load_workbook
 
-from .models import Worker
+from .importers import iter_csv_rows
+from .jobs import run_import_job
+from .models import ImportJob, Worker
+from .services import WorkerService
+
+# WorkerCache и AuthCache включаются только на общем для процессов backend: в тестах кэша - файловый.
+SHARED_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'hr-system-tests'},
+    'shared': {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': tempfile.mkdtemp()},
+}
 
 class BaseWorkerCase(APITestCase):
     """Базовый класс для тестов работников."""
@@ -137,6 +153,73 @@ class TestGetWorkerCase(BaseWorkerCase):
         self.assertEqual(response.status_code, 404)
         self.assertEqual(response.data['detail'], "Некорректный идентификатор")
         
+class TestCursorPaginationCase(BaseWorkerCase):
+    """Тесты keyset-пагинации списка работников."""
+
+    def test_cursor_pages(self) -> None:
+        """Тест обхода списка курсором без COUNT и с фильтром."""
+        Worker.objects.bulk_create([
+            Worker(first_name='Имя', last_name='Фамилия', email=f'user{i}@mail.ru', position='dev', is_active=i != 2)
+            for i in range(5)
+        ])
+        url = '/api/workers/?pagination=cursor&page_size=2&is_active=true&position=dev'
+        ids = []
+        while url:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn('count', response.data)
+            self.assertFalse(any('COUNT(' in q['sql'] for q in queries.captured_queries))
+            ids.extend(worker['id'] for worker in response.data['results'])
+            url = response.data['next']
+        expected = list(Worker.objects.filter(is_active=True, position='dev').order_by('id').values_list('id', flat=True))
+        self.assertEqual(ids, expected)
+        self.assertEqual(len(ids), 5)
+
+    def test_page_number_is_default(self) -> None:
+        """Тест: без параметров пагинация постраничная."""
+        response = self.client.get('/api/workers/')
+        self.assertEqual(response.data['count'], 1)
+
+class TestExportWorkerCase(BaseWorkerCase):
+    """Тесты потоковой выгрузки работников."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        Worker.objects.create(
+            first_name='Анна', middle_name='', last_name='Андреева', email='anna@mail.ru', position='pm',
+            is_active=False,
+        )
+
+    def test_export_csv(self) -> None:
+        """Тест CSV выгрузки с фильтром; файл читается импортом обратно."""
+        with self.settings(WORKERS_EXPORT_CHUNK_SIZE=1):
+            response = self.client.get('/api/workers/export/?format=csv&is_active=false')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+        self.assertEqual(lines[0], 'id,first_name,middle_name,last_name,email,position,is_active,hired_date,updated_at,created_by')
+        self.assertEqual(len(lines), 2)
+        self.assertIn(',Анна,,Андреева,anna@mail.ru,pm,false,', lines[1])
+
+    def test_export_ndjson(self) -> None:
+        """Тест NDJSON выгрузки: объекты совпадают с детальным представлением."""
+        response = self.client.get('/api/workers/export/', HTTP_ACCEPT='application/x-ndjson')
+        self.assertEqual(response.status_code, 200)
+        items = [json.loads(line) for line in b''.join(response.streaming_content).decode('utf-8').splitlines()]
+        self.assertEqual(len(items), 2)
+        self.assertEqual(items[0], self.client.get(f'/api/workers/{items[0]["id"]}/').json())
+
+    def test_export_xlsx(self) -> None:
+        """Тест XLSX выгрузки."""
+        response = self.client.get('/api/workers/export/?format=xlsx&position=dev')
+        self.assertEqual(response.status_code, 200)
+        workbook = load_workbook(BytesIO(b''.join(response.streaming_content)), read_only=True)
+        rows = list(workbook.active.iter_rows(values_only=True))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[1][4], 'sergei@mail.ru')
+
 class TestUpdateWorkerCase(BaseWorkerCase):
     """Тесты для обновления работников."""
 
@@ -210,4 +293,350 @@ class TestDeleteWorkerCase(BaseWorkerCase):
         self.assertEqual(response.data['detail'], 'Некорректный идентификатор')
 
 
-"""Надо добавить тесты на import"""
\ No newline at end of file
+IMPORT_HEADERS = ['first_name', 'middle_name', 'last_name', 'email', 'position', 'is_active']
+
+def make_xlsx(rows, headers=IMPORT_HEADERS) -> SimpleUploadedFile:
+    """Собрать xlsx файл для импорта из строк."""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(headers)
+    for row in rows:
+        sheet.append(row)
+    buffer = BytesIO()
+    workbook.save(buffer)
+    return SimpleUploadedFile(
+        'workers.xlsx', buffer.getvalue(),
+        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    )
+
+class TestImportWorkerCase(BaseWorkerCase):
+    """Тесты для импорта работников."""
+
+    rows = [
+        ['Егор', 'Егорович', 'Егоров', 'egor@mail.ru', 'qa', True],
+        ['Иван', '', 'Иванов', 'not-email', 'dev', True],
+        ['Пётр', 'Петрович', 'Петров', 'EGOR@mail.ru', 'dev', False],
+        ['Олег', 'Олегович', 'Олегов', 'sergei@mail.ru', 'dev', True],
+        ['Анна', 'Андреевна', 'Андреева', 'anna@mail.ru', 'pm', 'false'],
+    ]
+
+    def test_import_success(self) -> None:
+        """Тест импорта валидных строк и отчёта об ошибках."""
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post('/api/workers/import/', {'file': make_xlsx(self.rows)}, format='multipart')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['added'], 2)
+        self.assertEqual(response.data['total'], 5)
+        self.assertEqual([error['row'] for error in response.data['errors']], [3, 4, 5])
+        self.assertEqual(response.data['errors'][1]['detail'], 'Дубликат email в файле')
+        self.assertEqual(response.data['errors'][2]['detail'], 'Email уже существует в базе')
+        self.assertFalse(Worker.objects.get(email='anna@mail.ru').is_active)
+        self.assertEqual(Worker.objects.get(email='egor@mail.ru').created_by, self.user)
+
+    def test_import_missing_columns(self) -> None:
+        """Тест импорта файла без обязательных столбцов."""
+        self.client.force_authenticate(user=self.user)
+        file_obj = make_xlsx([['Егор']], headers=['first_name'])
+        response = self.client.post('/api/workers/import/', {'file': file_obj}, format='multipart')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['added'], 0)
+        self.assertIn('email', response.data['errors'][0]['detail'])
+
+    def test_import_batches(self) -> None:
+        """Тест записи строк пакетами: один INSERT на пакет, результат не зависит от размера пакета."""
+        rows = [['Имя', 'Отчество', 'Фамилия', f'user{i}@mail.ru', 'dev', True] for i in range(7)]
+        rows[3][3] = 'sergei@mail.ru'
+        with CaptureQueriesContext(connection) as queries:
+            result = WorkerService.import_workers_from_excel(make_xlsx(rows), self.user, batch_size=3)
+        inserts = [q for q in queries.captured_queries if q["sql"].startswith('INSERT INTO "workers_worker"')]
+        self.assertEqual(len(inserts), 3)
+        self.assertEqual(result['added'], 6)
+        self.assertEqual(result['total'], 7)
+        self.assertEqual(result['errors'], [{'row': 5, 'detail': 'Email уже существует в базе'}])
+
+
+class TestImportDuplicatesCase(BaseWorkerCase):
+    """Тесты проверки дубликатов email при импорте."""
+
+    def test_duplicates_checked_per_chunk(self) -> None:
+        """Тест: email проверяются запросом по чанку, а не выгрузкой всей таблицы."""
+        Worker.objects.bulk_create([
+            Worker(first_name='Имя', last_name='Фамилия', email=f'old{i}@mail.ru', position='dev')
+            for i in range(20)
+        ])
+        rows = [
+            ['Имя', 'Отчество', 'Фамилия', 'new1@mail.ru', 'dev', True],
+            ['Имя', 'Отчество', 'Фамилия', 'old3@mail.ru', 'dev', True],
+            ['Имя', 'Отчество', 'Фамилия', 'NEW1@mail.ru', 'dev', True],
+            ['Имя', 'Отчество', 'Фамилия', 'sergei@mail.ru', 'dev', True],
+            ['Имя', 'Отчество', 'Фамилия', 'new2@mail.ru', 'dev', True],
+        ]
+        with CaptureQueriesContext(connection) as queries:
+            result = WorkerService.import_workers_from_excel(make_xlsx(rows), self.user, batch_size=2)
+        selects = [q['sql'] for q in queries.captured_queries if q['sql'].startswith('SELECT')]
+        self.assertEqual(len(selects), 3)
+        self.assertTrue(all(' IN (' in sql for sql in selects))
+        self.assertEqual(result['added'], 2)
+        self.assertEqual(result['errors'], [
+            {'row': 3, 'detail': 'Email уже существует в базе'},
+            {'row': 4, 'detail': 'Дубликат email в файле'},
+            {'row': 5, 'detail': 'Email уже существует в базе'},
+        ])
+
+class TestImportParallelCase(BaseWorkerCase):
+    """Тест параллельной валидации строк импорта."""
+
+    def test_parallel_matches_serial(self) -> None:
+        """Тест: результат в пуле процессов совпадает с последовательным, номера строк точные."""
+        rows = [['Имя', 'Отчество', 'Фамилия', f'user{i}@mail.ru', 'dev', True] for i in range(40)]
+        rows[5][3] = 'bad-email'
+        rows[17][3] = 'user3@mail.ru'
+        rows[23][3] = 'sergei@mail.ru'
+        rows[31][0] = 'И' * 30
+
+        serial = WorkerService.import_workers_from_excel(make_xlsx(rows), self.user, batch_size=4, processes=1)
+        Worker.objects.exclude(email='sergei@mail.ru').delete()
+        parallel = WorkerService.import_workers_from_excel(make_xlsx(rows), self.user, batch_size=4, processes=2)
+
+        self.assertEqual(parallel, serial)
+        self.assertEqual(parallel['added'], 36)
+        self.assertEqual([error['row'] for error in parallel['errors']], [7, 19, 25, 33])
+
+class TestImportUpsertCase(BaseWorkerCase):
+    """Тесты импорта в режиме upsert."""
+
+    def test_upsert(self) -> None:
+        """Тест: изменённые работники обновляются, неизменённые пропускаются, новые создаются."""
+        Worker.objects.create(
+            first_name='Егор', middle_name='Егорович', last_name='Егоров', email='egor@mail.ru', position='qa',
+        )
+        rows = [
+            ['Сергей', 'Сергееевич', 'Сергеев', 'sergei@mail.ru', 'lead', False],
+            ['Егор', 'Егорович', 'Егоров', 'egor@mail.ru', 'qa', True],
+            ['Анна', 'Андреевна', 'Андреева', 'anna@mail.ru', 'pm', True],
+            ['Анна', 'Андреевна', 'Андреева', 'anna@mail.ru', 'pm', True],
+        ]
+        self.client.force_authenticate(user=self.user)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                '/api/workers/import/', {'file': make_xlsx(rows), 'mode': 'upsert'}, format='multipart',
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['created'], 1)
+        self.assertEqual(response.data['added'], 1)
+        self.assertEqual(response.data['updated'], 1)
+        self.assertEqual(response.data['unchanged'], 1)
+        self.assertEqual(response.data['errors'], [{'row': 5, 'detail': 'Дубликат email в файле'}])
+        updates = [q for q in queries.captured_queries if q['sql'].startswith('UPDATE "workers_worker"')]
+        self.assertEqual(len(updates), 1)
+
+        sergei = Worker.objects.get(email='sergei@mail.ru')
+        self.assertEqual(sergei.position, 'lead')
+        self.assertFalse(sergei.is_active)
+        self.assertEqual(sergei.created_by, self.user)
+
+    def test_upsert_email_case(self) -> None:
+        """Тест: email из базы в другом регистре обновляет работника, а не создаёт дубликат."""
+        Worker.objects.filter(email='sergei@mail.ru').update(email='Sergei@Mail.ru')
+        rows = [['Сергей', 'Сергееевич', 'Сергеев', 'SERGEI@mail.ru', 'lead', True]]
+        result = WorkerService.import_workers_from_excel(make_xlsx(rows), self.user, mode='upsert')
+        self.assertEqual((result['created'], result['updated'], result['errors']), (0, 1, []))
+        self.assertEqual(Worker.objects.get().position, 'lead')
+
+        result = WorkerService.import_workers_from_excel(make_xlsx(rows), self.user)
+        self.assertEqual(result['errors'], [{'row': 2, 'detail': 'Email уже существует в базе'}])
+
+    def test_upsert_partial_columns(self) -> None:
+        """Тест: столбцы, которых нет в файле, не меняются (нет сброса is_active и отчества)."""
+        Worker.objects.filter(email='sergei@mail.ru').update(is_active=False)
+        headers = ['first_name', 'last_name', 'email', 'position']
+        rows = [['Сергей', 'Сергеев', 'sergei@mail.ru', 'lead']]
+        result = WorkerService.import_workers_from_excel(make_xlsx(rows, headers), self.user, mode='upsert')
+        self.assertEqual(result['updated'], 1)
+        worker = Worker.objects.get(email='sergei@mail.ru')
+        self.assertEqual((worker.position, worker.is_active, worker.middle_name), ('lead', False, 'Сергееевич'))
+
+    def test_create_mode_rejects_existing(self) -> None:
+        """Тест: в режиме по умолчанию существующие email остаются ошибкой."""
+        rows = [['Сергей', 'Сергееевич', 'Сергеев', 'sergei@mail.ru', 'lead', False]]
+        result = WorkerService.import_workers_from_excel(make_xlsx(rows), self.user)
+        self.assertEqual(result, {
+            'added': 0, 'errors': [{'row': 2, 'detail': 'Email уже существует в базе'}], 'total': 1,
+        })
+        self.assertEqual(Worker.objects.get(email='sergei@mail.ru').position, 'dev')
+
+class ByteChunks:
+    """Файл, который отдаёт содержимое по одному байту."""
+
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+
+    def chunks(self):
+        for i in range(len(self.content)):
+            yield self.content[i:i + 1]
+
+class TestImportCsvCase(BaseWorkerCase):
+    """Тесты для потокового импорта CSV/TSV."""
+
+    def test_import_csv(self) -> None:
+        """Тест импорта CSV: та же валидация и отчёт, что и для xlsx."""
+        self.client.force_authenticate(user=self.user)
+        content = (
+            '\ufefffirst_name,middle_name,last_name,email,position,is_active\r\n'
+            'Егор,Егорович,Егоров,egor@mail.ru,qa,true\r\n'
+            'Олег,Олегович,Олегов,sergei@mail.ru,dev,1\r\n'
+            'Анна,,Андреева,anna@mail.ru,pm,false\r\n'
+        ).encode('utf-8')
+        file_obj = SimpleUploadedFile('workers.csv', content, content_type='text/csv')
+        response = self.client.post('/api/workers/import/', {'file': file_obj}, format='multipart')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['added'], 1)
+        self.assertEqual(response.data['total'], 3)
+        self.assertEqual(response.data['errors'][0], {'row': 3, 'detail': 'Email уже существует в базе'})
+        self.assertEqual(response.data['errors'][1]['row'], 4)
+        self.assertIn('middle_name', response.data['errors'][1]['detail'])
+
+    def test_import_tsv(self) -> None:
+        """Тест импорта TSV."""
+        content = 'first_name\tmiddle_name\tlast_name\temail\tposition\nЕгор\tЕгорович\tЕгоров\tegor@mail.ru\tqa\n'
+        file_obj = SimpleUploadedFile('workers.tsv', content.encode('utf-8'))
+        result = WorkerService.import_workers(file_obj, self.user)
+        self.assertEqual(result, {'added': 1, 'errors': [], 'total': 1})
+
+    def test_csv_rows_across_chunks(self) -> None:
+        """Тест разбора строк, многобайтовых символов и кавычек на границах чанков."""
+        content = 'a,b\r\n"Пётр, мл.","две\nстроки"\r\nЯ,\n'.encode('utf-8')
+        rows = list(iter_csv_rows(ByteChunks(content)))
+        self.assertEqual(rows, [['a', 'b'], ['Пётр, мл.', 'две\nстроки'], ['Я', None]])
+
+    def test_import_csv_bad_encoding(self) -> None:
+        """Тест импорта CSV не в UTF-8."""
+        content = 'first_name,last_name,email,position\nЕгор,Егоров,egor@mail.ru,qa\n'.encode('cp1251')
+        result = WorkerService.import_workers(SimpleUploadedFile('workers.csv', content), self.user)
+        self.assertEqual(result['errors'], [{'detail': 'Файл должен быть в кодировке UTF-8'}])
+
+    def test_import_file_validation(self) -> None:
+        """Тест ограничений формата и размера файла."""
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(
+            '/api/workers/import/', {'file': SimpleUploadedFile('workers.txt', b'x')}, format='multipart',
+        )
+        self.assertEqual(response.status_code, 400)
+        with self.settings(WORKERS_IMPORT_MAX_TEXT_SIZE=1024 * 1024):
+            big = SimpleUploadedFile('workers.csv', b'x' * (1024 * 1024 + 1))
+            response = self.client.post('/api/workers/import/', {'file': big}, format='multipart')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['file'][0], 'Максимальный допустимый размер файла 1MB')
+
+@override_settings(WORKERS_IMPORT_JOBS_EAGER=True, MEDIA_ROOT=tempfile.mkdtemp())
+class TestImportJobCase(BaseWorkerCase):
+    """Тесты для фонового импорта работников."""
+
+    def test_import_job(self) -> None:
+        """Тест постановки задачи импорта и получения её статуса."""
+        self.client.force_authenticate(user=self.user)
+        rows = [
+            ['Егор', 'Егорович', 'Егоров', 'egor@mail.ru', 'qa', True],
+            ['Олег', 'Олегович', 'Олегов', 'sergei@mail.ru', 'dev', True],
+        ]
+        response = self.client.post(
+            '/api/workers/import/', {'file': make_xlsx(rows), 'background': True}, format='multipart',
+        )
+        self.assertEqual(response.status_code, 202)
+        job_id = response.data['job_id']
+        self.assertTrue(response.data['status_url'].endswith(f'/api/workers/import/{job_id}/'))
+
+        response = self.client.get(f'/api/workers/import/{job_id}/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['status'], ImportJob.Status.DONE)
+        self.assertEqual(response.data['processed'], 2)
+        self.assertEqual(response.data['added'], 1)
+        self.assertEqual(response.data['errors'], 1)
+        self.assertEqual(response.data['result']['errors'][0]['detail'], 'Email уже существует в базе')
+
+    def test_stale_running_job_failed(self) -> None:
+        """Тест: задача running без прогресса дольше WORKERS_IMPORT_JOB_TIMEOUT при чтении помечается failed."""
+        job = ImportJob.objects.create(file=SimpleUploadedFile('stale.xlsx', b''), status=ImportJob.Status.RUNNING)
+        response = self.client.get(f'/api/workers/import/{job.pk}/')
+        self.assertEqual(response.data['status'], ImportJob.Status.RUNNING)
+
+        ImportJob.objects.filter(pk=job.pk).update(updated_at=timezone.now() - timedelta(seconds=601))
+        response = self.client.get(f'/api/workers/import/{job.pk}/')
+        self.assertEqual(response.data['status'], ImportJob.Status.FAILED)
+        self.assertIsNotNone(response.data['finished_at'])
+        job.refresh_from_db()
+        self.assertFalse(job.file)
+
+    def test_stale_pending_job_failed(self) -> None:
+        """Тест: задача, простоявшая в очереди дольше таймаута, помечается failed и больше не запускается."""
+        job = ImportJob.objects.create(file=make_xlsx([]), status=ImportJob.Status.PENDING)
+        self.assertEqual(self.client.get(f'/api/workers/import/{job.pk}/').data['status'], ImportJob.Status.PENDING)
+
+        ImportJob.objects.filter(pk=job.pk).update(created_at=timezone.now() - timedelta(seconds=601))
+        response = self.client.get(f'/api/workers/import/{job.pk}/')
+        self.assertEqual(response.data['status'], ImportJob.Status.FAILED)
+        run_import_job(job.pk)
+        job.refresh_from_db()
+        self.assertEqual(job.status, ImportJob.Status.FAILED)
+
+    def test_import_job_not_found(self) -> None:
+        """Тест статуса несуществующей задачи."""
+        response = self.client.get('/api/workers/import/00000000-0000-0000-0000-000000000000/')
+        self.assertEqual(response.status_code, 404)
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class TestImportJobThreadCase(APITransactionTestCase):
+    """Тест выполнения задачи импорта в пуле потоков."""
+
+    def test_import_job_in_thread(self) -> None:
+        """Тест: ответ 202 приходит до импорта, задача завершается в фоне."""
+        user = get_user_model().objects.create_user(username='admin', password='password')
+        self.client.force_authenticate(user=user)
+        file_obj = make_xlsx([['Егор', 'Егорович', 'Егоров', 'egor@mail.ru', 'qa', True]])
+        response = self.client.post('/api/workers/import/', {'file': file_obj, 'background': True}, format='multipart')
+        self.assertEqual(response.status_code, 202)
+
+        job = ImportJob.objects.get(pk=response.data['job_id'])
+        deadline = time.monotonic() + 30
+        while job.status not in (ImportJob.Status.DONE, ImportJob.Status.FAILED) and time.monotonic() < deadline:
+            time.sleep(0.05)
+            job.refresh_from_db()
+        self.assertEqual(job.status, ImportJob.Status.DONE)
+        self.assertEqual(job.added, 1)
+
+class TestWorkerQueryCountCase(BaseWorkerCase):
+    """Точное число SQL-запросов на эндпоинт чтения без кэша."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.worker = Worker.objects.get(email='sergei@mail.ru')
+
+    def captured_sql(self, url: str):
+        with self.settings(WORKERS_CACHE_TTL=0), CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return [query['sql'] for query in queries.captured_queries]
+
+    def test_list_queries(self) -> None:
+        """Тест: список - версия для ETag, COUNT и SELECT только полей ответа, без транзакций."""
+        version, count, select = self.captured_sql('/api/workers/?is_active=true')
+        self.assertIn('"workers_workerchange"', version)
+        self.assertIn('COUNT(', count)
+        self.assertNotIn('"email"', select)
+        self.assertNotIn('"hired_date"', select)
+        self.assertIn('ORDER BY "workers_worker"."id"', select)
+
+    def test_cursor_queries(self) -> None:
+        """Тест: курсорная страница - версия для ETag и один SELECT."""
+        self.assertEqual(len(self.captured_sql('/api/workers/?pagination=cursor')), 2)
+
+    def test_detail_queries(self) -> None:
+        """Тест: карточка - один SELECT, без SAVEPOINT."""
+        (select,) = self.captured_sql(f'/api/workers/{self.worker.id}/')
+        self.assertTrue(select.startswith('SELECT'))
+
+    def test_export_queries(self) -> None:
+        """Тест: выгрузка - один SELECT."""
+        with self.settings(WORKERS_CACHE_TTL=0), CaptureQueriesContext(connection) as queries:
+            b''.join(self.client.get('/api/workers/export/?format=csv').streaming_content)
+        self.assertEqual(len(queries), 1)
@@ -1,14 +1,31 @@
+from django.conf import settings
 from django.urls import path, include
 
 from rest_framework.authtoken.views import obtain_auth_token
 
-from .views import WorkerRetrieveUpdateDestroyAPIView, WorkerListCreateAPIView, WorkerImportAPIView
+from .views import (
+    WorkerRetrieveUpdateDestroyAPIView, WorkerListCreateAPIView, WorkerImportAPIView, WorkerImportJobAPIView,
+    WorkerExportAPIView, WorkerBulkAPIView, WorkerBulkDeactivateAPIView, WorkerStatsAPIView, WorkerChangesAPIView,
+)
+
+if settings.WORKERS_ASYNC_READS:
+    from .async_views import worker_detail, worker_list
+    worker_list_view, worker_detail_view = worker_list, worker_detail
+else:
+    worker_list_view = WorkerListCreateAPIView.as_view()
+    worker_detail_view = WorkerRetrieveUpdateDestroyAPIView.as_view()
 
 urlpatterns = [
     path('auth/token/', obtain_auth_token, name='api-token'),
     path('auth/', include('rest_framework.urls')),
 
-    path('workers/', WorkerListCreateAPIView.as_view(), name='workers'),
+    path('workers/', worker_list_view, name='workers'),
+    path('workers/bulk/', WorkerBulkAPIView.as_view(), name='worker_bulk'),
+    path('workers/bulk/deactivate/', WorkerBulkDeactivateAPIView.as_view(), name='worker_bulk_deactivate'),
+    path('workers/stats/', WorkerStatsAPIView.as_view(), name='worker_stats'),
+    path('workers/changes/', WorkerChangesAPIView.as_view(), name='worker_changes'),
+    path('workers/export/', WorkerExportAPIView.as_view(), name='worker_export'),
     path('workers/import/', WorkerImportAPIView.as_view(), name='worker_import'),
-    path('workers/<pk>/', WorkerRetrieveUpdateDestroyAPIView.as_view(), name='worker_id'),
+    path('workers/import/<uuid:job_id>/', WorkerImportJobAPIView.as_view(), name='worker_import_job'),
+    path('workers/<pk>/', worker_detail_view, name='worker_id'),
 ]
\ No newline at end of file
@@ -0,0 +1,198 @@
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Type
+
+from django.core.exceptions import ImproperlyConfigured, ValidationError as DjangoValidationError
+from django.core.validators import MaxLengthValidator, MinLengthValidator, ProhibitNullCharactersValidator
+
+from rest_framework import serializers
+from rest_framework.exceptions import ErrorDetail, ValidationError
+from rest_framework.fields import SkipField, empty, get_error_detail
+from rest_framework.validators import ProhibitSurrogateCharactersValidator
+
+from .serializers import WorkerImportRowSerializer, WorkerUpdateSerializer
+
+Errors = List[ErrorDetail]
+FieldResult = Tuple[Any, Optional[Errors]]
+
+_SKIP = object()
+_SURROGATES = re.compile('[\ud800-\udfff]')
+
+
+def _fast_check(validator: Any) -> Optional[Callable[[str], bool]]:
+    """Быстрая проверка, после которой валидатор можно не вызывать; None - вызывать всегда."""
+    kind = type(validator)
+    if kind is MaxLengthValidator and isinstance(validator.limit_value, int):
+        return lambda value, limit=validator.limit_value: len(value) <= limit
+    if kind is MinLengthValidator and isinstance(validator.limit_value, int):
+        return lambda value, limit=validator.limit_value: len(value) >= limit
+    if kind is ProhibitNullCharactersValidator:
+        return lambda value: '\x00' not in value
+    if kind is ProhibitSurrogateCharactersValidator:
+        return lambda value: _SURROGATES.search(value) is None
+    return None
+
+
+class FieldValidator:
+    """Проверка одного поля по правилам поля сериализатора DRF."""
+
+    def __init__(self, field: serializers.Field) -> None:
+        self.field = field
+        self.name: str = field.field_name
+        self.source_attrs: List[str] = field.source_attrs
+        self.required: bool = field.required
+        self.allow_null: bool = field.allow_null
+        self.messages: Dict[str, Any] = field.error_messages
+        self.checks = [(_fast_check(validator), validator) for validator in field.validators]
+
+    def validate(self, data: Any) -> FieldResult:
+        try:
+            return self.field.run_validation(data), None
+        except ValidationError as exc:
+            return None, exc.detail
+        except DjangoValidationError as exc:
+            return None, get_error_detail(exc)
+        except SkipField:
+            return _SKIP, None
+
+    def fail(self, key: str, **kwargs: Any) -> FieldResult:
+        return None, [ErrorDetail(self.messages[key].format(**kwargs), code=key)]
+
+    def missing(self) -> FieldResult:
+        if self.required:
+            return self.fail('required')
+        try:
+            return self.field.get_default(), None
+        except SkipField:
+            return _SKIP, None
+
+    def run_validators(self, value: Any) -> FieldResult:
+        errors: Errors = []
+        for passes, validator in self.checks:
+            if passes is not None and passes(value):
+                continue
+            try:
+                if getattr(validator, 'requires_context', False):
+                    validator(value, self.field)
+                else:
+                    validator(value)
+            except ValidationError as exc:
+                errors.extend(exc.detail)
+            except DjangoValidationError as exc:
+                errors.extend(get_error_detail(exc))
+        if errors:
+            return None, errors
+        return value, None
+
+
+class CharFieldValidator(FieldValidator):
+    def __init__(self, field: serializers.CharField) -> None:
+        super().__init__(field)
+        self.allow_blank: bool = field.allow_blank
+        self.trim_whitespace: bool = field.trim_whitespace
+
+    def validate(self, data: Any) -> FieldResult:
+        if data is empty:
+            return self.missing()
+        if type(data) is str:
+            value = data.strip() if self.trim_whitespace else data
+            if value == '':
+                return ('', None) if self.allow_blank else self.fail('blank')
+            return self.run_validators(value)
+        if data is None:
+            return (None, None) if self.allow_null else self.fail('null')
+        if data == '' or (self.trim_whitespace and str(data).strip() == ''):
+            return ('', None) if self.allow_blank else self.fail('blank')
+        if isinstance(data, bool) or not isinstance(data, (str, int, float)):
+            return self.fail('invalid')
+        value = str(data)
+        return self.run_validators(value.strip() if self.trim_whitespace else value)
+
+
+class BooleanFieldValidator(FieldValidator):
+    def __init__(self, field: serializers.BooleanField) -> None:
+        super().__init__(field)
+        self.true_values = frozenset(field.TRUE_VALUES)
+        self.false_values = frozenset(field.FALSE_VALUES)
+        self.null_values = frozenset(field.NULL_VALUES)
+
+    def validate(self, data: Any) -> FieldResult:
+        if data is empty:
+            return self.missing()
+        if data is None:
+            return (None, None) if self.allow_null else self.fail('null')
+        key = data.lower() if isinstance(data, str) else data
+        try:
+            if key in self.true_values:
+                return self.run_validators(True)
+            if key in self.false_values:
+                return self.run_validators(False)
+            if key in self.null_values and self.allow_null:
+                return self.run_validators(None)
+        except TypeError:
+            pass
+        return self.fail('invalid', input=data)
+
+
+class RowValidator:
+    """Скомпилированная валидация словаря по полям сериализатора без экземпляра сериализатора на строку.
+
+    Результат и структура ошибок совпадают с serializer.validated_data / serializer.errors.
+    Поддерживаются только правила полей: validate_<field> и validate() сериализатора не вызываются.
+    """
+
+    def __init__(self, serializer_class: Type[serializers.Serializer]) -> None:
+        self.prototype = prototype = serializer_class()
+        if type(prototype).validate is not serializers.Serializer.validate:
+            raise ImproperlyConfigured(f'{serializer_class.__name__}.validate() не поддерживается')
+        self.fields: List[FieldValidator] = []
+        for field in prototype._writable_fields:
+            if hasattr(prototype, 'validate_' + field.field_name):
+                raise ImproperlyConfigured(f'{serializer_class.__name__}.validate_{field.field_name}() не поддерживается')
+            self.fields.append(self.compile_field(field))
+
+    @staticmethod
+    def compile_field(field: serializers.Field) -> FieldValidator:
+        kind = type(field)
+        if (
+            isinstance(field, serializers.CharField)
+            and kind.run_validation is serializers.CharField.run_validation
+            and kind.to_internal_value is serializers.CharField.to_internal_value
+        ):
+            return CharFieldValidator(field)
+        if kind is serializers.BooleanField:
+            return BooleanFieldValidator(field)
+        return FieldValidator(field)
+
+    def validate(self, data: Mapping[str, Any], partial: bool = False) -> Tuple[Dict[str, Any], Dict[str, Errors]]:
+        """Вернуть (validated_data, errors); при ошибках validated_data неполный.
+
+        partial=True - как serializer(partial=True): отсутствующие поля пропускаются без default.
+        """
+        validated: Dict[str, Any] = {}
+        errors: Dict[str, Errors] = {}
+        for field in self.fields:
+            data_value = data.get(field.name, empty)
+            if partial and data_value is empty:
+                continue
+            value, field_errors = field.validate(data_value)
+            if field_errors is not None:
+                errors[field.name] = field_errors
+            elif value is not _SKIP:
+                if len(field.source_attrs) == 1:
+                    validated[field.source_attrs[0]] = value
+                else:
+                    self.prototype.set_value(validated, field.source_attrs, value)
+        return validated, errors
+
+
+@lru_cache(maxsize=None)
+def import_row_validator() -> RowValidator:
+    """Валидатор строки импорта, скомпилированный из WorkerImportRowSerializer."""
+    return RowValidator(WorkerImportRowSerializer)
+
+
+@lru_cache(maxsize=None)
+def update_row_validator() -> RowValidator:
+    """Валидатор изменения работника, скомпилированный из WorkerUpdateSerializer."""
+    return RowValidator(WorkerUpdateSerializer)
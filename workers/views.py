@@ -1,49 +1,185 @@
-from typing import Any, Type
+from typing import Any, Callable, Dict, List, Type
 
+import tempfile
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
 from django.db.models import QuerySet
+from django.http import FileResponse, HttpResponseBase, StreamingHttpResponse
+from django.urls import reverse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 from django_filters.rest_framework import DjangoFilterBackend
 
 from rest_framework.response import Response
-from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIView, GenericAPIView
-from rest_framework.permissions import IsAuthenticatedOrReadOnly
+from rest_framework import status
+from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIView, GenericAPIView, RetrieveAPIView
+from rest_framework.permissions import SAFE_METHODS, IsAuthenticatedOrReadOnly
 from rest_framework.parsers import MultiPartParser, FormParser
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import BasePagination, CursorPagination, PageNumberPagination
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.serializers import BaseSerializer
-from rest_framework.exceptions import NotFound
+from rest_framework.exceptions import APIException, NotFound, ValidationError
 
-from .models import Worker
-from .serializers import WorkerRetrieveSerializer, WorkerListCreateSerializer, WorkerUpdateSerializer, ImportFileSerializer
+from .conditional import if_match_passes, list_etag, worker_etag, worker_last_modified
+from .exporters import iter_csv, iter_ndjson, write_xlsx
+from .filters import WorkerSearchFilter
+from .jobs import fail_stale_import_job, submit_import_job
+from .models import ImportJob, Worker
+from .serializers import (
+    WorkerRetrieveSerializer, WorkerListCreateSerializer, WorkerUpdateSerializer, ImportFileSerializer,
+    ImportJobSerializer, WorkerBulkDeactivateSerializer, WorkerChangesQuerySerializer,
+)
+from .renderers import CSVRenderer, FastJSONRenderer, NDJSONRenderer, XLSXRenderer
 from .services import WorkerService
 
+class Conflict(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = 'Данные изменились во время записи, повторите запрос.'
+    default_code = 'conflict'
+
+def workers_page_key(request, paginator_class: type) -> str:
+    """Ключ кэша страницы списка: адрес, отсортированные параметры запроса и тип пагинации."""
+    return '|'.join([
+        request.build_absolute_uri(request.path),
+        urlencode(sorted(request.GET.lists()), doseq=True),
+        paginator_class.__name__,
+    ])
+
 class WorkerPagination(PageNumberPagination):
     page_size: int = 3
     page_size_query_param: str = 'page_size'
     max_page_size: int = 100
 
+class WorkerCursorPagination(CursorPagination):
+    """Keyset-пагинация по id: без OFFSET и COUNT(*), стабильна при вставках."""
+    page_size: int = 3
+    page_size_query_param: str = 'page_size'
+    max_page_size: int = 1000
+    ordering = ('id',)
+
 class WorkerListCreateAPIView(ListCreateAPIView):
-    """Представление для просмотра и создания работников с пагинацией и фильтрацией."""
+    """Представление для просмотра и создания работников с пагинацией и фильтрацией.
+
+    По умолчанию пагинация постраничная; ?pagination=cursor (или параметр cursor) включает keyset-пагинацию.
+    ?search= ищет по ФИО, email и должности; порядок по релевантности сохраняется только в постраничном режиме.
+    """
     serializer_class = WorkerListCreateSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
     pagination_class = WorkerPagination
-    filter_backends = [DjangoFilterBackend]
+    cursor_pagination_class = WorkerCursorPagination
+    filter_backends = [DjangoFilterBackend, WorkerSearchFilter]
     filterset_fields = ['is_active', 'position']
 
+    def list(self, request, *args, **kwargs) -> HttpResponseBase:
+        """Страницы списка кэшируются по адресу, фильтрам и параметрам пагинации.
+
+        ETag и Last-Modified строятся по версии набора работников и запросу, поэтому при совпадении
+        валидаторов 304 отдаётся без чтения и сериализации страницы.
+        """
+        key = workers_page_key(request, type(self.paginator))
+        version, last_modified = WorkerService.get_workers_list_version()
+        etag = list_etag(version, key)
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = Response(WorkerService.get_workers_page(key, self.load_page))
+        response['ETag'] = etag
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified)
+        return response
+
+    def load_page(self) -> Any:
+        """Страница списка из строк values() без сериализатора: поля чтения уже готовы к ответу."""
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is None:
+            return WorkerListCreateSerializer.represent_rows(queryset)
+        return self.get_paginated_response(WorkerListCreateSerializer.represent_rows(page)).data
+
+    @property
+    def paginator(self) -> BasePagination:
+        if not hasattr(self, '_paginator'):
+            params = self.request.query_params
+            if 'cursor' in params or params.get('pagination') == 'cursor':
+                self._paginator = self.cursor_pagination_class()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
     def get_queryset(self) -> QuerySet[Worker]:
-        try:
-            return WorkerService.get_workers()
-        except Exception as error:
-            raise NotFound({
-                'detail': 'Ошибка получения работников'
-            })
+        if self.request.method in SAFE_METHODS:
+            return WorkerService.get_workers_for_read()
+        return WorkerService.get_workers()
+
+class WorkerExportAPIView(GenericAPIView):
+    """Потоковая выгрузка работников в CSV, NDJSON или XLSX (?format=) с фильтрами списка."""
+    permission_classes = [IsAuthenticatedOrReadOnly]
+    renderer_classes = [CSVRenderer, NDJSONRenderer, XLSXRenderer]
+    filter_backends = [DjangoFilterBackend, WorkerSearchFilter]
+    filterset_fields = ['is_active', 'position']
+    pagination_class = None
+
+    def get_queryset(self) -> QuerySet[Worker]:
+        return WorkerService.get_workers()
+
+    def get(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        # Тело ответа читается уже после middleware: базу (реплику) выбираем сейчас, пока действует маршрутизация.
+        queryset = queryset.using(queryset.db)
+        export_format: str = request.accepted_renderer.format
+        filename = f'workers.{export_format}'
+
+        if export_format == 'xlsx':
+            file_obj = tempfile.TemporaryFile()
+            write_xlsx(queryset, file_obj)
+            file_obj.seek(0)
+            return FileResponse(
+                file_obj, as_attachment=True, filename=filename, content_type=XLSXRenderer.media_type,
+            )
+
+        content = iter_csv(queryset) if export_format == 'csv' else iter_ndjson(queryset)
+        response = StreamingHttpResponse(content, content_type=f'{request.accepted_renderer.media_type}; charset=utf-8')
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
 
 class WorkerRetrieveUpdateDestroyAPIView(RetrieveUpdateDestroyAPIView):
     """Представление для просмотра, корректировки и удаления сотрудников."""
     permission_classes = [IsAuthenticatedOrReadOnly]
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
 
     def get_serializer_class(self) -> Type[BaseSerializer]:
         return WorkerRetrieveSerializer if self.request.method == 'GET' else WorkerUpdateSerializer
 
+    def retrieve(self, request, *args, **kwargs) -> HttpResponseBase:
+        """Карточка работника с ETag/Last-Modified; при совпадении валидаторов - 304 без сериализации."""
+        worker = self.get_object()
+        etag, last_modified = worker_etag(worker), worker_last_modified(worker)
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = Response(WorkerRetrieveSerializer.represent(worker))
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        return response
+
+    def update(self, request, *args, **kwargs) -> HttpResponseBase:
+        """PUT/PATCH; с If-Match изменение применяется, только если ETag не изменился с момента чтения."""
+        with transaction.atomic():
+            worker = self.get_object()
+            if not if_match_passes(request, worker_etag(worker)):
+                return Response(
+                    {'detail': 'Сотрудник был изменён другим запросом, получите актуальную версию.'},
+                    status=status.HTTP_412_PRECONDITION_FAILED,
+                )
+            response = super().update(request, *args, **kwargs)
+        response['ETag'] = worker_etag(worker)
+        response['Last-Modified'] = http_date(worker_last_modified(worker))
+        return response
+
     def get_object(self) -> Worker:
+        if hasattr(self, '_worker'):
+            return self._worker
         pk_raw: Any = self.kwargs.get('pk')
         try:
             pk_int: int = int(pk_raw)
@@ -51,13 +187,94 @@ class WorkerRetrieveUpdateDestroyAPIView(RetrieveUpdateDestroyAPIView):
             raise NotFound({'detail': 'Некорректный идентификатор'})
 
         try:
-            worker: Worker = WorkerService.get_worker(pk_int)
+            worker: Worker = WorkerService.get_worker(
+                pk_int,
+                use_cache=self.request.method in SAFE_METHODS,
+                for_update='HTTP_IF_MATCH' in self.request.META and self.request.method in ('PUT', 'PATCH'),
+            )
         except Worker.DoesNotExist:
             raise NotFound({'detail': f'Сотрудника с id={pk_int} не существует.'})
+        self._worker = worker
         return worker
 
+class WorkerBulkAPIView(GenericAPIView):
+    """Массовое создание (POST) и частичное изменение (PATCH) работников JSON-массивом.
+
+    Валидные элементы записываются одной транзакцией, по каждому элементу возвращается результат:
+    201/200 - все записаны, 207 - часть с ошибками, 400 - не записан ни один.
+    """
+    permission_classes = [IsAuthenticatedOrReadOnly]
+
+    def post(self, request, *args, **kwargs) -> Response:
+        items = self.get_items(request)
+        result = self.write(lambda: WorkerService.bulk_create_workers(items, request.user))
+        return Response(result, status=self.get_status(result, 'created', status.HTTP_201_CREATED))
+
+    def patch(self, request, *args, **kwargs) -> Response:
+        items = self.get_items(request)
+        result = self.write(lambda: WorkerService.bulk_update_workers(items))
+        return Response(result, status=self.get_status(result, 'updated', status.HTTP_200_OK))
+
+    @staticmethod
+    def get_items(request) -> List[Any]:
+        if not isinstance(request.data, list):
+            raise ValidationError({'detail': 'Ожидается JSON-массив работников.'})
+        if len(request.data) > settings.WORKERS_BULK_MAX_ITEMS:
+            raise ValidationError({'detail': f'Не больше {settings.WORKERS_BULK_MAX_ITEMS} работников за запрос.'})
+        return request.data
+
+    @staticmethod
+    def write(run: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        try:
+            return run()
+        except IntegrityError:
+            raise Conflict()
+
+    @staticmethod
+    def get_status(result: Dict[str, Any], written_key: str, success: int) -> int:
+        if not result['errors']:
+            return success
+        return status.HTTP_207_MULTI_STATUS if result[written_key] else status.HTTP_400_BAD_REQUEST
+
+class WorkerBulkDeactivateAPIView(GenericAPIView):
+    """Массовое увольнение работников (is_active=False) по списку id и/или точной должности одним UPDATE."""
+    permission_classes = [IsAuthenticatedOrReadOnly]
+    serializer_class = WorkerBulkDeactivateSerializer
+
+    def post(self, request, *args, **kwargs) -> Response:
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = WorkerService.deactivate_workers(**serializer.validated_data)
+        return Response({'deactivated': len(ids), 'ids': ids})
+
+class WorkerStatsAPIView(GenericAPIView):
+    """Численность работников: всего, по должностям и по месяцам приёма (active/inactive/total).
+
+    Читается из поддерживаемой сводки WorkerStat, поэтому стоимость не зависит от числа работников.
+    """
+    permission_classes = [IsAuthenticatedOrReadOnly]
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+
+    def get(self, request, *args, **kwargs) -> Response:
+        return Response(WorkerService.get_worker_stats())
+
+class WorkerChangesAPIView(GenericAPIView):
+    """Лента изменений работников для синхронизации: ?since=<cursor> отдаёт только то, что изменилось после курсора.
+
+    Создания, изменения (в том числе массовые, импорт и админка) и удаления идут по возрастанию seq
+    журнала WorkerChange; cursor ответа передаётся в since следующего запроса, пока has_more=true.
+    """
+    permission_classes = [IsAuthenticatedOrReadOnly]
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
+    serializer_class = WorkerChangesQuerySerializer
+
+    def get(self, request, *args, **kwargs) -> Response:
+        serializer = self.get_serializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        return Response(WorkerService.get_changes(**serializer.validated_data))
+
 class WorkerImportAPIView(GenericAPIView):
-    """Импорт работников из Excel файла."""
+    """Импорт работников из .xlsx/.csv/.tsv файла: сразу или фоновой задачей (background=true)."""
     permission_classes = [IsAuthenticatedOrReadOnly]
     parser_classes = (MultiPartParser, FormParser)
     serializer_class = ImportFileSerializer
@@ -67,14 +284,26 @@ class WorkerImportAPIView(GenericAPIView):
         serializer.is_valid(raise_exception=True)
 
         file_obj = serializer.validated_data['file']
-        result = WorkerService.import_workers_from_excel(
-            file_obj,
-            request.user if request.user.is_authenticated else None
-        )
-        return Response({
-            'added': result['added'],
-            'errors': result['errors'],
-            'total': result['total'],
-        })
-
-        
+        created_by = request.user if request.user.is_authenticated else None
+        mode = serializer.validated_data['mode']
+        if serializer.validated_data['background']:
+            job = ImportJob.objects.create(file=file_obj, mode=mode, created_by=created_by)
+            submit_import_job(job)
+            job.refresh_from_db()
+            data = ImportJobSerializer(job).data
+            data['status_url'] = request.build_absolute_uri(reverse('worker_import_job', args=[job.pk]))
+            return Response(data, status=status.HTTP_202_ACCEPTED)
+
+        result = WorkerService.import_workers(file_obj, created_by, mode=mode)
+        return Response(result)
+
+class WorkerImportJobAPIView(RetrieveAPIView):
+    """Статус и прогресс фоновой задачи импорта."""
+    permission_classes = [IsAuthenticatedOrReadOnly]
+    serializer_class = ImportJobSerializer
+    queryset = ImportJob.objects.all()
+    lookup_url_kwarg = 'job_id'
+
+    def get_object(self) -> ImportJob:
+        """Задача, потерянная вместе с процессом (pending или running дольше таймаута), отдаётся как failed."""
+        return fail_stale_import_job(super().get_object())